@@ -15,7 +15,8 @@ db = SQLAlchemy()
 
 def create_app():
     app = Flask(__name__)
-    CORS(app)
+    # Expose the keyset pagination cursor and ETag to the frontend
+    CORS(app, expose_headers=['X-Next-After-Id', 'ETag'])
     
     # Load environment variables
     load_dotenv()
@@ -42,18 +43,25 @@ def create_app():
                 # Import and run the data loading script
                 
                 from backend.scripts.load_auckland_electricity import load_auckland_electricity
+                from .services.workbook_session import WorkbookSession
                 excel_filename = os.getenv('DATA_FILE', '2024 campus meter readings.xlsx')
                 print(f"Loading data from file: {excel_filename}")
-                records_loaded = load_auckland_electricity(excel_filename)
+
+                # Share one parsed workbook between the three Auckland loaders
+                excel_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', excel_filename)
+                workbook = WorkbookSession(excel_path)
+
+                records_loaded = load_auckland_electricity(excel_filename, workbook)
                 print(f"Successfully loaded {records_loaded} records for auckland_electricity")
                 
                 from backend.scripts.load_auckland_calculated_water import load_auckland_calculated_water
-                records_loaded = load_auckland_calculated_water(excel_filename)
+                records_loaded = load_auckland_calculated_water(excel_filename, workbook)
                 print(f"Successfully loaded {records_loaded} records for auckland_calculated_water")
 
                 from backend.scripts.load_auckland_water import load_auckland_water
-                records_loaded = load_auckland_water(excel_filename)
+                records_loaded = load_auckland_water(excel_filename, workbook)
                 print(f"Successfully loaded {records_loaded} records for auckland_water")
+                workbook.close()
                 
                 
                 
@@ -67,7 +75,7 @@ def create_app():
     
      
     # Import and register blueprints
-    from .routes import stream_elec_routes, cfi_routes, mthw_routes, energy_total_routes, auckland_routes, steam_mthw_routes, janitza_routes, lthw_routes, gas_routes
+    from .routes import stream_elec_routes, cfi_routes, mthw_routes, energy_total_routes, auckland_routes, steam_mthw_routes, janitza_routes, lthw_routes, gas_routes, batch_routes, interval_routes, rollup_routes
     app.register_blueprint(auckland_routes.bp)
     app.register_blueprint(steam_mthw_routes.bp)
     app.register_blueprint(janitza_routes.bp)
@@ -77,6 +85,13 @@ def create_app():
     app.register_blueprint(cfi_routes.bp) 
     app.register_blueprint(mthw_routes.bp) 
     app.register_blueprint(energy_total_routes.bp)
+    app.register_blueprint(batch_routes.bp)
+    app.register_blueprint(interval_routes.bp)
+    app.register_blueprint(rollup_routes.bp)
+
+    # ETags and cached responses stay valid until a loader bumps dbo.load_versions
+    from .routes.response_cache import init_http_caching
+    init_http_caching(app)
 
     # Create database tables
     with app.app_context():
@@ -132,7 +147,10 @@ def create_app():
                 '/api/mthw/meter',
                 '/api/muthw/consumption',
                 '/api/energy-total/dashboard',
-                '/api/energy-total/analytics'
+                '/api/energy-total/analytics',
+                '/api/batch',
+                '/api/intervals',
+                '/api/rollups'
             ]
         }
     
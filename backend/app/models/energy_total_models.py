@@ -5,11 +5,16 @@ from .. import db
 
 class EnergyTotalDashboard(db.Model):
     __tablename__ = 'energy_total_dashboard'
-    __table_args__ = {'schema': 'dbo'}
+    __table_args__ = (
+        db.Index('ix_energy_total_dashboard_year_period', 'year', 'period'),
+        db.Index('ix_energy_total_dashboard_period', 'period'),
+        {'schema': 'dbo'}
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     month = db.Column(db.String(3), nullable=False)  # Three letter month abbreviation
     year = db.Column(db.Integer, nullable=False)
+    period = db.Column(db.Date)  # First day of the month, for chronological ordering
     total_stream_dn_electricity_kwh = db.Column(db.Float)
     mthw_kwh = db.Column(db.Float)
     steam_kwh = db.Column(db.Float)
@@ -26,6 +31,7 @@ class EnergyTotalDashboard(db.Model):
             'id': self.id,
             'month': self.month,
             'year': self.year,
+            'period': self.period.isoformat() if self.period else None,
             'total_stream_dn_electricity_kwh': self.total_stream_dn_electricity_kwh,
             'mthw_kwh': self.mthw_kwh,
             'steam_kwh': self.steam_kwh,
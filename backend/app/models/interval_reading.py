@@ -0,0 +1,35 @@
+# backend/app/models/interval_reading.py
+
+from .. import db
+
+class IntervalReading(db.Model):
+    """
+    High-frequency (5/15/30 minute) readings. On PostgreSQL the table is
+    range-partitioned by month on reading_time; the partitions are created
+    by the interval loader as data arrives.
+    """
+    __tablename__ = 'interval_reading'
+    __table_args__ = {
+        'schema': 'dbo',
+        'postgresql_partition_by': 'RANGE (reading_time)'
+    }
+
+    # The partition key has to be part of the primary key
+    meter_id = db.Column(db.String(500), primary_key=True)
+    reading_time = db.Column(db.DateTime, primary_key=True)
+    value = db.Column(db.Float)
+    unit = db.Column(db.String(20), nullable=False)
+    utility = db.Column(db.String(50), nullable=False)
+    source = db.Column(db.String(100), nullable=False)
+    interval_minutes = db.Column(db.Integer, nullable=False)
+
+    def to_dict(self):
+        return {
+            'meter_id': self.meter_id,
+            'reading_time': self.reading_time.isoformat() if self.reading_time else None,
+            'value': self.value,
+            'unit': self.unit,
+            'utility': self.utility,
+            'source': self.source,
+            'interval_minutes': self.interval_minutes
+        }
@@ -0,0 +1,62 @@
+# backend/app/models/load_manifest.py
+
+from .. import db
+from datetime import datetime
+
+class LoadManifest(db.Model):
+    """Content hashes of the last load of each table, used by incremental loads"""
+    __tablename__ = 'load_manifest'
+    __table_args__ = {'schema': 'dbo'}
+
+    table_name = db.Column(db.String(100), primary_key=True)
+    row_count = db.Column(db.Integer, nullable=False)
+    # Hash of every non-month column, i.e. the identity and order of the rows
+    row_hash = db.Column(db.String(64), nullable=False)
+    # JSON object of month column name -> hash of that column's values
+    column_hashes = db.Column(db.Text, nullable=False)
+    loaded_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'table_name': self.table_name,
+            'row_count': self.row_count,
+            'row_hash': self.row_hash,
+            'column_hashes': self.column_hashes,
+            'loaded_at': self.loaded_at.isoformat() if self.loaded_at else None
+        }
+
+
+class LoadVersion(db.Model):
+    """Counter bumped every time a loader replaces or updates a table"""
+    __tablename__ = 'load_versions'
+    __table_args__ = {'schema': 'dbo'}
+
+    table_name = db.Column(db.String(100), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'table_name': self.table_name,
+            'version': self.version,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+
+class WeatherFileManifest(db.Model):
+    """Content hash of every monthly weather file already processed"""
+    __tablename__ = 'weather_file_manifest'
+    __table_args__ = {'schema': 'dbo'}
+
+    file_name = db.Column(db.String(100), primary_key=True)  # e.g. weather-2024-06.csv
+    file_hash = db.Column(db.String(64), nullable=False)
+    row_count = db.Column(db.Integer, nullable=False)
+    loaded_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'file_name': self.file_name,
+            'file_hash': self.file_hash,
+            'row_count': self.row_count,
+            'loaded_at': self.loaded_at.isoformat() if self.loaded_at else None
+        }
@@ -0,0 +1,41 @@
+# backend/app/models/meter_reading.py
+
+from .. import db
+from datetime import datetime
+
+class MeterReading(db.Model):
+    """One monthly value per meter, the long form of every wide month-column table"""
+    __tablename__ = 'meter_reading'
+    __table_args__ = (
+        # Time-range reads for one meter, and per-utility aggregations over time
+        db.Index('ix_meter_reading_meter_period', 'meter_id', 'period_start'),
+        db.Index('ix_meter_reading_utility_period', 'utility', 'period_start'),
+        # Loaders replace a source table's rows by (source, month)
+        db.Index('ix_meter_reading_source_period', 'source', 'period_start'),
+        # Compatibility views pivot a source's readings back per source row
+        db.Index('ix_meter_reading_source_row', 'source', 'source_row'),
+        {'schema': 'dbo'}
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    meter_id = db.Column(db.String(500), nullable=False)
+    utility = db.Column(db.String(50), nullable=False)
+    period_start = db.Column(db.Date, nullable=False)  # First day of the month
+    value = db.Column(db.Float, nullable=False)
+    unit = db.Column(db.String(20), nullable=False)
+    source = db.Column(db.String(100), nullable=False)  # Wide table the value came from
+    source_row = db.Column(db.Integer)  # id of the row in the wide table; meter ids repeat
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'meter_id': self.meter_id,
+            'utility': self.utility,
+            'period_start': self.period_start.isoformat() if self.period_start else None,
+            'value': self.value,
+            'unit': self.unit,
+            'source': self.source,
+            'source_row': self.source_row,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
@@ -0,0 +1,91 @@
+# backend/app/models/rollup_models.py
+
+from datetime import datetime
+from .. import db
+
+class EnergyYearlyRollup(db.Model):
+    """Yearly totals of energy_total_dashboard, rebuilt after each ingest"""
+    __tablename__ = 'energy_yearly_rollup'
+    __table_args__ = {'schema': 'dbo'}
+
+    year = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    total_electricity = db.Column(db.Float)
+    total_mthw = db.Column(db.Float)
+    total_steam = db.Column(db.Float)
+    total_lpg = db.Column(db.Float)
+    total_woodchip = db.Column(db.Float)
+    total_solar = db.Column(db.Float)
+    total_energy = db.Column(db.Float)
+    months = db.Column(db.Integer)
+    refreshed_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'year': self.year,
+            'total_electricity': self.total_electricity,
+            'total_mthw': self.total_mthw,
+            'total_steam': self.total_steam,
+            'total_lpg': self.total_lpg,
+            'total_woodchip': self.total_woodchip,
+            'total_solar': self.total_solar,
+            'total_energy': self.total_energy,
+            'months': self.months,
+            'refreshed_at': self.refreshed_at.isoformat() if self.refreshed_at else None
+        }
+
+
+class SteamMTHWYearlyRollup(db.Model):
+    """Yearly totals of steam_mthw_readings, rebuilt after each ingest"""
+    __tablename__ = 'steam_mthw_yearly_rollup'
+    __table_args__ = {'schema': 'dbo'}
+
+    year = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    total_mthw_consumption = db.Column(db.Float)
+    total_steam_consumption = db.Column(db.Float)
+    med_school_consumption = db.Column(db.Float)
+    cumberland_consumption = db.Column(db.Float)
+    months = db.Column(db.Integer)
+    refreshed_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'year': self.year,
+            'total_mthw_consumption': self.total_mthw_consumption,
+            'total_steam_consumption': self.total_steam_consumption,
+            'med_school_consumption': self.med_school_consumption,
+            'cumberland_consumption': self.cumberland_consumption,
+            'months': self.months,
+            'refreshed_at': self.refreshed_at.isoformat() if self.refreshed_at else None
+        }
+
+
+class ConsumptionRollup(db.Model):
+    """Consumption per utility and building at day, month and year grain"""
+    __tablename__ = 'consumption_rollup'
+    __table_args__ = (
+        db.Index('ix_consumption_rollup_grain_utility_period', 'grain', 'utility', 'period_start'),
+        {'schema': 'dbo'}
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    grain = db.Column(db.String(5), nullable=False)  # day, month or year
+    period_start = db.Column(db.Date, nullable=False)
+    utility = db.Column(db.String(50), nullable=False)
+    building = db.Column(db.String(10))  # Building code such as D201, NULL if unknown
+    unit = db.Column(db.String(20), nullable=False)
+    value = db.Column(db.Float)
+    meters = db.Column(db.Integer)  # Meters contributing to the value
+    refreshed_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'grain': self.grain,
+            'period_start': self.period_start.isoformat() if self.period_start else None,
+            'utility': self.utility,
+            'building': self.building,
+            'unit': self.unit,
+            'value': self.value,
+            'meters': self.meters,
+            'refreshed_at': self.refreshed_at.isoformat() if self.refreshed_at else None
+        }
@@ -6,11 +6,16 @@ from datetime import datetime
 class SteamMTHWReading(db.Model):
     """Model for Steam and MTHW readings and consumption data"""
     __tablename__ = 'steam_mthw_readings'
-    __table_args__ = {'schema': 'dbo'}
+    __table_args__ = (
+        db.Index('ix_steam_mthw_readings_year_period', 'year', 'period'),
+        db.Index('ix_steam_mthw_readings_period', 'period'),
+        {'schema': 'dbo'}
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     month = db.Column(db.String(3), nullable=False)  # Three letter month abbreviation
     year = db.Column(db.Integer, nullable=False)
+    period = db.Column(db.Date)  # First day of the month, for chronological ordering
     
     # MTHW readings
     mthw_consumption_kwh = db.Column(db.Float)
@@ -54,6 +59,7 @@ class SteamMTHWReading(db.Model):
             'id': self.id,
             'month': self.month,
             'year': self.year,
+            'period': self.period.isoformat() if self.period else None,
             'mthw_consumption_kwh': self.mthw_consumption_kwh,
             'castle_192_reading_kwh': self.castle_192_reading_kwh,
             'castle_192_consumption_kwh': self.castle_192_consumption_kwh,
@@ -0,0 +1,128 @@
+# backend/app/routes/batch_routes.py
+
+from flask import Blueprint, jsonify, request
+from ..models.auckland_electricity import AucklandElectricityCalculatedConsumption
+from ..models.auckland_water import AucklandWaterCalculatedConsumption, AucklandWaterConsumption
+from ..models.cfi_models import CenterForInnovation, CfiRoomTypes
+from ..models.energy_total_models import EnergyTotalDashboard
+from ..models.gas_models import GasAutomatedMeter, GasManualMeter, GasConsumption
+from ..models.janitza_models import (
+    JanitzaMedData, JanitzaFreezerRoom, JanitzaUOD4F6, JanitzaUOF8X,
+    JanitzaManualMeters, JanitzaCalculatedConsumption
+)
+from ..models.lthw_models import LTHWAutomatedMeter, LTHWManualMeter, LTHWConsumption
+from ..models.mthw_models import MTHWMeterReading, MTHWConsumptionReading
+from ..models.steam_mthw import SteamMTHWReading
+from ..models.stream_elec_models import (
+    RingMainsStream, LibrariesStream, CollegesStream, ScienceStream, HealthScienceStream,
+    HumanitiesStream, ObsPsychologyStream, TotalStreamDnElectricity, ItsServersStream,
+    SchoolOfMedicineChChStream, CommerceStream
+)
+from .list_query import parse_list_args, apply_list_args, to_records, QueryParamError
+from .serialization import json_response
+from .response_cache import cache_until_next_load
+import logging
+
+bp = Blueprint('batch', __name__, url_prefix='/api/batch')
+logger = logging.getLogger(__name__)
+
+# Dataset name (the list route's path under /api/) -> model
+DATASETS = {
+    'auckland/electricity': AucklandElectricityCalculatedConsumption,
+    'auckland/water-calculated': AucklandWaterCalculatedConsumption,
+    'auckland/water': AucklandWaterConsumption,
+    'cfi/meter': CenterForInnovation,
+    'cfi/rooms': CfiRoomTypes,
+    'energy-total/dashboard': EnergyTotalDashboard,
+    'gas/automated': GasAutomatedMeter,
+    'gas/manual': GasManualMeter,
+    'gas/consumption': GasConsumption,
+    'janitza/med': JanitzaMedData,
+    'janitza/freezer': JanitzaFreezerRoom,
+    'janitza/uod4f6': JanitzaUOD4F6,
+    'janitza/uof8x': JanitzaUOF8X,
+    'janitza/manual': JanitzaManualMeters,
+    'janitza/calculated': JanitzaCalculatedConsumption,
+    'lthw/automated': LTHWAutomatedMeter,
+    'lthw/manual': LTHWManualMeter,
+    'lthw/consumption': LTHWConsumption,
+    'mthw/meter': MTHWMeterReading,
+    'mthw/consumption': MTHWConsumptionReading,
+    'steam-mthw/readings': SteamMTHWReading,
+    'stream-elec/ring-mains': RingMainsStream,
+    'stream-elec/libraries': LibrariesStream,
+    'stream-elec/colleges': CollegesStream,
+    'stream-elec/science': ScienceStream,
+    'stream-elec/health-science': HealthScienceStream,
+    'stream-elec/humanities': HumanitiesStream,
+    'stream-elec/obs-psychology': ObsPsychologyStream,
+    'stream-elec/total-stream': TotalStreamDnElectricity,
+    'stream-elec/its-servers': ItsServersStream,
+    'stream-elec/school-of-medicine': SchoolOfMedicineChChStream,
+    'stream-elec/commerce': CommerceStream
+}
+
+
+def _requested_datasets():
+    """[(name, query params)] from ?datasets= or a POSTed JSON body"""
+    if request.method == 'GET':
+        names = [name.strip() for name in request.args.get('datasets', '').split(',') if name.strip()]
+        # Every other query parameter applies to all datasets
+        return [(name, request.args) for name in names]
+
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict) or not isinstance(body.get('datasets'), list):
+        raise QueryParamError("Body must be a JSON object with a 'datasets' list")
+    requested = []
+    for entry in body['datasets']:
+        if isinstance(entry, str):
+            requested.append((entry, {}))
+        elif isinstance(entry, dict) and isinstance(entry.get('name'), str):
+            params = {key: str(value) for key, value in (entry.get('params') or {}).items()}
+            requested.append((entry['name'], params))
+        else:
+            raise QueryParamError("Each dataset must be a name or an object with 'name' and 'params'")
+    return requested
+
+
+@bp.route('', methods=['GET', 'POST'])
+@cache_until_next_load
+def get_batch():
+    """
+    Several list datasets in one response, e.g.
+    GET /api/batch?datasets=stream-elec/total-stream,steam-mthw/readings&year=2024
+    or POST {"datasets": [{"name": "gas/consumption", "params": {"months": "2024-01..2024-06"}}]}.
+    The queries share the request's database connection and transaction.
+    """
+    try:
+        requested = _requested_datasets()
+        if not requested:
+            raise QueryParamError("'datasets' must name at least one dataset")
+        unknown = [name for name, _ in requested if name not in DATASETS]
+        if unknown:
+            raise QueryParamError(f"Unknown dataset(s): {', '.join(unknown)}")
+
+        # Validate every parameter before running any query: building a
+        # query checks fields, period filters and text filters against its model
+        plans = []
+        for name, args in requested:
+            params = parse_list_args(args)
+            if params['format'] != 'json' or params['stream']:
+                raise QueryParamError("'format' and 'stream' are not supported in a batch")
+            model = DATASETS[name]
+            plans.append((name, params, apply_list_args(model, model.query, params)))
+
+        data = {}
+        next_after_id = {}
+        for name, params, query in plans:
+            records = to_records(query.all())
+            data[name] = records
+            if params['limit'] is not None and len(records) == params['limit'] and records:
+                next_after_id[name] = records[-1]['id']
+
+        return json_response({'data': data, 'next_after_id': next_after_id})
+    except QueryParamError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error fetching batch data: {str(e)}")
+        return jsonify({'error': str(e)}), 500
@@ -1,25 +1,31 @@
 from flask import Blueprint, jsonify, current_app
 from ..models.cfi_models import CenterForInnovation, CfiRoomTypes
 from .. import db
+from .list_query import list_query, list_response, QueryParamError
+from .response_cache import cache_until_next_load
 import logging
 
 bp = Blueprint('cfi', __name__, url_prefix='/api/cfi')
 logger = logging.getLogger(__name__)
 
 @bp.route('/meter', methods=['GET'])
+@cache_until_next_load
 def get_meter_data():
     """Get Center for Innovation meter data"""
     try:
-        data = CenterForInnovation.query.all()
-        return jsonify([record.to_dict() for record in data])
+        return list_response(list_query(CenterForInnovation))
+    except QueryParamError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': 'Failed to fetch CFI meter data'}), 500
 
 @bp.route('/rooms', methods=['GET'])
+@cache_until_next_load
 def get_room_data():
     """Get CFI room types data"""
     try:
-        data = CfiRoomTypes.query.all()
-        return jsonify([record.to_dict() for record in data])
+        return list_response(list_query(CfiRoomTypes))
+    except QueryParamError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': 'Failed to fetch CFI room data'}), 500
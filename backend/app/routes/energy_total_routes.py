@@ -2,7 +2,11 @@
 
 from flask import Blueprint, jsonify
 from ..models.energy_total_models import EnergyTotalDashboard
+from ..models.rollup_models import EnergyYearlyRollup
+from ..services.rollups import latest_yearly_rollup
 from .. import db
+from .list_query import list_query, list_response, QueryParamError
+from .response_cache import cache_until_next_load
 import logging
 from sqlalchemy import desc
 
@@ -12,15 +16,14 @@ logger = logging.getLogger(__name__)
 # backend/app/routes/energy_total_routes.py
 
 @bp.route('/dashboard', methods=['GET'])
+@cache_until_next_load
 def get_dashboard_data():
     """Get all energy total dashboard data"""
     try:
         logger.info("Starting to fetch dashboard data")
-        data = EnergyTotalDashboard.query.all()
-        result = [record.to_dict() for record in data]
-        logger.info(f"Successfully fetched {len(result)} records")
-        logger.debug(f"Data: {result}")
-        return jsonify(result)
+        return list_response(list_query(EnergyTotalDashboard))
+    except QueryParamError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error fetching energy dashboard data: {str(e)}")
         logger.error(f"Error type: {type(e)}")
@@ -28,24 +31,27 @@ def get_dashboard_data():
 
 
 @bp.route('/latest', methods=['GET'])
+@cache_until_next_load
 def get_latest_readings():
     """Get the most recent energy readings"""
     try:
-        latest = EnergyTotalDashboard.query.order_by(
-            EnergyTotalDashboard.year.desc(),
-            EnergyTotalDashboard.month.desc()
-        ).first()
+        # Backward scan of the period index, stopping at the first row
+        latest = EnergyTotalDashboard.query.filter(
+            EnergyTotalDashboard.period.isnot(None)
+        ).order_by(EnergyTotalDashboard.period.desc()).first()
         return jsonify(latest.to_dict() if latest else {})
     except Exception as e:
         logger.error(f"Error fetching latest energy data: {str(e)}")
         return jsonify({'error': 'Failed to fetch latest energy data'}), 500
 
 @bp.route('/year/<int:year>', methods=['GET'])
+@cache_until_next_load
 def get_readings_by_year(year):
     """Get energy readings for a specific year"""
     try:
+        # Range of the (year, period) index, already in calendar order
         data = EnergyTotalDashboard.query.filter_by(year=year).order_by(
-            EnergyTotalDashboard.month.asc()
+            EnergyTotalDashboard.period.asc()
         ).all()
         return jsonify([reading.to_dict() for reading in data])
     except Exception as e:
@@ -53,46 +59,40 @@ def get_readings_by_year(year):
         return jsonify({'error': f'Failed to fetch energy data for year {year}'}), 500
 
 @bp.route('/summary', methods=['GET'])
+@cache_until_next_load
 def get_summary():
     """Get summary statistics for total energy consumption"""
     try:
-        latest_year = db.session.query(db.func.max(EnergyTotalDashboard.year)).scalar()
-        
-        summary = {
-            'total_electricity': db.session.query(
-                db.func.sum(EnergyTotalDashboard.total_stream_dn_electricity_kwh)
-            ).filter_by(year=latest_year).scalar(),
-            'total_mthw': db.session.query(
-                db.func.sum(EnergyTotalDashboard.mthw_kwh)
-            ).filter_by(year=latest_year).scalar(),
-            'total_steam': db.session.query(
-                db.func.sum(EnergyTotalDashboard.steam_kwh)
-            ).filter_by(year=latest_year).scalar(),
-            'total_lpg': db.session.query(
-                db.func.sum(EnergyTotalDashboard.lpg_kwh)
-            ).filter_by(year=latest_year).scalar(),
-            'total_woodchip': db.session.query(
-                db.func.sum(EnergyTotalDashboard.woodchip_pellet_kwh)
-            ).filter_by(year=latest_year).scalar(),
-            'total_solar': db.session.query(
-                db.func.sum(EnergyTotalDashboard.solar_kwh)
-            ).filter_by(year=latest_year).scalar(),
-            'total_energy': db.session.query(
-                db.func.sum(EnergyTotalDashboard.total_kwh)
-            ).filter_by(year=latest_year).scalar(),
-            'year': latest_year
-        }
-        return jsonify(summary)
+        # One row of the yearly rollup; the base table is only summed when
+        # the rollups have not been built yet
+        summary = latest_yearly_rollup(db.session, EnergyYearlyRollup)
+        if summary is not None:
+            return jsonify(summary)
+
+        latest_year = db.session.query(db.func.max(EnergyTotalDashboard.year)).scalar_subquery()
+        row = db.session.query(
+            db.func.sum(EnergyTotalDashboard.total_stream_dn_electricity_kwh).label('total_electricity'),
+            db.func.sum(EnergyTotalDashboard.mthw_kwh).label('total_mthw'),
+            db.func.sum(EnergyTotalDashboard.steam_kwh).label('total_steam'),
+            db.func.sum(EnergyTotalDashboard.lpg_kwh).label('total_lpg'),
+            db.func.sum(EnergyTotalDashboard.woodchip_pellet_kwh).label('total_woodchip'),
+            db.func.sum(EnergyTotalDashboard.solar_kwh).label('total_solar'),
+            db.func.sum(EnergyTotalDashboard.total_kwh).label('total_energy'),
+            db.func.max(EnergyTotalDashboard.year).label('year')
+        ).filter(EnergyTotalDashboard.year == latest_year).one()
+        return jsonify(dict(row._mapping))
     except Exception as e:
         logger.error(f"Error fetching energy summary: {str(e)}")
         return jsonify({'error': 'Failed to fetch energy summary'}), 500
 
 
 @bp.route('/analytics', methods=['GET'])
+@cache_until_next_load
 def get_analytics_data():
     try:
-        data = EnergyTotalDashboard.query.all()
-        return jsonify([record.to_dict() for record in data])
+        return list_response(list_query(EnergyTotalDashboard))
+    except QueryParamError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error fetching analytics data: {str(e)}")
         return jsonify({'error': 'Failed to fetch analytics data'}), 500
\ No newline at end of file
@@ -0,0 +1,175 @@
+# backend/app/routes/export.py
+
+from flask import Response, stream_with_context
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, Numeric
+from datetime import date, datetime
+import csv
+import io
+import math
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .. import db
+from .serialization import dumps, dumps_lines
+
+# Rows fetched from the database cursor per streamed chunk
+EXPORT_BATCH_ROWS = 5000
+
+# ?format= value -> response media type
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+    'arrow': 'application/vnd.apache.arrow.stream',
+    'parquet': 'application/vnd.apache.parquet'
+}
+
+EXTENSIONS = {'ndjson': 'ndjson', 'csv': 'csv', 'arrow': 'arrows', 'parquet': 'parquet'}
+
+
+class _StreamSink(io.RawIOBase):
+    """Write-only file that hands written bytes back in chunks.
+
+    pyarrow writers need tell() to report the total bytes written, so the
+    position is tracked here rather than by the buffer that gets drained.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _arrow_type(column):
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, (Float, Numeric)):
+        return pa.float64()
+    if isinstance(column.type, DateTime):
+        return pa.timestamp('us')
+    if isinstance(column.type, Date):
+        return pa.date32()
+    if isinstance(column.type, Boolean):
+        return pa.bool_()
+    return pa.string()
+
+
+def arrow_schema(columns) -> pa.Schema:
+    """Arrow schema of the selected columns, typed from the model"""
+    return pa.schema([pa.field(column.name, _arrow_type(column)) for column in columns])
+
+
+def _partitions(query):
+    """Lists of row tuples read from a server-side cursor"""
+    result = db.session.execute(
+        query.statement, execution_options={'yield_per': EXPORT_BATCH_ROWS}
+    )
+    yield from result.partitions()
+
+
+def _record_batch(rows, schema: pa.Schema) -> pa.RecordBatch:
+    values = list(zip(*rows))
+    # from_pandas=True stores NaN readings as nulls
+    return pa.record_batch(
+        [pa.array(list(col), type=field.type, from_pandas=True) for col, field in zip(values, schema)],
+        schema=schema
+    )
+
+
+def _arrow_chunks(query, schema: pa.Schema):
+    sink = _StreamSink()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for rows in _partitions(query):
+            writer.write_batch(_record_batch(rows, schema))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def _parquet_chunks(query, schema: pa.Schema):
+    sink = _StreamSink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        # One row group per batch, so each is sent as soon as it is written
+        for rows in _partitions(query):
+            writer.write_batch(_record_batch(rows, schema))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def _records(rows, schema: pa.Schema) -> list:
+    keys = schema.names
+    return [dict(zip(keys, row)) for row in rows]
+
+
+def _ndjson_chunks(query, schema: pa.Schema):
+    for rows in _partitions(query):
+        yield dumps_lines(_records(rows, schema))
+
+
+def _json_array_chunks(query, schema: pa.Schema):
+    """A JSON array written one batch of rows at a time"""
+    separator = b'['
+    for rows in _partitions(query):
+        # dumps() gives "[...]"; the batches are spliced into one array
+        yield separator + dumps(_records(rows, schema))[1:-1]
+        separator = b','
+    yield b'[]' if separator == b'[' else b']'
+
+
+def _csv_value(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ''
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _csv_chunks(query, schema: pa.Schema):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(schema.names)
+    for rows in _partitions(query):
+        writer.writerows([_csv_value(value) for value in row] for row in rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def stream_json_response(query, columns) -> Response:
+    """A JSON array streamed in chunks, the same body list_response builds in memory"""
+    return Response(
+        stream_with_context(_json_array_chunks(query, arrow_schema(columns))),
+        mimetype='application/json'
+    )
+
+
+def export_response(query, columns, export_format: str, name: str) -> Response:
+    """Stream the query's rows as NDJSON, CSV, an Arrow IPC stream or Parquet"""
+    schema = arrow_schema(columns)
+    chunks = {
+        'ndjson': _ndjson_chunks, 'csv': _csv_chunks,
+        'arrow': _arrow_chunks, 'parquet': _parquet_chunks
+    }[export_format]
+    response = Response(
+        stream_with_context(chunks(query, schema)),
+        mimetype=EXPORT_FORMATS[export_format]
+    )
+    response.headers['Content-Disposition'] = (
+        f'attachment; filename="{name}.{EXTENSIONS[export_format]}"'
+    )
+    return response
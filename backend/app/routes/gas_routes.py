@@ -4,37 +4,45 @@ from flask import Blueprint, jsonify
 from ..models.gas_models import GasAutomatedMeter, GasManualMeter, GasConsumption
 from ..services.gas_analysis_service import GasAnalysisService
 from .. import db
+from .list_query import list_query, list_response, QueryParamError
+from .response_cache import cache_until_next_load
 import logging
 
 bp = Blueprint('gas', __name__, url_prefix='/api/gas')
 logger = logging.getLogger(__name__)
 
 @bp.route('/automated', methods=['GET'])
+@cache_until_next_load
 def get_automated_data():
     """Get Gas automated meter data"""
     try:
-        data = GasAutomatedMeter.query.all()
-        return jsonify([record.to_dict() for record in data])
+        return list_response(list_query(GasAutomatedMeter))
+    except QueryParamError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error fetching Gas automated data: {str(e)}")
         return jsonify({'error': 'Failed to fetch Gas automated data'}), 500
 
 @bp.route('/manual', methods=['GET'])
+@cache_until_next_load
 def get_manual_data():
     """Get Gas manual meter data"""
     try:
-        data = GasManualMeter.query.all()
-        return jsonify([record.to_dict() for record in data])
+        return list_response(list_query(GasManualMeter))
+    except QueryParamError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error fetching Gas manual data: {str(e)}")
         return jsonify({'error': 'Failed to fetch Gas manual data'}), 500
 
 @bp.route('/consumption', methods=['GET'])
+@cache_until_next_load
 def get_consumption_data():
     """Get Gas consumption data"""
     try:
-        data = GasConsumption.query.all()
-        return jsonify([record.to_dict() for record in data])
+        return list_response(list_query(GasConsumption))
+    except QueryParamError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error fetching Gas consumption data: {str(e)}")
         return jsonify({'error': 'Failed to fetch Gas consumption data'}), 500
@@ -0,0 +1,49 @@
+# backend/app/routes/interval_routes.py
+
+from flask import Blueprint, jsonify, request
+from datetime import datetime, timedelta
+from .. import db
+from ..services.interval_readings import interval_window
+from .list_query import QueryParamError
+from .serialization import json_response
+from .response_cache import cache_until_next_load
+import logging
+
+bp = Blueprint('intervals', __name__, url_prefix='/api/intervals')
+logger = logging.getLogger(__name__)
+
+# Widest window one request may read, so every query stays within a few partitions
+MAX_WINDOW = timedelta(days=92)
+
+
+def _datetime_arg(name: str) -> datetime:
+    value = request.args.get(name)
+    if not value:
+        raise QueryParamError(f"'{name}' is required")
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise QueryParamError(f"'{name}' must be an ISO date or datetime")
+
+
+@bp.route('', methods=['GET'])
+@cache_until_next_load
+def get_intervals():
+    """Interval readings of one meter, e.g. ?meter=weather_station:air_temperature&start=2024-06-01&end=2024-06-08"""
+    try:
+        meter_id = request.args.get('meter')
+        if not meter_id:
+            raise QueryParamError("'meter' is required")
+        start = _datetime_arg('start')
+        end = _datetime_arg('end')
+        if end <= start:
+            raise QueryParamError("'end' must be after 'start'")
+        if end - start > MAX_WINDOW:
+            raise QueryParamError(f"The window may span at most {MAX_WINDOW.days} days")
+
+        return json_response(interval_window(db.session.connection(), meter_id, start, end))
+    except QueryParamError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error fetching interval readings: {str(e)}")
+        return jsonify({'error': str(e)}), 500
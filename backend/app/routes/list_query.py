@@ -0,0 +1,265 @@
+# backend/app/routes/list_query.py
+
+from flask import request, g
+from datetime import date
+from sqlalchemy import case, func, or_
+from .serialization import json_response
+from .export import EXPORT_FORMATS, export_response, stream_json_response
+import re
+
+# Hard cap on a single page so one request can never pull a whole table
+MAX_LIMIT = 1000
+
+MONTH_NUMBERS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+# Identifier columns searched by ?meter= and ?location=, whichever a table has
+METER_COLUMNS = (
+    'object_name', 'object_description', 'meter_description', 'meter_number',
+    'identifier', 'icp', 'reading_description'
+)
+LOCATION_COLUMNS = ('meter_location', 'location', 'building_code', 'room_number')
+
+# (year column, month column) pairs of tables holding one row per month
+PERIOD_COLUMNS = (('year', 'month'), ('meter_reading_year', 'meter_reading_month'))
+
+PERIOD_PATTERN = re.compile(r'^(\d{4})-(\d{2})$')
+
+# Month columns of the wide meter tables, e.g. Jan_2024
+MONTH_COLUMN = re.compile(r'^([A-Z][a-z]{2})_(\d{4})$')
+
+
+class QueryParamError(ValueError):
+    """Invalid list query parameter, reported to the client as a 400"""
+
+
+def _int_arg(args, name: str, minimum: int):
+    value = args.get(name)
+    if value is None or value == '':
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        raise QueryParamError(f"'{name}' must be an integer")
+    if number < minimum:
+        raise QueryParamError(f"'{name}' must be at least {minimum}")
+    return number
+
+
+def _period_arg(args, name: str):
+    """Parse YYYY-MM into a sortable yyyymm integer"""
+    value = args.get(name)
+    if not value:
+        return None
+    return _period_value(value, name)
+
+
+def _period_value(value: str, name: str) -> int:
+    match = PERIOD_PATTERN.match(value)
+    if not match or not 1 <= int(match.group(2)) <= 12:
+        raise QueryParamError(f"'{name}' must be a month in YYYY-MM format")
+    return int(match.group(1)) * 100 + int(match.group(2))
+
+
+def _period_date(period):
+    """First day of a yyyymm month, None stays None"""
+    return date(period // 100, period % 100, 1) if period is not None else None
+
+
+def _months_arg(args):
+    """Parse months=2024-01..2024-12 (or a single 2024-03) into a yyyymm range"""
+    value = args.get('months')
+    if not value:
+        return None
+    start, _, end = value.partition('..')
+    return (_period_value(start, 'months'), _period_value(end or start, 'months'))
+
+
+def _fields_arg(args):
+    value = args.get('fields')
+    if not value:
+        return None
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def _format_arg(args, accept) -> str:
+    """?format= if given, otherwise the best match for the Accept header"""
+    value = args.get('format')
+    if value:
+        if value != 'json' and value not in EXPORT_FORMATS:
+            raise QueryParamError(f"'format' must be one of: json, {', '.join(EXPORT_FORMATS)}")
+        return value
+    if accept is None:
+        return 'json'
+    media_types = {media_type: name for name, media_type in EXPORT_FORMATS.items()}
+    best = accept.best_match(['application/json', *media_types], default='application/json')
+    return media_types.get(best, 'json')
+
+
+def parse_list_args(args, accept=None) -> dict:
+    """Read pagination, filter and projection parameters from a request's query string"""
+    params = {
+        'after_id': _int_arg(args, 'after_id', 0),
+        'limit': _int_arg(args, 'limit', 1),
+        'year': _int_arg(args, 'year', 0),
+        'from': _period_arg(args, 'from'),
+        'to': _period_arg(args, 'to'),
+        'meter': args.get('meter') or None,
+        'location': args.get('location') or None,
+        'fields': _fields_arg(args),
+        'months': _months_arg(args),
+        'format': _format_arg(args, accept),
+        'stream': args.get('stream', '').lower() in ('1', 'true', 'yes')
+    }
+    if params['limit'] is not None:
+        params['limit'] = min(params['limit'], MAX_LIMIT)
+    elif params['after_id'] is not None:
+        params['limit'] = MAX_LIMIT
+    return params
+
+
+def period_columns(model):
+    """Year and month columns of a row-per-month table, or None for wide tables"""
+    columns = model.__table__.c
+    for year_name, month_name in PERIOD_COLUMNS:
+        if year_name in columns and month_name in columns:
+            return columns[year_name], columns[month_name]
+    return None
+
+
+def month_number(month_column):
+    """SQL expression turning a 'Jan'..'Dec' column into 1..12"""
+    return case(MONTH_NUMBERS, value=func.substr(month_column, 1, 3))
+
+
+def _text_filter(model, names, term: str, param: str):
+    columns = [model.__table__.c[name] for name in names if name in model.__table__.c]
+    if not columns:
+        raise QueryParamError(f"'{param}' is not supported for this dataset")
+    pattern = f"%{term}%"
+    return or_(*[column.ilike(pattern) for column in columns])
+
+
+def month_column_period(name: str):
+    """yyyymm of a wide-table month column such as Jan_2024, None otherwise"""
+    match = MONTH_COLUMN.match(name)
+    if not match or match.group(1) not in MONTH_NUMBERS:
+        return None
+    return int(match.group(2)) * 100 + MONTH_NUMBERS[match.group(1)]
+
+
+def projected_columns(model, params: dict) -> list:
+    """
+    Columns to select, sorted by name as the JSON keys are. Whole rows unless
+    ?fields= / ?months= ask for fewer: months= keeps the identifying columns
+    plus the month columns in range, fields= lists columns explicitly. id is
+    always included as the cursor.
+    """
+    columns = model.__table__.c
+    months = params['months'] if period_columns(model) is None else None
+    if params['fields'] is None and months is None:
+        return sorted(columns, key=lambda column: column.name)
+
+    unknown = [name for name in params['fields'] or [] if name not in columns]
+    if unknown:
+        raise QueryParamError(f"Unknown field(s): {', '.join(unknown)}")
+
+    if params['fields'] is not None:
+        names = set(params['fields'])
+    else:
+        names = {
+            column.name for column in columns
+            if month_column_period(column.name) is None
+            and column.name not in ('created_at', 'updated_at')
+        }
+    if months is not None:
+        start, end = months
+        for column in columns:
+            period = month_column_period(column.name)
+            if period is not None and start <= period <= end:
+                names.add(column.name)
+    names.add('id')
+    return [columns[name] for name in sorted(names)]
+
+
+def apply_list_args(model, query, params: dict):
+    """Apply filters and keyset pagination from parse_list_args to a model query"""
+    period_from, period_to = params['from'], params['to']
+    if params['months'] is not None and period_columns(model) is not None:
+        # Row-per-month tables take months= as a row filter
+        period_from, period_to = params['months']
+
+    if params['year'] is not None or period_from is not None or period_to is not None:
+        period = period_columns(model)
+        if period is None:
+            raise QueryParamError("'year', 'from' and 'to' are not supported for this dataset")
+        year_column, month_column = period
+        if params['year'] is not None:
+            query = query.filter(year_column == params['year'])
+        if 'period' in model.__table__.c:
+            # A plain range on the indexed period date
+            period_key = model.__table__.c.period
+            period_from, period_to = _period_date(period_from), _period_date(period_to)
+        else:
+            period_key = year_column * 100 + month_number(month_column)
+        if period_from is not None:
+            query = query.filter(period_key >= period_from)
+        if period_to is not None:
+            query = query.filter(period_key <= period_to)
+
+    if params['meter']:
+        query = query.filter(_text_filter(model, METER_COLUMNS, params['meter'], 'meter'))
+    if params['location']:
+        query = query.filter(_text_filter(model, LOCATION_COLUMNS, params['location'], 'location'))
+
+    # Keyset pagination on the primary key keeps every page an index range scan
+    if params['after_id'] is not None:
+        query = query.filter(model.id > params['after_id'])
+    query = query.order_by(model.id)
+    if params['limit'] is not None:
+        query = query.limit(params['limit'])
+
+    # Plain row tuples of only the needed columns, no ORM objects are built
+    return query.with_entities(*projected_columns(model, params))
+
+
+def list_query(model):
+    """model.query with the current request's filters, pagination and projection applied"""
+    params = parse_list_args(request.args, request.accept_mimetypes)
+    g.list_params = params
+    g.list_model = model
+    return apply_list_args(model, model.query, params)
+
+
+def to_records(data) -> list:
+    """Dicts for list_query rows, keyed like the models' to_dict()"""
+    if not data:
+        return []
+    keys = data[0]._fields
+    return [dict(zip(keys, row)) for row in data]
+
+
+def list_response(query):
+    """
+    Response for a list route in the requested format. JSON is an array of
+    row objects; when the page is full, the cursor for the next page is
+    returned in the X-Next-After-Id header. ?stream=true sends the array in
+    chunks straight from the database cursor instead, as NDJSON, CSV, Arrow
+    and Parquet exports always are.
+    """
+    params = g.list_params
+    model = g.list_model
+    if params['format'] != 'json':
+        return export_response(
+            query, projected_columns(model, params), params['format'], model.__tablename__
+        )
+    if params['stream']:
+        return stream_json_response(query, projected_columns(model, params))
+
+    records = to_records(query.all())
+    response = json_response(records)
+    if params['limit'] is not None and len(records) == params['limit'] and records:
+        response.headers['X-Next-After-Id'] = str(records[-1]['id'])
+    return response
@@ -5,37 +5,45 @@ from ..models.lthw_models import (
     LTHWAutomatedMeter, LTHWManualMeter, LTHWConsumption
 )
 from .. import db
+from .list_query import list_query, list_response, QueryParamError
+from .response_cache import cache_until_next_load
 import logging
 
 bp = Blueprint('lthw', __name__, url_prefix='/api/lthw')
 logger = logging.getLogger(__name__)
 
 @bp.route('/automated', methods=['GET'])
+@cache_until_next_load
 def get_automated_data():
     """Get LTHW automated meter data"""
     try:
-        data = LTHWAutomatedMeter.query.all()
-        return jsonify([record.to_dict() for record in data])
+        return list_response(list_query(LTHWAutomatedMeter))
+    except QueryParamError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error fetching LTHW automated data: {str(e)}")
         return jsonify({'error': 'Failed to fetch LTHW automated data'}), 500
 
 @bp.route('/manual', methods=['GET'])
+@cache_until_next_load
 def get_manual_data():
     """Get LTHW manual meter data"""
     try:
-        data = LTHWManualMeter.query.all()
-        return jsonify([record.to_dict() for record in data])
+        return list_response(list_query(LTHWManualMeter))
+    except QueryParamError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error fetching LTHW manual data: {str(e)}")
         return jsonify({'error': 'Failed to fetch LTHW manual data'}), 500
 
 @bp.route('/consumption', methods=['GET'])
+@cache_until_next_load
 def get_consumption_data():
     """Get LTHW consumption data"""
     try:
-        data = LTHWConsumption.query.all()
-        return jsonify([record.to_dict() for record in data])
+        return list_response(list_query(LTHWConsumption))
+    except QueryParamError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error fetching LTHW consumption data: {str(e)}")
         return jsonify({'error': 'Failed to fetch LTHW consumption data'}), 500
@@ -3,27 +3,33 @@
 from flask import Blueprint, jsonify
 from ..models.mthw_models import MTHWMeterReading, MTHWConsumptionReading
 from .. import db
+from .list_query import list_query, list_response, QueryParamError
+from .response_cache import cache_until_next_load
 import logging
 
 bp = Blueprint('mthw', __name__, url_prefix='/api/mthw')
 logger = logging.getLogger(__name__)
 
 @bp.route('/meter', methods=['GET'])
+@cache_until_next_load
 def get_meter_data():
     """Get MTHW meter reading data"""
     try:
-        data = MTHWMeterReading.query.all()
-        return jsonify([record.to_dict() for record in data])
+        return list_response(list_query(MTHWMeterReading))
+    except QueryParamError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error fetching MTHW meter reading data: {str(e)}")
         return jsonify({'error': 'Failed to fetch MTHW meter reading data'}), 500
 
 @bp.route('/consumption', methods=['GET'])
+@cache_until_next_load
 def get_consumption_data():
     """Get MTHW consumption reading data"""
     try:
-        data = MTHWConsumptionReading.query.all()
-        return jsonify([record.to_dict() for record in data])
+        return list_response(list_query(MTHWConsumptionReading))
+    except QueryParamError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error fetching MTHW consumption data: {str(e)}")
         return jsonify({'error': 'Failed to fetch MTHW consumption data'}), 500
@@ -0,0 +1,199 @@
+# backend/app/routes/response_cache.py
+
+from flask import current_app, request, Response
+from collections import OrderedDict
+from typing import Optional
+import hashlib
+import logging
+import os
+import threading
+import time
+
+from .. import db
+from ..services.load_versions import read_load_versions
+
+logger = logging.getLogger(__name__)
+
+
+class LoadVersionTracker:
+    """
+    The dbo.load_versions counters, re-read at most every `interval` seconds
+    so most requests can be validated without a query. Every worker process
+    reads the same table, so they all agree on when data changed.
+    """
+
+    def __init__(self, interval: float = 5):
+        self.interval = interval
+        self._versions = None
+        self._read_at = 0.0
+        self._lock = threading.Lock()
+
+    def current(self) -> Optional[tuple]:
+        """Current load versions, None if they cannot be read"""
+        now = time.monotonic()
+        if self._versions is None or now - self._read_at >= self.interval:
+            try:
+                # Not db.session: a transaction left open on it makes views
+                # that call db.session.begin() fail
+                with db.engine.connect() as connection:
+                    versions = tuple(sorted(read_load_versions(connection).items()))
+            except Exception as e:
+                logger.warning(f"Load versions unavailable, skipping HTTP caching: {str(e)}")
+                return None
+            with self._lock:
+                self._versions = versions
+                self._read_at = now
+        return self._versions
+
+
+class ResponseCache:
+    """
+    LRU cache of finished GET responses with a TTL and size limits.
+
+    Every entry remembers the table load versions it was built from and is
+    stale once a loader bumps one of them. The cache lives in each worker
+    process.
+    """
+
+    def __init__(self, ttl: float = 300, max_entries: int = 256,
+                 max_bytes: int = 64 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, versions: tuple):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, stored_versions, body, status, headers = entry
+            if stored_versions != versions or time.monotonic() - stored_at > self.ttl:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return body, status, headers
+
+    def set(self, key, versions: tuple, body: bytes, status: int, headers: list):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic(), versions, body, status, headers)
+            self._size += len(body)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._size -= len(entry[2])
+
+
+# Headers replayed on a cache hit
+CACHED_HEADERS = ('Content-Type', 'Content-Disposition', 'X-Next-After-Id')
+
+
+def _cache_key():
+    # Normalise the query string so ?a=1&b=2 and ?b=2&a=1 share an entry
+    args = tuple(sorted(request.args.items(multi=True)))
+    # List routes negotiate the export format from the Accept header
+    return request.path, args, request.headers.get('Accept', '')
+
+
+def _etag(key, versions: tuple) -> str:
+    """Strong validator for a resource: changes exactly when a load does"""
+    return hashlib.sha1(repr((key, versions)).encode()).hexdigest()
+
+
+def cache_until_next_load(view):
+    """
+    Give a route ETags and let the response cache keep its responses until
+    the next load. Only for routes that read nothing but tables whose
+    loaders bump dbo.load_versions; anything else, such as the analysis
+    tables rebuilt by the scripts in analysis/, would be served stale.
+    """
+    view.cache_until_next_load = True
+    return view
+
+
+def _cacheable() -> bool:
+    if request.method != 'GET' or not request.path.startswith('/api/'):
+        return False
+    view = current_app.view_functions.get(request.endpoint)
+    return getattr(view, 'cache_until_next_load', False)
+
+
+def init_http_caching(app):
+    """
+    Conditional GETs and an in-memory response cache for the data endpoints
+    marked with cache_until_next_load.
+
+    Their responses carry an ETag derived from the load versions, so a
+    client polling unchanged data gets a 304 before any route code runs.
+    Repeat requests from other clients are answered from the response cache
+    until the next load (disabled with RESPONSE_CACHE_TTL=0).
+    """
+    tracker = LoadVersionTracker(float(os.getenv('RESPONSE_CACHE_VERSION_CHECK', 5)))
+    ttl = float(os.getenv('RESPONSE_CACHE_TTL', 300))
+    cache = None
+    if ttl > 0:
+        cache = ResponseCache(
+            ttl=ttl,
+            max_entries=int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', 256)),
+            max_bytes=int(os.getenv('RESPONSE_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+        )
+        app.extensions['response_cache'] = cache
+
+    @app.before_request
+    def serve_cached_response():
+        if not _cacheable():
+            return None
+        versions = tracker.current()
+        request.environ['uems.cache_versions'] = versions
+        if versions is None:
+            return None
+
+        key = _cache_key()
+        etag = _etag(key, versions)
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            hit = cache.get(key, versions) if cache is not None else None
+            if hit is None:
+                return None
+            body, status, headers = hit
+            response = Response(body, status=status, headers=headers)
+            response.headers['X-Cache'] = 'HIT'
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.vary.add('Accept')
+        return response
+
+    @app.after_request
+    def store_response(response):
+        if not _cacheable() or response.status_code != 200 or 'ETag' in response.headers:
+            return response
+        versions = request.environ.get('uems.cache_versions')
+        if versions is None:
+            return response
+
+        key = _cache_key()
+        if cache is not None and not response.is_streamed:
+            headers = [(name, response.headers[name]) for name in CACHED_HEADERS if name in response.headers]
+            cache.set(key, versions, response.get_data(), response.status_code, headers)
+            response.headers['X-Cache'] = 'MISS'
+        # no-cache: browsers may keep the body but must revalidate with the ETag
+        response.set_etag(_etag(key, versions))
+        response.headers['Cache-Control'] = 'no-cache'
+        response.vary.add('Accept')
+        return response
+
+    return cache
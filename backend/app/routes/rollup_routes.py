@@ -0,0 +1,71 @@
+# backend/app/routes/rollup_routes.py
+
+from flask import Blueprint, jsonify, request
+from datetime import date
+from .. import db
+from ..models.rollup_models import ConsumptionRollup
+from .list_query import QueryParamError
+from .serialization import json_response
+from .response_cache import cache_until_next_load
+import logging
+
+bp = Blueprint('rollups', __name__, url_prefix='/api/rollups')
+logger = logging.getLogger(__name__)
+
+GRAINS = ('day', 'month', 'year')
+
+
+def _date_arg(name: str):
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise QueryParamError(f"'{name}' must be an ISO date (YYYY-MM-DD)")
+
+
+@bp.route('', methods=['GET'])
+@cache_until_next_load
+def get_rollups():
+    """
+    Pre-aggregated consumption, e.g. ?grain=month&utility=gas&from=2024-01-01&to=2024-12-31.
+    With ?building=D201 one building's rows are returned; without it the
+    buildings are summed per period, utility and unit.
+    """
+    try:
+        grain = request.args.get('grain', 'month')
+        if grain not in GRAINS:
+            raise QueryParamError(f"'grain' must be one of: {', '.join(GRAINS)}")
+        start, end = _date_arg('from'), _date_arg('to')
+        utility = request.args.get('utility')
+        building = request.args.get('building')
+
+        rollup = ConsumptionRollup
+        if building:
+            query = db.session.query(
+                rollup.period_start, rollup.utility, rollup.building, rollup.unit,
+                rollup.value, rollup.meters
+            ).filter(rollup.building == building)
+        else:
+            query = db.session.query(
+                rollup.period_start, rollup.utility, rollup.unit,
+                db.func.sum(rollup.value).label('value'),
+                db.func.sum(rollup.meters).label('meters')
+            ).group_by(rollup.period_start, rollup.utility, rollup.unit)
+
+        query = query.filter(rollup.grain == grain)
+        if utility:
+            query = query.filter(rollup.utility == utility)
+        if start:
+            query = query.filter(rollup.period_start >= start)
+        if end:
+            query = query.filter(rollup.period_start <= end)
+
+        rows = query.order_by(rollup.period_start, rollup.utility, rollup.unit).all()
+        return json_response([dict(row._mapping) for row in rows])
+    except QueryParamError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error fetching rollups: {str(e)}")
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,60 @@
+# backend/app/routes/serialization.py
+
+from flask import Response
+from datetime import date, datetime
+from decimal import Decimal
+import json
+import math
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the standard library encoder is the fallback
+    orjson = None
+
+
+def _default(value):
+    """Types the encoders do not handle natively"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _without_nan(value):
+    """Replace NaN with None for the standard library encoder"""
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, dict):
+        return {key: _without_nan(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_without_nan(item) for item in value]
+    return value
+
+
+def dumps(data) -> bytes:
+    """
+    Encode row dicts (or lists/dicts of them) as JSON. NaN becomes null and
+    dates become ISO strings, matching the models' to_dict() output.
+    """
+    if orjson is not None:
+        # orjson writes NaN as null and datetimes as ISO 8601 natively
+        return orjson.dumps(data, default=_default)
+    return json.dumps(
+        _without_nan(data), default=_default, separators=(',', ':'), allow_nan=False
+    ).encode()
+
+
+def json_response(data, status: int = 200) -> Response:
+    return Response(dumps(data), status=status, mimetype='application/json')
+
+
+def dumps_lines(records: list) -> bytes:
+    """Encode row dicts as newline-delimited JSON, one object per line"""
+    if orjson is not None:
+        return b''.join(orjson.dumps(record, default=_default) + b'\n' for record in records)
+    return ''.join(
+        json.dumps(_without_nan(record), default=_default, separators=(',', ':'), allow_nan=False) + '\n'
+        for record in records
+    ).encode()
@@ -5,6 +5,8 @@ from sqlalchemy import create_engine, MetaData, text
 from sqlalchemy.orm import sessionmaker
 from ..models.auckland_water import AucklandWaterCalculatedConsumption
 from .auckland_calculated_water_processor import AucklandCalculatedWaterProcessor
+from .workbook_session import WorkbookSession
+from .incremental_load import load_frames
 from .. import db
 
 class AucklandCalculatedWaterLoader:
@@ -19,46 +21,21 @@ class AucklandCalculatedWaterLoader:
             connection.execute(text('CREATE SCHEMA IF NOT EXISTS dbo;'))
 
     def create_tables(self):
-        """Drop and recreate only the calculated water consumption table"""
+        """Create the calculated water consumption table if missing; load_data swaps in fresh copies"""
         with self.engine.begin() as connection:
-            connection.execute(text('''
-                DROP SEQUENCE IF EXISTS dbo.auckland_water_calculated_consumption_id_seq CASCADE;
-                DROP TABLE IF EXISTS dbo.auckland_water_calculated_consumption CASCADE;
-            '''))
-            AucklandWaterCalculatedConsumption.__table__.create(self.engine)
+            AucklandWaterCalculatedConsumption.__table__.create(connection, checkfirst=True)
 
-    def load_data(self, excel_file: str) -> int:
+    def load_data(self, excel_file: str, workbook: WorkbookSession = None, incremental: bool = False) -> int:
         """Load calculated water consumption data from Excel"""
-        session = self.Session()
         try:
-            calc_processor = AucklandCalculatedWaterProcessor(excel_file)
+            calc_processor = AucklandCalculatedWaterProcessor(excel_file, workbook)
             calc_data = calc_processor.load_data()
-            calc_records = []
-
-            for _, row in calc_data.iterrows():
-                record = AucklandWaterCalculatedConsumption(
-                    object_name=row['object_name'],
-                    object_description=row['object_description'],
-                    meter_location=row['meter_location']
-                )
-                
-                for col in calc_data.columns:
-                    if col not in ['object_name', 'object_description', 'meter_location']:
-                        value = row[col]
-                        if pd.isna(value):
-                            value = None
-                        setattr(record, col, value)
-                calc_records.append(record)
 
-            session.bulk_save_objects(calc_records)
-            session.commit()
-            return len(calc_records)
+            written = load_frames(self.engine, {AucklandWaterCalculatedConsumption: calc_data}, incremental)
+            return written[AucklandWaterCalculatedConsumption]
 
         except Exception as e:
-            session.rollback()
             raise Exception(f"Error loading Auckland Calculated Water data: {str(e)}")
-        finally:
-            session.close()
 
     def verify_data(self) -> dict:
         """Verify loaded data"""
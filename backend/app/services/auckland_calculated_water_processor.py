@@ -2,10 +2,12 @@
 import pandas as pd
 from typing import Dict
 import numpy as np
+from .workbook_session import WorkbookSession
 
 class AucklandCalculatedWaterProcessor:
-    def __init__(self, excel_file: str):
+    def __init__(self, excel_file: str, workbook: WorkbookSession = None):
         self.excel_file = excel_file
+        self.workbook = workbook or WorkbookSession(excel_file)
         self.raw_data = None
         
     def load_data(self) -> pd.DataFrame:
@@ -15,9 +17,8 @@ class AucklandCalculatedWaterProcessor:
         """
         try:
             # Read the specific range from Excel including column A for meter_location
-            df = pd.read_excel(
-                self.excel_file,
-                sheet_name='AKL-WLG-CHC',
+            df = self.workbook.read_sheet(
+                'AKL-WLG-CHC',
                 skiprows=39,     # Skip to actual data rows
                 nrows=4,         # Only read 4 rows
                 usecols='A:AQ'   # Columns A through AQ (including A for meter_location)
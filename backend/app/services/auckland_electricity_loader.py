@@ -5,6 +5,8 @@ from sqlalchemy import create_engine, MetaData, text
 from sqlalchemy.orm import sessionmaker
 from ..models.auckland_electricity import AucklandElectricityCalculatedConsumption
 from .auckland_electricity_processor import AucklandElectricityProcessor
+from .workbook_session import WorkbookSession
+from .incremental_load import load_frames
 from .. import db
 
 class AucklandElectricityLoader:
@@ -19,50 +21,21 @@ class AucklandElectricityLoader:
             connection.execute(text('CREATE SCHEMA IF NOT EXISTS dbo;'))
             
     def recreate_tables(self):
-        """Drop and recreate only the electricity consumption table"""
+        """Create the electricity consumption table if missing; load_data swaps in fresh copies"""
         with self.engine.begin() as connection:
-            connection.execute(text('''
-                DROP SEQUENCE IF EXISTS dbo.auckland_electricity_calculated_consumption_id_seq CASCADE;
-                DROP TABLE IF EXISTS dbo.auckland_electricity_calculated_consumption CASCADE;
-            '''))
-        AucklandElectricityCalculatedConsumption.__table__.create(self.engine)
-            
-    def load_data(self, excel_file: str) -> int:
+            AucklandElectricityCalculatedConsumption.__table__.create(connection, checkfirst=True)
+
+    def load_data(self, excel_file: str, workbook: WorkbookSession = None, incremental: bool = False) -> int:
         """Load data from Excel to database"""
-        session = self.Session()
         try:
-            processor = AucklandElectricityProcessor(excel_file)
+            processor = AucklandElectricityProcessor(excel_file, workbook)
             raw_data = processor.load_data()
-            
-            records = []
-            for _, row in raw_data.iterrows():
-                record = AucklandElectricityCalculatedConsumption(
-                    object_name=row['object_name'],
-                    object_description=row['object_description'],
-                    meter_location=row['meter_location']
-                )
-                
-                # Add each month's reading
-                for col in raw_data.columns:
-                    if col not in ['object_name', 'object_description', 'meter_location']:
-                        value = row[col]
-                        if pd.isna(value):
-                            value = None
-                        setattr(record, col, value)
-                
-                records.append(record)
-            
-            session.bulk_save_objects(records)
-            session.commit()
-            
-            return len(records)
-            
+
+            written = load_frames(self.engine, {AucklandElectricityCalculatedConsumption: raw_data}, incremental)
+            return written[AucklandElectricityCalculatedConsumption]
+
         except Exception as e:
-            session.rollback()
             raise Exception(f"Error loading Auckland Electricity data: {str(e)}")
-        
-        finally:
-            session.close()
             
     def verify_data(self) -> dict:
         """Verify loaded data"""
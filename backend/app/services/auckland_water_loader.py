@@ -5,6 +5,8 @@ from sqlalchemy import create_engine, MetaData, text
 from sqlalchemy.orm import sessionmaker
 from ..models.auckland_water import AucklandWaterConsumption
 from .auckland_water_processor import AucklandWaterProcessor
+from .workbook_session import WorkbookSession
+from .incremental_load import load_frames
 from .. import db
 
 class AucklandWaterLoader:
@@ -19,46 +21,21 @@ class AucklandWaterLoader:
             connection.execute(text('CREATE SCHEMA IF NOT EXISTS dbo;'))
 
     def create_tables(self):
-        """Drop and recreate only the water consumption table"""
+        """Create the water consumption table if missing; load_data swaps in fresh copies"""
         with self.engine.begin() as connection:
-            connection.execute(text('''
-                DROP SEQUENCE IF EXISTS dbo.auckland_water_consumption_id_seq CASCADE;
-                DROP TABLE IF EXISTS dbo.auckland_water_consumption CASCADE;
-            '''))
-            AucklandWaterConsumption.__table__.create(self.engine)
+            AucklandWaterConsumption.__table__.create(connection, checkfirst=True)
 
-    def load_data(self, excel_file: str) -> int:
+    def load_data(self, excel_file: str, workbook: WorkbookSession = None, incremental: bool = False) -> int:
         """Load water consumption data from Excel"""
-        session = self.Session()
         try:
-            water_processor = AucklandWaterProcessor(excel_file)
+            water_processor = AucklandWaterProcessor(excel_file, workbook)
             water_data = water_processor.load_data()
-            water_records = []
-
-            for _, row in water_data.iterrows():
-                record = AucklandWaterConsumption(
-                    object_name=row['object_name'],
-                    object_description=row['object_description'],
-                    reading_description=row['reading_description']
-                )
-                
-                for col in water_data.columns:
-                    if col not in ['object_name', 'object_description', 'reading_description']:
-                        value = row[col]
-                        if pd.isna(value):
-                            value = None
-                        setattr(record, col, value)
-                water_records.append(record)
 
-            session.bulk_save_objects(water_records)
-            session.commit()
-            return len(water_records)
+            written = load_frames(self.engine, {AucklandWaterConsumption: water_data}, incremental)
+            return written[AucklandWaterConsumption]
 
         except Exception as e:
-            session.rollback()
             raise Exception(f"Error loading Auckland Water data: {str(e)}")
-        finally:
-            session.close()
 
     def verify_data(self) -> dict:
         """Verify loaded data"""
@@ -2,10 +2,12 @@
 import pandas as pd
 from typing import Dict
 import numpy as np
+from .workbook_session import WorkbookSession
 
 class AucklandWaterProcessor:
-    def __init__(self, excel_file: str):
+    def __init__(self, excel_file: str, workbook: WorkbookSession = None):
         self.excel_file = excel_file
+        self.workbook = workbook or WorkbookSession(excel_file)
         self.raw_data = None
         self.READING_DESCRIPTION = "(From Desigo CC System2) The values from the monthly report are unreliable the water meters drop to 0 and back to value"
         
@@ -16,9 +18,8 @@ class AucklandWaterProcessor:
         """
         try:
             # Read the specific range from Excel
-            df = pd.read_excel(
-                self.excel_file,
-                sheet_name='AKL-WLG-CHC',
+            df = self.workbook.read_sheet(
+                'AKL-WLG-CHC',
                 skiprows=46,     # Skip to actual data rows
                 usecols='B:AQ'   # Columns B through AQ
             )
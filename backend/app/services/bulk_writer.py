@@ -0,0 +1,99 @@
+# backend/app/services/bulk_writer.py
+
+import io
+import logging
+from typing import Union
+
+import pandas as pd
+from sqlalchemy import Date, Integer, Table
+
+logger = logging.getLogger(__name__)
+
+# Rows serialised per COPY statement, keeps the CSV buffer small on wide tables
+COPY_CHUNK_ROWS = 10000
+
+# Unquoted marker COPY reads as NULL; an unquoted empty field stays an empty string
+COPY_NULL = '\\N'
+
+
+def _resolve_table(model) -> Table:
+    """Accept either a model class or a Table"""
+    return getattr(model, '__table__', model)
+
+
+def prepare_frame(table: Table, data: pd.DataFrame) -> pd.DataFrame:
+    """Align a processed DataFrame with the columns of a table.
+
+    Columns the table does not know are dropped (as setattr on a model did),
+    Python-side defaults such as created_at are filled in, and Date/Integer
+    columns are coerced so they serialise the way the database expects.
+    """
+    names = [column.name for column in table.columns if column.name in data.columns]
+    frame = data[names].copy()
+
+    for column in table.columns:
+        if column.name in frame.columns or column.primary_key or column.default is None:
+            continue
+        default = column.default
+        if not getattr(default, 'is_scalar', False) and not getattr(default, 'is_callable', False):
+            continue
+        frame[column.name] = default.arg(None) if default.is_callable else default.arg
+
+    for column in table.columns:
+        if column.name not in frame.columns:
+            continue
+        if isinstance(column.type, Date):
+            frame[column.name] = pd.to_datetime(frame[column.name]).dt.date
+        elif isinstance(column.type, Integer):
+            frame[column.name] = pd.to_numeric(frame[column.name], errors='coerce').round().astype('Int64')
+
+    return frame
+
+
+def _copy_frame(connection, table: Table, frame: pd.DataFrame):
+    """Stream a prepared frame into PostgreSQL with COPY FROM STDIN"""
+    preparer = connection.dialect.identifier_preparer
+    columns = ', '.join(preparer.quote(name) for name in frame.columns)
+    statement = (
+        f"COPY {preparer.format_table(table)} ({columns}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+    )
+
+    cursor = connection.connection.cursor()
+    try:
+        for start in range(0, len(frame), COPY_CHUNK_ROWS):
+            buffer = io.StringIO()
+            frame.iloc[start:start + COPY_CHUNK_ROWS].to_csv(
+                buffer, header=False, index=False, na_rep=COPY_NULL
+            )
+            buffer.seek(0)
+            cursor.copy_expert(statement, buffer)
+    finally:
+        cursor.close()
+
+
+def _insert_frame(connection, table: Table, frame: pd.DataFrame):
+    """Fallback for drivers without COPY support: one executemany insert"""
+    records = frame.astype(object).where(frame.notna(), None).to_dict('records')
+    connection.execute(table.insert(), records)
+
+
+def write_dataframe(connection, model: Union[type, Table], data: pd.DataFrame) -> int:
+    """Bulk write a DataFrame into the table behind a model.
+
+    `connection` is a SQLAlchemy Connection, normally from `engine.begin()`, so
+    the caller controls the transaction. NaN/None values are written as NULL.
+    Returns the number of rows written.
+    """
+    table = _resolve_table(model)
+    frame = prepare_frame(table, data)
+    if frame.empty:
+        return 0
+
+    if connection.dialect.name == 'postgresql' and connection.dialect.driver == 'psycopg2':
+        _copy_frame(connection, table, frame)
+    else:
+        _insert_frame(connection, table, frame)
+
+    logger.debug(f"Wrote {len(frame)} rows to {table.fullname}")
+    return len(frame)
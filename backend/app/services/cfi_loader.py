@@ -5,6 +5,8 @@ from sqlalchemy import create_engine, MetaData, text
 from sqlalchemy.orm import sessionmaker
 from app.models.cfi_models import CenterForInnovation, CfiRoomTypes
 from .cfi_processor import CfiProcessor
+from .workbook_session import WorkbookSession
+from .incremental_load import load_frames
 from .. import db
 
 class CfiLoader:
@@ -19,22 +21,16 @@ class CfiLoader:
             connection.commit()
 
     def create_tables(self):
-        with self.engine.connect() as connection:
-            connection.execute(text('''
-                DROP TABLE IF EXISTS dbo.center_for_innovation CASCADE;
-                DROP TABLE IF EXISTS dbo.cfi_room_types CASCADE;
-            '''))
-            connection.commit()
+        """Create the CFI tables if missing; load_data swaps in fresh copies"""
+        with self.engine.begin() as connection:
+            CenterForInnovation.__table__.create(connection, checkfirst=True)
+            CfiRoomTypes.__table__.create(connection, checkfirst=True)
 
-        CenterForInnovation.__table__.create(self.engine)
-        CfiRoomTypes.__table__.create(self.engine)
-
-    def load_data(self, excel_file: str) -> dict:
-        session = self.Session()
+    def load_data(self, excel_file: str, workbook: WorkbookSession = None, incremental: bool = False) -> dict:
         records_count = {}
 
         try:
-            processor = CfiProcessor(excel_file)
+            processor = CfiProcessor(excel_file, workbook)
             processed_data = processor.load_all_data()
 
             table_models = {
@@ -42,37 +38,24 @@ class CfiLoader:
                 'cfi_room_types': CfiRoomTypes
             }
 
+            frames = {}
             for table_name, data in processed_data.items():
-                model_class = table_models[table_name]
-                records = []
-
                 # Filter out rows based on conditions
                 if table_name == 'center_for_innovation':
                     data = data[data['location'].notna()]
                 elif table_name == 'cfi_room_types':
                     data = data[data['room_number'].notna()]
+                frames[table_models[table_name]] = data
 
-                for _, row in data.iterrows():
-                    record = model_class()
-                    # Set values for all columns
-                    for col in data.columns:
-                        value = row[col]
-                        if pd.isna(value):
-                            value = None
-                        setattr(record, col, value)
-                    records.append(record)
-
-                session.bulk_save_objects(records)
-                records_count[table_name] = len(records)
+            # Swap in fresh tables, or only update changed months when incremental
+            written = load_frames(self.engine, frames, incremental)
+            for table_name in processed_data:
+                records_count[table_name] = written[table_models[table_name]]
 
-            session.commit()
             return records_count
 
         except Exception as e:
-            session.rollback()
             raise Exception(f"Error loading CFI data: {str(e)}")
-        finally:
-            session.close()
 
     def verify_data(self) -> dict:
         session = self.Session()
@@ -3,10 +3,12 @@
 import pandas as pd
 import numpy as np
 from typing import Dict
+from .workbook_session import WorkbookSession
 
 class CfiProcessor:
-    def __init__(self, excel_file: str):
+    def __init__(self, excel_file: str, workbook: WorkbookSession = None):
         self.excel_file = excel_file
+        self.workbook = workbook or WorkbookSession(excel_file)
         self.raw_data = {}
 
     def _handle_float_columns(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -19,9 +21,8 @@ class CfiProcessor:
     def _process_meter_data(self) -> pd.DataFrame:
         try:
             # Read meter data from Excel without usecols restriction
-            df = pd.read_excel(
-                self.excel_file,
-                sheet_name='CfI',
+            df = self.workbook.read_sheet(
+                'CfI',
                 skiprows=1,
                 nrows=42
             )
@@ -95,9 +96,8 @@ class CfiProcessor:
 
     def _process_room_data(self) -> pd.DataFrame:
         try:
-            df = pd.read_excel(
-                self.excel_file,
-                sheet_name='CfI',
+            df = self.workbook.read_sheet(
+                'CfI',
                 skiprows=57,
                 nrows=73,
                 usecols='A:D'
@@ -130,6 +130,10 @@ class CfiProcessor:
 
     def load_all_data(self) -> Dict[str, pd.DataFrame]:
         try:
+            # Let the workbook stream only as far as the room table needs
+            self.workbook.plan('CfI', skiprows=1, nrows=42)
+            self.workbook.plan('CfI', skiprows=57, nrows=73, usecols='A:D')
+
             self.raw_data['center_for_innovation'] = self._process_meter_data()
             self.raw_data['cfi_room_types'] = self._process_room_data()
             return self.raw_data
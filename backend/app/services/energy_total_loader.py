@@ -1,93 +1,102 @@
-from sqlalchemy import text
-from sqlalchemy.orm import sessionmaker
-from datetime import datetime
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
 from ..models.energy_total_models import EnergyTotalDashboard
 from ..models.stream_elec_models import TotalStreamDnElectricity
 from ..models.steam_mthw import SteamMTHWReading
 from ..models.gas_models import GasConsumption
 from ..models.lthw_models import LTHWConsumption
+from .bulk_writer import write_dataframe
+from .table_swap import create_shadow_tables, swap_shadow_tables
+from .rollups import refresh_rollups_for
 
 class EnergyTotalLoader:
     def __init__(self, db_session):
         self.session = db_session
 
+    def _first_row(self, connection, model, condition) -> dict:
+        """Month columns of the first row matching condition, empty if none"""
+        table = model.__table__
+        row = connection.execute(
+            select(table).where(condition).order_by(table.c.id).limit(1)
+        ).mappings().first()
+        return dict(row) if row is not None else {}
+
+    def build_dashboard(self, connection) -> pd.DataFrame:
+        """Combine every source into dashboard rows with a fixed number of queries"""
+        # Base rows from TotalStreamDnElectricity, one per month
+        stream = pd.read_sql(
+            select(
+                TotalStreamDnElectricity.meter_reading_month.label('month'),
+                TotalStreamDnElectricity.meter_reading_year.label('year'),
+                TotalStreamDnElectricity.total_stream_dn_electricity_kwh
+            ).order_by(TotalStreamDnElectricity.id),
+            connection
+        )
+
+        # MTHW and Steam data, first reading per month
+        steam = pd.read_sql(
+            select(
+                SteamMTHWReading.month,
+                SteamMTHWReading.year,
+                SteamMTHWReading.mthw_consumption_kwh.label('mthw_kwh'),
+                SteamMTHWReading.total_steam_consumption_kwh.label('steam_kwh')
+            ).order_by(SteamMTHWReading.id),
+            connection
+        ).drop_duplicates(subset=['month', 'year'])
+
+        # LPG, Woodchip and Solar totals are single wide rows keyed by month column
+        lpg_data = self._first_row(
+            connection, GasConsumption, GasConsumption.object_description == ' Total Gas Energy - DN'
+        )
+        woodchip_data = self._first_row(
+            connection, LTHWConsumption, LTHWConsumption.object_name == ' Total Wood Energy - DN'
+        )
+        solar_data = self._first_row(
+            connection, LTHWConsumption, LTHWConsumption.object_name == 'Total Solar Energy - DN'
+        )
+
+        stream['year'] = stream['year'].astype('Int64')
+        steam['year'] = steam['year'].astype('Int64')
+        dashboard = stream.merge(steam, on=['month', 'year'], how='left')
+
+        # A zero stream reading means the month has not been read yet
+        dashboard['total_stream_dn_electricity_kwh'] = (
+            dashboard['total_stream_dn_electricity_kwh'].astype(float).replace(0, np.nan)
+        )
+
+        dashboard['period'] = pd.to_datetime(
+            dashboard['year'].astype(str) + dashboard['month'].astype(str), format='%Y%b', errors='coerce'
+        )
+
+        column_name = dashboard['month'].astype(str) + '_' + dashboard['year'].astype(str)
+        dashboard['lpg_kwh'] = column_name.map(lpg_data).astype(float)
+        dashboard['woodchip_pellet_kwh'] = column_name.map(woodchip_data).astype(float)
+        dashboard['solar_kwh'] = column_name.map(solar_data).astype(float)
+
+        # Total only when every source has a value, NaN propagates otherwise
+        dashboard['total_kwh'] = (
+            dashboard['total_stream_dn_electricity_kwh'] + dashboard['mthw_kwh'].astype(float)
+            + dashboard['steam_kwh'].astype(float) + dashboard['lpg_kwh']
+            + dashboard['woodchip_pellet_kwh'] + dashboard['solar_kwh']
+        )
+
+        return dashboard
+
     def load_data(self):
         try:
-            # First truncate the existing table
-            self.session.execute(text('TRUNCATE TABLE dbo.energy_total_dashboard RESTART IDENTITY CASCADE;'))
-            self.session.commit()
-            
-            # Get base data from TotalStreamDnElectricity
-            stream_data = self.session.query(TotalStreamDnElectricity).all()
-            
-            records_loaded = 0
-            
-            for stream_record in stream_data:
-                # Get corresponding data from other tables
-                month = stream_record.meter_reading_month
-                year = stream_record.meter_reading_year
-                
-                # Get MTHW and Steam data
-                mthw_steam = self.session.query(SteamMTHWReading).filter_by(
-                    month=month,
-                    year=year
-                ).first()
-                
-                # Get LPG data
-                lpg_data = self.session.query(GasConsumption).filter_by(
-                    object_description=' Total Gas Energy - DN'
-                ).first()
-                
-                # Get Woodchip data
-                woodchip_data = self.session.query(LTHWConsumption).filter_by(
-                    object_name=' Total Wood Energy - DN'
-                ).first()
-                
-                # Get Solar data
-                solar_data = self.session.query(LTHWConsumption).filter_by(
-                    object_name='Total Solar Energy - DN'
-                ).first()
-                
-                # Get the correct monthly values
-                column_name = f"{month}_{year}"
-                
-                # Store values with None if not available 
-                stream_value = (stream_record.total_stream_dn_electricity_kwh 
-                                if stream_record.total_stream_dn_electricity_kwh != 0 
-                                else None)
-                mthw_value = mthw_steam.mthw_consumption_kwh if mthw_steam else None
-                steam_value = mthw_steam.total_steam_consumption_kwh if mthw_steam else None
-                lpg_value = getattr(lpg_data, column_name, None)
-                woodchip_value = getattr(woodchip_data, column_name, None)
-                solar_value = getattr(solar_data, column_name, None)
-                
-                # Calculate total only if all values are available
-                if all(v is not None for v in [stream_value, mthw_value, steam_value, 
-                                             lpg_value, woodchip_value, solar_value]):
-                    total_kwh = float(stream_value + mthw_value + steam_value + 
-                                    lpg_value + woodchip_value + solar_value)
-                else:
-                    total_kwh = None
-                
-                # Create new record
-                new_record = EnergyTotalDashboard(
-                    month=month,
-                    year=year,
-                    total_stream_dn_electricity_kwh=stream_value,
-                    mthw_kwh=mthw_value,
-                    steam_kwh=steam_value,
-                    lpg_kwh=lpg_value,
-                    woodchip_pellet_kwh=woodchip_value,
-                    solar_kwh=solar_value,
-                    total_kwh=total_kwh
-                )
-                
-                self.session.add(new_record)
-                records_loaded += 1
-            
+            connection = self.session.connection()
+            dashboard = self.build_dashboard(connection)
+
+            # Rebuild into a shadow table and swap it in with the commit
+            shadows = create_shadow_tables(connection, [EnergyTotalDashboard])
+            records_loaded = write_dataframe(connection, shadows[EnergyTotalDashboard], dashboard)
+            swap_shadow_tables(connection, shadows)
+
             self.session.commit()
+            refresh_rollups_for(self.session.get_bind(), [EnergyTotalDashboard.__table__])
             return records_loaded
-            
+
         except Exception as e:
             self.session.rollback()
             raise Exception(f"Error loading energy total data: {str(e)}")
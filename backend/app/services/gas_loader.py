@@ -7,6 +7,8 @@ from ..models.gas_models import (
     GasAutomatedMeter, GasManualMeter, GasConsumption
 )
 from .gas_processor import GasProcessor
+from .workbook_session import WorkbookSession
+from .incremental_load import load_frames
 from .. import db
 
 class GasLoader:
@@ -21,24 +23,17 @@ class GasLoader:
             connection.commit()
 
     def create_tables(self):
-        with self.engine.connect() as connection:
-            connection.execute(text('''
-                DROP TABLE IF EXISTS dbo.gas_automated_meter CASCADE;
-                DROP TABLE IF EXISTS dbo.gas_manual_meter CASCADE;
-                DROP TABLE IF EXISTS dbo.gas_consumption CASCADE;
-            '''))
-            connection.commit()
+        """Create the Gas tables if missing; load_data swaps in fresh copies"""
+        with self.engine.begin() as connection:
+            GasAutomatedMeter.__table__.create(connection, checkfirst=True)
+            GasManualMeter.__table__.create(connection, checkfirst=True)
+            GasConsumption.__table__.create(connection, checkfirst=True)
 
-            GasAutomatedMeter.__table__.create(self.engine)
-            GasManualMeter.__table__.create(self.engine)
-            GasConsumption.__table__.create(self.engine)
-
-    def load_data(self, excel_file: str) -> dict:
-        session = self.Session()
+    def load_data(self, excel_file: str, workbook: WorkbookSession = None, incremental: bool = False) -> dict:
         records_count = {}
 
         try:
-            processor = GasProcessor(excel_file)
+            processor = GasProcessor(excel_file, workbook)
             processed_data = processor.load_all_data()
 
             table_models = {
@@ -47,33 +42,16 @@ class GasLoader:
                 'consumption': GasConsumption
             }
 
-            for table_name, data in processed_data.items():
-                model_class = table_models[table_name]
-                records = []
+            # Swap in fresh tables, or only update changed months when incremental
+            frames = {table_models[name]: data for name, data in processed_data.items()}
+            written = load_frames(self.engine, frames, incremental)
+            for table_name in processed_data:
+                records_count[table_name] = written[table_models[table_name]]
 
-                for _, row in data.iterrows():
-                    record = model_class()
-                    
-                    # Set values for all columns
-                    for col in data.columns:
-                        value = row[col]
-                        if pd.isna(value):
-                            value = None
-                        setattr(record, col, value)
-                    
-                    records.append(record)
-
-                session.bulk_save_objects(records)
-                records_count[table_name] = len(records)
-
-            session.commit()
             return records_count
 
         except Exception as e:
-            session.rollback()
             raise Exception(f"Error loading Gas data: {str(e)}")
-        finally:
-            session.close()
 
     def verify_data(self) -> dict:
         session = self.Session()
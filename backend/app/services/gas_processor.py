@@ -2,10 +2,12 @@
 
 import pandas as pd
 from typing import Dict
+from .workbook_session import WorkbookSession
 
 class GasProcessor:
-    def __init__(self, excel_file: str):
+    def __init__(self, excel_file: str, workbook: WorkbookSession = None):
         self.excel_file = excel_file
+        self.workbook = workbook or WorkbookSession(excel_file)
         self.raw_data = {}
 
     def load_all_data(self) -> Dict[str, pd.DataFrame]:
@@ -26,6 +28,10 @@ class GasProcessor:
                 })
             ]
 
+            # Let the workbook stream only as far as the last table needs
+            for table_name, skiprows, nrows, columns_map in table_configs:
+                self.workbook.plan('Gas Data', skiprows=skiprows, nrows=nrows)
+
             for table_name, skiprows, nrows, columns_map in table_configs:
                 self.raw_data[table_name] = self._process_table(skiprows, nrows, table_name, columns_map)
             
@@ -36,9 +42,8 @@ class GasProcessor:
 
     def _process_table(self, skiprows: int, nrows: int, table_name: str, columns_map: dict) -> pd.DataFrame:
         try:
-            df = pd.read_excel(
-                self.excel_file,
-                sheet_name='Gas Data',
+            df = self.workbook.read_sheet(
+                'Gas Data',
                 skiprows=skiprows,
                 nrows=nrows
             )
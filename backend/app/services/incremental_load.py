@@ -0,0 +1,215 @@
+# backend/app/services/incremental_load.py
+
+import hashlib
+import json
+import logging
+import re
+from typing import Dict, List, Optional
+
+import pandas as pd
+from sqlalchemy import Column, Integer, MetaData, Table, delete, func, inspect, select
+
+from ..models.load_manifest import LoadManifest
+from ..models.meter_reading import MeterReading
+from .bulk_writer import prepare_frame, write_dataframe
+from .load_versions import bump_load_versions
+from .meter_readings import LONG_FORMAT_SOURCES, create_compatibility_view, replace_source_readings
+from .rollups import refresh_rollups_for
+from .schema_upgrade import upgrade_schema
+from .table_swap import create_shadow_tables, swap_shadow_tables
+
+logger = logging.getLogger(__name__)
+
+# Month columns of the wide meter tables, e.g. Jan_2022 ... Mar_2025
+MONTH_COLUMN = re.compile(r'^[A-Z][a-z]{2}_\d{4}$')
+
+
+def is_month_column(name: str) -> bool:
+    return bool(MONTH_COLUMN.match(str(name)))
+
+
+def _resolve_table(model) -> Table:
+    """Accept either a model class or a Table"""
+    return getattr(model, '__table__', model)
+
+
+def _hash_frame(frame: pd.DataFrame) -> str:
+    """Order-sensitive hash of the values in a frame"""
+    if frame.shape[1] == 0:
+        return hashlib.sha256(str(len(frame)).encode()).hexdigest()
+    row_hashes = pd.util.hash_pandas_object(frame, index=False)
+    return hashlib.sha256(row_hashes.to_numpy().tobytes()).hexdigest()
+
+
+def build_manifest(table: Table, data: pd.DataFrame) -> dict:
+    """Hash a processed frame the way it will be stored in `table`.
+
+    Non-month columns are hashed together since they identify the rows; every
+    month column gets its own hash so a later load can tell which changed.
+    """
+    frame = prepare_frame(table, data)
+    data_columns = [col for col in frame.columns if col in data.columns]
+    labels = [col for col in data_columns if not is_month_column(col)]
+    months = [col for col in data_columns if is_month_column(col)]
+
+    return {
+        'row_count': len(frame),
+        'row_hash': _hash_frame(frame[labels]),
+        'column_hashes': {col: _hash_frame(frame[[col]]) for col in months}
+    }
+
+
+def _read_manifests(connection, names: List[str]) -> Dict[str, dict]:
+    manifest = LoadManifest.__table__
+    rows = connection.execute(
+        select(manifest).where(manifest.c.table_name.in_(names))
+    ).mappings().all()
+    return {
+        row['table_name']: {
+            'row_count': row['row_count'],
+            'row_hash': row['row_hash'],
+            'column_hashes': json.loads(row['column_hashes'])
+        }
+        for row in rows
+    }
+
+
+def _write_manifests(connection, manifests: Dict[str, dict]):
+    manifest = LoadManifest.__table__
+    connection.execute(delete(manifest).where(manifest.c.table_name.in_(list(manifests))))
+    connection.execute(manifest.insert(), [
+        {
+            'table_name': name,
+            'row_count': entry['row_count'],
+            'row_hash': entry['row_hash'],
+            'column_hashes': json.dumps(entry['column_hashes'], sort_keys=True)
+        }
+        for name, entry in manifests.items()
+    ])
+
+
+def _changed_columns(connection, table: Table, previous: Optional[dict], current: dict) -> Optional[List[str]]:
+    """Month columns to update in place, or None when the table needs a full reload"""
+    if previous is None or 'id' not in table.c:
+        return None
+    if previous['row_count'] != current['row_count'] or previous['row_hash'] != current['row_hash']:
+        return None
+    if set(previous['column_hashes']) - set(current['column_hashes']):
+        return None
+    if not inspect(connection).has_table(table.name, schema=table.schema):
+        return None
+
+    live_rows = connection.execute(select(func.count()).select_from(table)).scalar()
+    if live_rows != current['row_count']:
+        return None
+
+    return [
+        col for col, digest in current['column_hashes'].items()
+        if previous['column_hashes'].get(col) != digest
+    ]
+
+
+def _patch_columns(connection, table: Table, data: pd.DataFrame, columns: List[str]) -> int:
+    """Overwrite `columns` of the live rows, matched to the frame by load order"""
+    ids = connection.execute(select(table.c.id).order_by(table.c.id)).scalars().all()
+
+    patch = data[columns].reset_index(drop=True)
+    patch.insert(0, 'id', ids)
+
+    patch_table = Table(
+        f"{table.name}__patch", MetaData(),
+        Column('id', Integer, primary_key=True, autoincrement=False),
+        *[Column(col, table.c[col].type) for col in columns],
+        prefixes=['TEMPORARY']
+    )
+    patch_table.create(connection)
+    try:
+        write_dataframe(connection, patch_table, patch)
+        connection.execute(
+            table.update()
+            .where(table.c.id == patch_table.c.id)
+            .values({col: patch_table.c[col] for col in columns})
+        )
+    finally:
+        patch_table.drop(connection)
+
+    return len(ids)
+
+
+def _update_meter_readings(connection, frames, reload, patches):
+    """Mirror the loaded wide tables into the long-format meter_reading table"""
+    updated = []
+    for model in frames:
+        if model not in LONG_FORMAT_SOURCES:
+            continue
+        if model in reload:
+            replace_source_readings(connection, model, frames[model])
+        elif patches.get(model):
+            replace_source_readings(connection, model, frames[model], patches[model])
+        else:
+            continue
+        create_compatibility_view(connection, model)
+        updated.append(model)
+    if updated:
+        bump_load_versions(connection, [MeterReading.__table__])
+    return updated
+
+
+def load_frames(engine, frames: Dict[object, pd.DataFrame], incremental: bool = False) -> Dict[object, int]:
+    """Write processed frames to their tables in one transaction.
+
+    A full load swaps a freshly written shadow table in for every model. An
+    incremental load compares each frame with the manifest of the previous
+    load and only updates the month columns whose values are new or changed;
+    tables whose rows were added, removed or relabelled still get a full
+    reload. The same months are rewritten in meter_reading for wide tables.
+    Returns rows written (or updated) per model.
+    """
+    written = {}
+    with engine.begin() as connection:
+        LoadManifest.__table__.create(connection, checkfirst=True)
+        MeterReading.__table__.create(connection, checkfirst=True)
+        upgrade_schema(connection)
+
+        manifests = {
+            model: build_manifest(_resolve_table(model), data)
+            for model, data in frames.items()
+        }
+
+        reload = list(frames)
+        patches = {}
+        if incremental:
+            previous = _read_manifests(connection, [_resolve_table(m).fullname for m in frames])
+            reload = []
+            for model, manifest in manifests.items():
+                table = _resolve_table(model)
+                changed = _changed_columns(connection, table, previous.get(table.fullname), manifest)
+                if changed is None:
+                    reload.append(model)
+                else:
+                    patches[model] = changed
+
+        shadows = create_shadow_tables(connection, reload)
+        for model in reload:
+            written[model] = write_dataframe(connection, shadows[model], frames[model])
+            logger.info(f"Reloaded {_resolve_table(model).fullname}: {written[model]} rows")
+
+        for model, columns in patches.items():
+            table = _resolve_table(model)
+            if not columns:
+                written[model] = 0
+                logger.info(f"{table.fullname} unchanged since last load")
+                continue
+            written[model] = _patch_columns(connection, table, frames[model], columns)
+            logger.info(f"Updated {len(columns)} month columns in {table.fullname}: {', '.join(columns)}")
+
+        swap_shadow_tables(connection, shadows)
+        mirrored = _update_meter_readings(connection, frames, reload, patches)
+        bump_load_versions(connection, [_resolve_table(m) for m, columns in patches.items() if columns])
+        _write_manifests(connection, {
+            _resolve_table(model).fullname: manifest for model, manifest in manifests.items()
+        })
+
+    if mirrored:
+        refresh_rollups_for(engine, [MeterReading.__table__])
+    return written
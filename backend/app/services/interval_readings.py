@@ -0,0 +1,179 @@
+# backend/app/services/interval_readings.py
+
+import logging
+import re
+from datetime import date, datetime
+from typing import List
+
+import pandas as pd
+from sqlalchemy import delete, select, text
+
+from ..models.interval_reading import IntervalReading
+from .bulk_writer import write_dataframe
+from .load_versions import bump_load_versions
+from .rollups import refresh_rollups_for
+
+logger = logging.getLogger(__name__)
+
+# Partitions are named <table>_YYYY_MM and hold [first of month, first of next month)
+PARTITION_NAME = re.compile(r'_(\d{4})_(\d{2})$')
+
+# Preprocessed 5-minute weather columns -> (series name, unit)
+WEATHER_SERIES = {
+    'Air_Temperature_C_Avg': ('air_temperature', 'C'),
+    'Relative_Humidity_Avg': ('relative_humidity', '%'),
+    'Wind_Speed_ms_Avg': ('wind_speed', 'm/s'),
+    'Wind_Direction_deg': ('wind_direction', 'deg'),
+    'Solar_W_Avg': ('solar_radiation', 'W/m2'),
+    'UVA_W_AVG': ('uva', 'W/m2'),
+    'UVB_W_AVG': ('uvb', 'W/m2'),
+    'Quantum_umol_AVG': ('quantum', 'umol/m2/s'),
+    'Rain_mm_Tot': ('rain', 'mm'),
+    'Air_Pressure_hPa_Avg': ('air_pressure', 'hPa'),
+    'Wind_Speed_ms_Max': ('wind_speed_max', 'm/s'),
+}
+
+
+def _is_postgres(connection) -> bool:
+    return connection.dialect.name == 'postgresql'
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{IntervalReading.__tablename__}_{month.year:04d}_{month.month:02d}"
+
+
+def ensure_partitions(connection, start: datetime, end: datetime) -> List[str]:
+    """Create the monthly partitions covering [start, end] that do not exist yet"""
+    if not _is_postgres(connection):
+        return []
+    table = IntervalReading.__table__
+    preparer = connection.dialect.identifier_preparer
+    schema = preparer.quote_schema(table.schema)
+
+    created = []
+    month = date(start.year, start.month, 1)
+    while month <= end.date():
+        upper = _next_month(month)
+        name = partition_name(month)
+        connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {schema}.{preparer.quote(name)} "
+            f"PARTITION OF {preparer.format_table(table)} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        ))
+        created.append(name)
+        month = upper
+    return created
+
+
+def list_partitions(connection) -> List[str]:
+    """Names of the partitions attached to interval_reading, oldest first"""
+    if not _is_postgres(connection):
+        return []
+    table = IntervalReading.__table__
+    result = connection.execute(text('''
+        SELECT child.relname
+        FROM pg_inherits i
+        JOIN pg_class parent ON parent.oid = i.inhparent
+        JOIN pg_class child ON child.oid = i.inhrelid
+        JOIN pg_namespace n ON n.oid = parent.relnamespace
+        WHERE n.nspname = :schema AND parent.relname = :table
+        ORDER BY child.relname
+    '''), {'schema': table.schema, 'table': table.name})
+    return [row[0] for row in result]
+
+
+def detach_partitions(connection, before: date, drop: bool = False) -> List[str]:
+    """Detach every partition for a month before `before`.
+
+    Detached partitions stay behind as ordinary tables, ready to be archived
+    (e.g. pg_dump -t) and dropped; with drop=True they are dropped straight away.
+    """
+    table = IntervalReading.__table__
+    preparer = connection.dialect.identifier_preparer
+    schema = preparer.quote_schema(table.schema)
+
+    detached = []
+    for name in list_partitions(connection):
+        match = PARTITION_NAME.search(name)
+        if not match or date(int(match.group(1)), int(match.group(2)), 1) >= before:
+            continue
+        connection.execute(text(
+            f"ALTER TABLE {preparer.format_table(table)} DETACH PARTITION {schema}.{preparer.quote(name)}"
+        ))
+        if drop:
+            connection.execute(text(f"DROP TABLE {schema}.{preparer.quote(name)}"))
+        detached.append(name)
+        logger.info(f"{'Dropped' if drop else 'Detached'} partition {name}")
+    return detached
+
+
+def weather_intervals(processed_df: pd.DataFrame, source: str = 'weather_station') -> pd.DataFrame:
+    """Interval rows for a WeatherDataPreprocessor frame, one series per measurement"""
+    columns = [col for col in WEATHER_SERIES if col in processed_df.columns]
+    long = processed_df[['DATETIME', *columns]].melt(
+        id_vars='DATETIME', var_name='column', value_name='value'
+    ).dropna(subset=['value'])
+
+    series = long['column'].map({col: name for col, (name, _) in WEATHER_SERIES.items()})
+    return pd.DataFrame({
+        'meter_id': f"{source}:" + series,
+        'reading_time': long['DATETIME'],
+        'value': long['value'],
+        'unit': long['column'].map({col: unit for col, (_, unit) in WEATHER_SERIES.items()}),
+        'utility': 'weather',
+        'source': source,
+        'interval_minutes': 5
+    })
+
+
+def load_intervals(engine, data: pd.DataFrame) -> int:
+    """
+    Write interval rows (meter_id, reading_time, value, unit, utility, source,
+    interval_minutes). Partitions for the months covered are created first,
+    and rows already stored for the same meters and time span are replaced,
+    so re-loading a file is idempotent.
+    """
+    data = data.drop_duplicates(subset=['meter_id', 'reading_time'], keep='last')
+    if data.empty:
+        return 0
+    start, end = data['reading_time'].min(), data['reading_time'].max()
+
+    table = IntervalReading.__table__
+    with engine.begin() as connection:
+        table.create(connection, checkfirst=True)
+        ensure_partitions(connection, start, end)
+
+        # Bounded on reading_time, so only the affected partitions are touched
+        connection.execute(
+            delete(table)
+            .where(table.c.reading_time.between(start, end))
+            .where(table.c.meter_id.in_(data['meter_id'].unique().tolist()))
+        )
+        written = write_dataframe(connection, table, data)
+        bump_load_versions(connection, [table])
+
+    logger.info(f"Loaded {written} interval readings from {start} to {end}")
+    # Weather series are not consumption and stay out of the rollups
+    if (data['utility'] != 'weather').any():
+        refresh_rollups_for(engine, [table], period=(start, end))
+    return written
+
+
+def interval_window(connection, meter_id: str, start: datetime, end: datetime) -> list:
+    """
+    Readings of one meter in [start, end). The constant bounds on the
+    partition key let PostgreSQL prune every partition outside the window.
+    """
+    table = IntervalReading.__table__
+    query = (
+        select(table)
+        .where(table.c.meter_id == meter_id)
+        .where(table.c.reading_time >= start)
+        .where(table.c.reading_time < end)
+        .order_by(table.c.reading_time)
+    )
+    return [dict(row) for row in connection.execute(query).mappings()]
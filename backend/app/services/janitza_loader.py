@@ -8,6 +8,8 @@ from ..models.janitza_models import (
     JanitzaUOF8X, JanitzaManualMeters, JanitzaCalculatedConsumption
 )
 from .janitza_processor import JanitzaProcessor
+from .workbook_session import WorkbookSession
+from .incremental_load import load_frames
 from .. import db
 
 class JanitzaLoader:
@@ -23,34 +25,21 @@ class JanitzaLoader:
             connection.commit()
             
     def create_tables(self):
-        """Drop and recreate all Janitza tables"""
-        with self.engine.connect() as connection:
-            # Drop existing tables
-            connection.execute(text('''
-                DROP TABLE IF EXISTS dbo.janitza_med_data CASCADE;
-                DROP TABLE IF EXISTS dbo.janitza_freezer_room CASCADE;
-                DROP TABLE IF EXISTS dbo.janitza_uo_d4f6 CASCADE;
-                DROP TABLE IF EXISTS dbo.janitza_uo_f8x CASCADE;
-                DROP TABLE IF EXISTS dbo.janitza_manual_meters CASCADE;
-                DROP TABLE IF EXISTS dbo.janitza_calculated_consumption CASCADE;
-            '''))
-            connection.commit()
-            
-        # Create tables
-        JanitzaMedData.__table__.create(self.engine)
-        JanitzaFreezerRoom.__table__.create(self.engine)
-        JanitzaUOD4F6.__table__.create(self.engine)
-        JanitzaUOF8X.__table__.create(self.engine)
-        JanitzaManualMeters.__table__.create(self.engine)
-        JanitzaCalculatedConsumption.__table__.create(self.engine)
-    
-    def load_data(self, excel_file: str) -> dict:
+        """Create the Janitza tables if missing; load_data swaps in fresh copies"""
+        with self.engine.begin() as connection:
+            JanitzaMedData.__table__.create(connection, checkfirst=True)
+            JanitzaFreezerRoom.__table__.create(connection, checkfirst=True)
+            JanitzaUOD4F6.__table__.create(connection, checkfirst=True)
+            JanitzaUOF8X.__table__.create(connection, checkfirst=True)
+            JanitzaManualMeters.__table__.create(connection, checkfirst=True)
+            JanitzaCalculatedConsumption.__table__.create(connection, checkfirst=True)
+
+    def load_data(self, excel_file: str, workbook: WorkbookSession = None, incremental: bool = False) -> dict:
         """Load all Janitza data from Excel"""
-        session = self.Session()
         records_count = {}
         
         try:
-            processor = JanitzaProcessor(excel_file)
+            processor = JanitzaProcessor(excel_file, workbook)
             processed_data = processor.load_all_data()
             
             # Map table names to model classes
@@ -63,37 +52,16 @@ class JanitzaLoader:
                 'calculated_consumption': JanitzaCalculatedConsumption
             }
             
-            # Process each table
-            for table_name, data in processed_data.items():
-                model_class = table_models[table_name]
-                records = []
-                
-                for _, row in data.iterrows():
-                    record = model_class(
-                        meter_location=row['meter_location']
-                    )
-                    
-                    # Set values for each month column
-                    for col in data.columns:
-                        if col != 'meter_location':
-                            value = row[col]
-                            if pd.isna(value):
-                                value = None
-                            setattr(record, col, value)
-                    
-                    records.append(record)
-                
-                session.bulk_save_objects(records)
-                records_count[table_name] = len(records)
+            # Swap in fresh tables, or only update changed months when incremental
+            frames = {table_models[name]: data for name, data in processed_data.items()}
+            written = load_frames(self.engine, frames, incremental)
+            for table_name in processed_data:
+                records_count[table_name] = written[table_models[table_name]]
             
-            session.commit()
             return records_count
             
         except Exception as e:
-            session.rollback()
             raise Exception(f"Error loading Janitza data: {str(e)}")
-        finally:
-            session.close()
     
     def verify_data(self) -> dict:
         """Verify loaded data for all tables"""
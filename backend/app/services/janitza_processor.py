@@ -2,10 +2,12 @@
 import pandas as pd
 from typing import Dict, List, Tuple
 import numpy as np
+from .workbook_session import WorkbookSession
 
 class JanitzaProcessor:
-    def __init__(self, excel_file: str):
+    def __init__(self, excel_file: str, workbook: WorkbookSession = None):
         self.excel_file = excel_file
+        self.workbook = workbook or WorkbookSession(excel_file)
         self.raw_data = {}  # Dictionary to store data for each table
         
     def load_all_data(self) -> Dict[str, pd.DataFrame]:
@@ -24,6 +26,10 @@ class JanitzaProcessor:
                 ('calculated_consumption', 549, None)  # None means read until end
             ]
             
+            # Let the workbook stream only as far as the last table needs
+            for table_name, skiprows, nrows in table_configs:
+                self.workbook.plan('Janitza data ', skiprows=skiprows, nrows=nrows, usecols='B:AO')
+
             # Process each table
             for table_name, skiprows, nrows in table_configs:
                 self.raw_data[table_name] = self._process_table(skiprows, nrows, table_name)
@@ -37,9 +43,8 @@ class JanitzaProcessor:
             """Helper method to process individual tables"""
             try:
                 # Read the specific range from Excel
-                df = pd.read_excel(
-                    self.excel_file,
-                    sheet_name='Janitza data ',
+                df = self.workbook.read_sheet(
+                    'Janitza data ',
                     skiprows=skiprows,
                     nrows=nrows,
                     usecols='B:AO'
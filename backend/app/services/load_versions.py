@@ -0,0 +1,56 @@
+# backend/app/services/load_versions.py
+
+from datetime import datetime
+from typing import Dict, Iterable
+
+from sqlalchemy import select
+
+from ..models.load_manifest import LoadVersion
+
+
+def _upsert(connection):
+    """INSERT ... ON CONFLICT for the dialects that have it"""
+    if connection.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif connection.dialect.name == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    return insert
+
+
+def bump_load_versions(connection, tables: Iterable):
+    """Increment the load version of each table, inside the load's transaction.
+
+    Readers cache responses against these versions, so the bump commits
+    together with the data it describes. Each bump is a single upsert, so
+    loaders running in parallel never both insert a table's first row.
+    """
+    versions = LoadVersion.__table__
+    versions.create(connection, checkfirst=True)
+    now = datetime.utcnow()
+    insert = _upsert(connection)
+    # A fixed order keeps concurrent loads from locking rows in opposite orders
+    for name in sorted({getattr(table, 'fullname', table) for table in tables}):
+        if insert is not None:
+            statement = insert(versions).values(table_name=name, version=1, updated_at=now)
+            connection.execute(statement.on_conflict_do_update(
+                index_elements=[versions.c.table_name],
+                set_={'version': versions.c.version + 1, 'updated_at': now}
+            ))
+            continue
+
+        result = connection.execute(
+            versions.update()
+            .where(versions.c.table_name == name)
+            .values(version=versions.c.version + 1, updated_at=now)
+        )
+        if result.rowcount == 0:
+            connection.execute(versions.insert().values(table_name=name, version=1, updated_at=now))
+
+
+def read_load_versions(connection) -> Dict[str, int]:
+    """{table name: version} for every table a loader has written"""
+    versions = LoadVersion.__table__
+    rows = connection.execute(select(versions.c.table_name, versions.c.version)).all()
+    return {name: version for name, version in rows}
@@ -2,10 +2,12 @@
 
 import pandas as pd
 from typing import Dict
+from .workbook_session import WorkbookSession
 
 class LTHWProcessor:
-    def __init__(self, excel_file: str):
+    def __init__(self, excel_file: str, workbook: WorkbookSession = None):
         self.excel_file = excel_file
+        self.workbook = workbook or WorkbookSession(excel_file)
         self.raw_data = {}
 
     def load_all_data(self) -> Dict[str, pd.DataFrame]:
@@ -19,6 +21,10 @@ class LTHWProcessor:
                                        'comments': 'E', 'misc': 'F'})
             ]
 
+            # Let the workbook stream only as far as the last table needs
+            for table_name, skiprows, nrows, columns_map in table_configs:
+                self.workbook.plan('LTHW Data', skiprows=skiprows, nrows=nrows)
+
             for table_name, skiprows, nrows, columns_map in table_configs:
                 self.raw_data[table_name] = self._process_table(skiprows, nrows, table_name, columns_map)
             
@@ -29,9 +35,8 @@ class LTHWProcessor:
 
     def _process_table(self, skiprows: int, nrows: int, table_name: str, columns_map: dict) -> pd.DataFrame:
         try:
-            df = pd.read_excel(
-                self.excel_file,
-                sheet_name='LTHW Data',
+            df = self.workbook.read_sheet(
+                'LTHW Data',
                 skiprows=skiprows,
                 nrows=nrows
             )
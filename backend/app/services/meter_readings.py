@@ -0,0 +1,159 @@
+# backend/app/services/meter_readings.py
+
+import logging
+from datetime import date
+from typing import Iterable, List, Optional
+
+import pandas as pd
+from sqlalchemy import case, delete, func, select, text
+
+from ..models.meter_reading import MeterReading
+from ..models.auckland_electricity import AucklandElectricityCalculatedConsumption
+from ..models.auckland_water import AucklandWaterCalculatedConsumption, AucklandWaterConsumption
+from ..models.cfi_models import CenterForInnovation
+from ..models.gas_models import GasAutomatedMeter, GasManualMeter, GasConsumption
+from ..models.janitza_models import (
+    JanitzaMedData, JanitzaFreezerRoom, JanitzaUOD4F6, JanitzaUOF8X,
+    JanitzaManualMeters, JanitzaCalculatedConsumption
+)
+from ..models.lthw_models import LTHWAutomatedMeter, LTHWManualMeter, LTHWConsumption
+from ..models.mthw_models import MTHWMeterReading, MTHWConsumptionReading
+from .bulk_writer import write_dataframe
+
+logger = logging.getLogger(__name__)
+
+MONTH_NUMBERS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+# Prefix of the views that rebuild a wide table's shape from meter_reading
+VIEW_PREFIX = 'v_'
+
+# Wide model -> (utility, unit, columns identifying the meter on a row)
+LONG_FORMAT_SOURCES = {
+    JanitzaMedData: ('electricity', 'kWh', ['meter_location']),
+    JanitzaFreezerRoom: ('electricity', 'kWh', ['meter_location']),
+    JanitzaUOD4F6: ('electricity', 'kWh', ['meter_location']),
+    JanitzaUOF8X: ('electricity', 'kWh', ['meter_location']),
+    JanitzaManualMeters: ('electricity', 'kWh', ['meter_location']),
+    JanitzaCalculatedConsumption: ('electricity', 'kWh', ['meter_location']),
+    CenterForInnovation: ('electricity', 'kWh', ['building_code', 'location', 'meter_number']),
+    AucklandElectricityCalculatedConsumption: ('electricity', 'kWh', ['meter_location', 'object_name']),
+    AucklandWaterCalculatedConsumption: ('water', 'm3', ['meter_location', 'object_name']),
+    AucklandWaterConsumption: ('water', 'm3', ['object_name']),
+    GasAutomatedMeter: ('gas', 'm3', ['meter_description', 'icp']),
+    GasManualMeter: ('gas', 'm3', ['meter_description']),
+    GasConsumption: ('gas', 'kWh', ['object_description']),
+    LTHWAutomatedMeter: ('lthw', 'kWh', ['object_name']),
+    LTHWManualMeter: ('lthw', 'kWh', ['object_name', 'meter_location']),
+    LTHWConsumption: ('lthw', 'kWh', ['object_name']),
+    MTHWMeterReading: ('mthw', 'kWh', ['meter_location']),
+    MTHWConsumptionReading: ('mthw', 'kWh', ['meter_location']),
+}
+
+
+def month_start(column_name: str) -> Optional[date]:
+    """First day of the month a column such as Jan_2024 holds, None otherwise"""
+    month, _, year = column_name.partition('_')
+    if month not in MONTH_NUMBERS or not year.isdigit() or len(year) != 4:
+        return None
+    return date(int(year), MONTH_NUMBERS[month], 1)
+
+
+def month_columns(model) -> List[str]:
+    return [column.name for column in model.__table__.c if month_start(column.name) is not None]
+
+
+def melt_frame(model, data: pd.DataFrame, source_rows: List[int],
+               months: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """Long-format meter_reading rows for a processed wide frame.
+
+    The meter id joins the row's identifying columns and source_row holds the
+    wide table's id for each frame row, since meter ids are not unique. Empty
+    readings and rows without any identifying value are dropped.
+    """
+    utility, unit, meter_columns = LONG_FORMAT_SOURCES[model]
+    value_columns = [col for col in (months or month_columns(model)) if col in data.columns]
+
+    labels = data.reindex(columns=meter_columns).astype('string').apply(lambda col: col.str.strip())
+    meter_id = labels.apply(lambda row: ' | '.join(v for v in row if pd.notna(v) and v), axis=1)
+
+    values = data[value_columns].apply(pd.to_numeric, errors='coerce')
+    values.insert(0, 'meter_id', meter_id.values)
+    values.insert(1, 'source_row', source_rows)
+    values = values[values['meter_id'] != '']
+
+    long = values.melt(id_vars=['meter_id', 'source_row'], var_name='month_column', value_name='value')
+    long = long.dropna(subset=['value'])
+    long['period_start'] = long['month_column'].map(month_start)
+    long['utility'] = utility
+    long['unit'] = unit
+    long['source'] = model.__table__.name
+    return long[['meter_id', 'utility', 'period_start', 'value', 'unit', 'source', 'source_row']]
+
+
+def replace_source_readings(connection, model, data: pd.DataFrame, months: Optional[List[str]] = None) -> int:
+    """Swap a source table's meter_reading rows for the ones in `data`.
+
+    `data` is the frame the live wide table was loaded from, matched to its
+    rows by load order. With `months`, only those month columns are replaced,
+    as after an incremental load. Runs on the caller's connection and
+    transaction.
+    """
+    readings = MeterReading.__table__
+    table = model.__table__
+    source = table.name
+
+    source_rows = connection.execute(select(table.c.id).order_by(table.c.id)).scalars().all()
+    if len(source_rows) != len(data):
+        raise Exception(
+            f"Error mirroring {table.fullname}: {len(source_rows)} rows loaded, {len(data)} in the frame"
+        )
+
+    condition = readings.c.source == source
+    if months is not None:
+        condition = condition & readings.c.period_start.in_([month_start(col) for col in months])
+    connection.execute(delete(readings).where(condition))
+
+    long = melt_frame(model, data, source_rows, months)
+    written = write_dataframe(connection, readings, long)
+    logger.info(f"Wrote {written} meter_reading rows from {source}")
+    return written
+
+
+def _drop_view(connection, name: str, schema: str):
+    preparer = connection.dialect.identifier_preparer
+    connection.execute(text(f"DROP VIEW IF EXISTS {preparer.quote_schema(schema)}.{preparer.quote(name)}"))
+
+
+def create_compatibility_view(connection, model):
+    """(Re)create v_<table>: one row per row of the wide table, its id and
+    identifying columns with the month columns pivoted back out of meter_reading"""
+    table = model.__table__
+    readings = MeterReading.__table__
+    view_name = f"{VIEW_PREFIX}{table.name}"
+    _, _, meter_columns = LONG_FORMAT_SOURCES[model]
+    months = month_columns(model)
+
+    pivot = select(
+        readings.c.source_row,
+        *[
+            func.max(case((readings.c.period_start == month_start(col), readings.c.value))).label(col)
+            for col in months
+        ]
+    ).where(readings.c.source == table.name).group_by(readings.c.source_row).subquery('readings')
+
+    # Outer join, so rows without any reading keep their place as in the wide table
+    view = select(
+        table.c.id,
+        *[table.c[col] for col in meter_columns],
+        *[pivot.c[col] for col in months]
+    ).select_from(table.outerjoin(pivot, pivot.c.source_row == table.c.id))
+    query = view.compile(dialect=connection.dialect, compile_kwargs={'literal_binds': True})
+
+    preparer = connection.dialect.identifier_preparer
+    _drop_view(connection, view_name, table.schema)
+    connection.execute(text(
+        f"CREATE VIEW {preparer.quote_schema(table.schema)}.{preparer.quote(view_name)} AS {query}"
+    ))
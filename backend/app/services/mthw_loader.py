@@ -9,6 +9,8 @@ from app.models.mthw_models import (
 )
 from .. import db
 from .mthw_processor import MTHWProcessor
+from .workbook_session import WorkbookSession
+from .incremental_load import load_frames
 
 class MTHWLoader:
     def __init__(self, db_url: str):
@@ -22,22 +24,16 @@ class MTHWLoader:
             connection.commit()
 
     def create_tables(self):
-        with self.engine.connect() as connection:
-            connection.execute(text('''
-                DROP TABLE IF EXISTS dbo.mthw_meter_reading CASCADE;
-                DROP TABLE IF EXISTS dbo.mthw_consumption_reading CASCADE;
-            '''))
-            connection.commit()
+        """Create the MTHW tables if missing; load_data swaps in fresh copies"""
+        with self.engine.begin() as connection:
+            MTHWMeterReading.__table__.create(connection, checkfirst=True)
+            MTHWConsumptionReading.__table__.create(connection, checkfirst=True)
 
-        MTHWMeterReading.__table__.create(self.engine)
-        MTHWConsumptionReading.__table__.create(self.engine)
-
-    def load_data(self, excel_file: str) -> dict:
-        session = self.Session()
+    def load_data(self, excel_file: str, workbook: WorkbookSession = None, incremental: bool = False) -> dict:
         records_count = {}
 
         try:
-            processor = MTHWProcessor(excel_file)
+            processor = MTHWProcessor(excel_file, workbook)
             processed_data = processor.load_all_data()
 
             table_models = {
@@ -45,30 +41,16 @@ class MTHWLoader:
                 'consumption_reading': MTHWConsumptionReading
             }
 
-            for table_name, data in processed_data.items():
-                model_class = table_models[table_name]
-                records = []
+            # Swap in fresh tables, or only update changed months when incremental
+            frames = {table_models[name]: data for name, data in processed_data.items()}
+            written = load_frames(self.engine, frames, incremental)
+            for table_name in processed_data:
+                records_count[table_name] = written[table_models[table_name]]
 
-                for _, row in data.iterrows():
-                    record = model_class()
-                    for col in data.columns:
-                        value = row[col]
-                        if pd.isna(value):
-                            value = None
-                        setattr(record, col, value)
-                    records.append(record)
-
-                session.bulk_save_objects(records)
-                records_count[table_name] = len(records)
-
-            session.commit()
             return records_count
 
         except Exception as e:
-            session.rollback()
             raise Exception(f"Error loading MTHW data: {str(e)}")
-        finally:
-            session.close()
 
     def verify_data(self) -> dict:
         session = self.Session()
@@ -2,14 +2,20 @@
 
 import pandas as pd
 from typing import Dict
+from .workbook_session import WorkbookSession
 
 class MTHWProcessor:
-    def __init__(self, excel_file: str):
+    def __init__(self, excel_file: str, workbook: WorkbookSession = None):
         self.excel_file = excel_file
+        self.workbook = workbook or WorkbookSession(excel_file)
         self.raw_data = {}
 
     def load_all_data(self) -> Dict[str, pd.DataFrame]:
         try:
+            # Let the workbook stream only as far as the consumption table needs
+            self.workbook.plan('MTHW Data', skiprows=30, nrows=32, usecols='A:AS')
+            self.workbook.plan('MTHW Data', skiprows=74, nrows=29, usecols='A:AV')
+
             # Process meter reading data
             meter_reading_df = self._process_meter_reading()
             self.raw_data['meter_reading'] = meter_reading_df
@@ -25,9 +31,8 @@ class MTHWProcessor:
     def _process_meter_reading(self) -> pd.DataFrame:
         try:
             # Read excel data for meter reading
-            df = pd.read_excel(
-                self.excel_file,
-                sheet_name='MTHW Data',
+            df = self.workbook.read_sheet(
+                'MTHW Data',
                 skiprows=30,
                 nrows=32,
                 usecols='A:AS'
@@ -73,9 +78,8 @@ class MTHWProcessor:
     def _process_consumption_reading(self) -> pd.DataFrame:
         try:
             # Read excel data for consumption reading
-            df = pd.read_excel(
-                self.excel_file,
-                sheet_name='MTHW Data',
+            df = self.workbook.read_sheet(
+                'MTHW Data',
                 skiprows=74,
                 nrows=29,
                 usecols='A:AV'
@@ -0,0 +1,315 @@
+# backend/app/services/rollups.py
+
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Optional
+
+import pandas as pd
+from sqlalchemy import and_, delete, func, inspect, literal, or_, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..models.energy_total_models import EnergyTotalDashboard
+from ..models.steam_mthw import SteamMTHWReading
+from ..models.meter_reading import MeterReading
+from ..models.interval_reading import IntervalReading
+from ..models.rollup_models import EnergyYearlyRollup, SteamMTHWYearlyRollup, ConsumptionRollup
+from .bulk_writer import write_dataframe
+from .load_versions import bump_load_versions
+from .table_swap import staged_tables
+
+logger = logging.getLogger(__name__)
+
+# meter_reading sources holding consumption per month rather than cumulative
+# meter readings; only these can be summed
+CONSUMPTION_SOURCES = (
+    'janitza_calculated_consumption',
+    'gas_consumption',
+    'lthw_consumption',
+    'mthw_consumption_reading',
+    'auckland_electricity_calculated_consumption',
+    'auckland_water_calculated_consumption',
+)
+
+# Building code at the start of a meter id, e.g. "D201 Adams & Sayers:"
+BUILDING_CODE = r'^\s*([A-Z]\d{3})\b'
+
+
+def _has_table(connection, model) -> bool:
+    table = model.__table__
+    return inspect(connection).has_table(table.name, schema=table.schema)
+
+
+def _yearly_select(model, sums: dict):
+    """One set-based GROUP BY year over a row-per-month table"""
+    table = model.__table__
+    return select(
+        table.c.year,
+        *[func.sum(table.c[column]).label(name) for name, column in sums.items()],
+        func.count().label('months'),
+        literal(datetime.utcnow()).label('refreshed_at')
+    ).group_by(table.c.year)
+
+
+ENERGY_SUMS = {
+    'total_electricity': 'total_stream_dn_electricity_kwh',
+    'total_mthw': 'mthw_kwh',
+    'total_steam': 'steam_kwh',
+    'total_lpg': 'lpg_kwh',
+    'total_woodchip': 'woodchip_pellet_kwh',
+    'total_solar': 'solar_kwh',
+    'total_energy': 'total_kwh',
+}
+
+STEAM_MTHW_SUMS = {
+    'total_mthw_consumption': 'mthw_consumption_kwh',
+    'total_steam_consumption': 'total_steam_consumption_kwh',
+    'med_school_consumption': 'med_school_consumption_kwh',
+    'cumberland_consumption': 'cumberland_d401_d404_consumption_kwh',
+}
+
+
+def _building_rollup(frame: pd.DataFrame, grain: str) -> pd.DataFrame:
+    """Sum meter values per (period, utility, building, unit)"""
+    if frame.empty:
+        return frame
+    frame = frame.assign(building=frame['meter_id'].str.extract(BUILDING_CODE, expand=False))
+    rollup = frame.groupby(
+        ['period_start', 'utility', 'building', 'unit'], dropna=False, sort=False
+    ).agg(value=('value', lambda v: v.sum(min_count=1)), meters=('meter_id', 'nunique')).reset_index()
+    rollup['grain'] = grain
+    return rollup
+
+
+def _monthly_consumption(connection) -> list:
+    """Month and year rollup frames from the consumption sources in meter_reading"""
+    if not _has_table(connection, MeterReading):
+        return []
+    readings = MeterReading.__table__
+    monthly = pd.read_sql(
+        select(readings.c.meter_id, readings.c.utility, readings.c.unit,
+               readings.c.period_start, readings.c.value)
+        .where(readings.c.source.in_(CONSUMPTION_SOURCES))
+        # Summary rows such as " Total Gas Energy - DN" would double count
+        .where(func.lower(func.trim(readings.c.meter_id)).notlike('total%')),
+        connection
+    )
+    if monthly.empty:
+        return []
+    monthly['period_start'] = pd.to_datetime(monthly['period_start'])
+    yearly = monthly.assign(period_start=monthly['period_start'].dt.to_period('Y').dt.start_time)
+    return [_building_rollup(monthly, 'month'), _building_rollup(yearly, 'year')]
+
+
+def _daily_consumption(connection, first: Optional[date] = None, last: Optional[date] = None) -> list:
+    """Day rollup frames from interval_reading, only for the days first..last
+    when given; the bounds on reading_time let PostgreSQL skip every other
+    partition"""
+    if not _has_table(connection, IntervalReading):
+        return []
+    # Reduced to one row per meter and day in the database before building lookup
+    intervals = IntervalReading.__table__
+    day = func.date(intervals.c.reading_time)
+    query = (
+        select(intervals.c.meter_id, intervals.c.utility, intervals.c.unit,
+               day.label('period_start'), func.sum(intervals.c.value).label('value'))
+        .where(intervals.c.utility != 'weather')
+        .group_by(intervals.c.meter_id, intervals.c.utility, intervals.c.unit, day)
+    )
+    if first is not None:
+        query = query.where(intervals.c.reading_time >= datetime.combine(first, time()))
+    if last is not None:
+        query = query.where(intervals.c.reading_time < datetime.combine(last + timedelta(days=1), time()))
+    daily = pd.read_sql(query, connection)
+    if daily.empty:
+        return []
+    daily['period_start'] = pd.to_datetime(daily['period_start'])
+    return [_building_rollup(daily, 'day')]
+
+
+def _rollup_frame(frames: list) -> pd.DataFrame:
+    if not frames:
+        return pd.DataFrame(columns=['grain', 'period_start', 'utility', 'building', 'unit', 'value', 'meters'])
+    return pd.concat(frames, ignore_index=True)
+
+
+def build_consumption_rollup(connection) -> pd.DataFrame:
+    """Day, month and year rows for every utility and building"""
+    return _rollup_frame(_monthly_consumption(connection) + _daily_consumption(connection))
+
+
+# Rollup table -> tables it summarises
+ROLLUP_SOURCES = {
+    EnergyYearlyRollup: (EnergyTotalDashboard,),
+    SteamMTHWYearlyRollup: (SteamMTHWReading,),
+    ConsumptionRollup: (MeterReading, IntervalReading),
+}
+
+YEARLY_ROLLUPS = {
+    EnergyYearlyRollup: (EnergyTotalDashboard, ENERGY_SUMS),
+    SteamMTHWYearlyRollup: (SteamMTHWReading, STEAM_MTHW_SUMS),
+}
+
+# Loaders in parallel threads would otherwise swap the same shadow tables
+_refresh_lock = threading.Lock()
+_refresh_deferred = threading.Event()
+
+
+def refresh_rollups(engine, models: Optional[Iterable] = None) -> dict:
+    """Rebuild the given rollup tables (all by default) from the loaded data
+    in one transaction"""
+    models = list(models or ROLLUP_SOURCES)
+    counts = {}
+    with _refresh_lock, staged_tables(engine, models) as (connection, shadows):
+        for model in models:
+            if model is ConsumptionRollup:
+                counts[model.__tablename__] = write_dataframe(
+                    connection, shadows[model], build_consumption_rollup(connection)
+                )
+                continue
+
+            source, sums = YEARLY_ROLLUPS[model]
+            if not _has_table(connection, source):
+                counts[model.__tablename__] = 0
+                continue
+            shadow = shadows[model]
+            query = _yearly_select(source, sums)
+            result = connection.execute(
+                shadow.insert().from_select([column.name for column in query.selected_columns], query)
+            )
+            counts[model.__tablename__] = result.rowcount
+
+    logger.info(f"Refreshed rollups: {counts}")
+    return counts
+
+
+def refresh_consumption_rollup(engine, monthly: bool, days: Optional[tuple] = None) -> dict:
+    """
+    Rebuild part of consumption_rollup in place: the month and year rows
+    when `monthly`, and the day rows of days=(first, last), either bound
+    None for open-ended. Every other row
+    is left alone, so an interval load costs the days it wrote rather than
+    the whole history. The first refresh builds the whole table.
+    """
+    with engine.connect() as connection:
+        built = _has_table(connection, ConsumptionRollup)
+    if not built:
+        return refresh_rollups(engine, [ConsumptionRollup])
+
+    rollup = ConsumptionRollup.__table__
+    frames, replaced = [], []
+    with _refresh_lock, engine.begin() as connection:
+        if monthly:
+            frames += _monthly_consumption(connection)
+            replaced.append(rollup.c.grain.in_(['month', 'year']))
+        if days is not None:
+            first, last = days
+            frames += _daily_consumption(connection, first, last)
+            condition = rollup.c.grain == 'day'
+            if first is not None:
+                condition = and_(condition, rollup.c.period_start >= first)
+            if last is not None:
+                condition = and_(condition, rollup.c.period_start <= last)
+            replaced.append(condition)
+        if not replaced:
+            return {}
+
+        connection.execute(delete(rollup).where(or_(*replaced)))
+        written = write_dataframe(connection, rollup, _rollup_frame(frames))
+        bump_load_versions(connection, [rollup])
+
+    logger.info(f"Refreshed {written} consumption rollup rows")
+    return {ConsumptionRollup.__tablename__: written}
+
+
+def _day_range(period) -> tuple:
+    """First and last day of a (start, end) reading_time range"""
+    start, end = period
+    return pd.Timestamp(start).date(), pd.Timestamp(end).date()
+
+
+def refresh_rollups_for(engine, tables: Iterable, period: Optional[tuple] = None) -> dict:
+    """
+    Refresh the rollups summarising any of `tables`, after their load has
+    committed. period=(start, end) is the span of interval readings the
+    load replaced; only those days of the day grain are rebuilt. The
+    refresh bumps the rollups' load versions, so cached responses built
+    from the old summaries are dropped.
+    """
+    names = {getattr(table, 'fullname', table) for table in tables}
+    if _refresh_deferred.is_set():
+        _defer(names, period)
+        return {}
+
+    yearly = [
+        model for model, (source, _) in YEARLY_ROLLUPS.items()
+        if source.__table__.fullname in names
+    ]
+    counts = refresh_rollups(engine, yearly) if yearly else {}
+
+    monthly = MeterReading.__table__.fullname in names
+    days = None
+    if IntervalReading.__table__.fullname in names:
+        # Without a span every day is rebuilt
+        days = _day_range(period) if period is not None else (None, None)
+    if monthly or days is not None:
+        counts.update(refresh_consumption_rollup(engine, monthly, days))
+    return counts
+
+
+# Refreshes held back by deferred_rollups: table name -> reading_time span
+# of the changes, None for the whole table
+_pending = {}
+_pending_lock = threading.Lock()
+
+
+def _defer(names, period):
+    with _pending_lock:
+        for name in names:
+            if name in _pending and (_pending[name] is None or period is None):
+                _pending[name] = None
+            elif name in _pending:
+                earlier = _pending[name]
+                _pending[name] = (min(earlier[0], period[0]), max(earlier[1], period[1]))
+            else:
+                _pending[name] = period
+
+
+@contextmanager
+def deferred_rollups(engine=None):
+    """
+    Hold back the refresh after each load. With an engine, the refreshes the
+    loads asked for are merged and run once on exit, e.g. one refresh over
+    every chunk of an interval backfill. Without one they are dropped, for a
+    pipeline that rebuilds all rollups once everything has loaded.
+    """
+    _refresh_deferred.set()
+    try:
+        yield
+    finally:
+        _refresh_deferred.clear()
+        with _pending_lock:
+            pending = dict(_pending)
+            _pending.clear()
+
+    if engine is not None:
+        periods = {period for period in pending.values()}
+        for period in periods:
+            refresh_rollups_for(engine, [name for name, p in pending.items() if p == period], period)
+
+
+def latest_yearly_rollup(session, model) -> Optional[dict]:
+    """Totals of the most recent year in a yearly rollup table, None when the
+    rollups have not been built yet"""
+    try:
+        latest = session.query(model).order_by(model.year.desc()).first()
+    except SQLAlchemyError as e:
+        session.rollback()
+        logger.warning(f"{model.__tablename__} unavailable: {str(e)}")
+        return None
+    if latest is None:
+        return None
+    summary = latest.to_dict()
+    del summary['months'], summary['refreshed_at']
+    return summary
@@ -0,0 +1,106 @@
+# backend/app/services/schema_upgrade.py
+
+import logging
+from datetime import datetime
+from typing import List
+
+import pandas as pd
+from sqlalchemy import inspect, select, text
+
+from ..models.steam_mthw import SteamMTHWReading
+from ..models.energy_total_models import EnergyTotalDashboard
+from ..models.meter_reading import MeterReading
+from .meter_readings import LONG_FORMAT_SOURCES, create_compatibility_view, replace_source_readings
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory_xact_lock key serialising upgrades from concurrent loaders
+UPGRADE_LOCK_KEY = 0x75656d73
+
+
+def add_missing_columns(connection, model) -> List[str]:
+    """ALTER TABLE ... ADD COLUMN for model columns an existing table lacks,
+    then create its missing indexes. Returns the names of the added columns."""
+    table = model.__table__
+    inspector = inspect(connection)
+    if not inspector.has_table(table.name, schema=table.schema):
+        return []
+
+    existing = {column['name'] for column in inspector.get_columns(table.name, schema=table.schema)}
+    preparer = connection.dialect.identifier_preparer
+    added = []
+    for column in table.columns:
+        if column.name in existing:
+            continue
+        if not column.nullable:
+            raise Exception(f"Error upgrading {table.fullname}: cannot add NOT NULL column {column.name}")
+        connection.execute(text(
+            f"ALTER TABLE {preparer.format_table(table)} "
+            f"ADD COLUMN {preparer.quote(column.name)} {column.type.compile(dialect=connection.dialect)}"
+        ))
+        added.append(column.name)
+
+    indexes = {index['name'] for index in inspector.get_indexes(table.name, schema=table.schema)}
+    for index in table.indexes:
+        if index.name not in indexes:
+            index.create(connection)
+
+    if added:
+        logger.info(f"Added {', '.join(added)} to {table.fullname}")
+    return added
+
+
+def _backfill_period(connection, model):
+    """Fill period from the year and three-letter month of the existing rows"""
+    table = model.__table__
+    months = connection.execute(
+        select(table.c.year, table.c.month).where(table.c.period.is_(None)).distinct()
+    ).all()
+    for year, month in months:
+        try:
+            period = datetime.strptime(f"{year}{month}", '%Y%b').date()
+        except (TypeError, ValueError):
+            continue
+        connection.execute(
+            table.update()
+            .where(table.c.year == year, table.c.month == month, table.c.period.is_(None))
+            .values(period=period)
+        )
+
+
+def _remirror_sources(connection, model):
+    """Rewrite meter_reading and the views from the live wide tables, so every
+    reading carries the id of its source row"""
+    for source in LONG_FORMAT_SOURCES:
+        table = source.__table__
+        if not inspect(connection).has_table(table.name, schema=table.schema):
+            continue
+        data = pd.read_sql(select(table).order_by(table.c.id), connection)
+        replace_source_readings(connection, source, data)
+        create_compatibility_view(connection, source)
+
+
+# Model -> {column added after the table first shipped: fills it for existing rows}
+UPGRADES = {
+    SteamMTHWReading: {'period': _backfill_period},
+    EnergyTotalDashboard: {'period': _backfill_period},
+    # Rewrites all of meter_reading and the views once; upgrade_schema is
+    # only run by ingest and the loaders, so web workers never race on it
+    MeterReading: {'source_row': _remirror_sources},
+}
+
+
+def upgrade_schema(connection):
+    """Bring tables created by an older version up to the current models.
+
+    Run by scripts/ingest.py and before loads, never at web app startup:
+    the backfills rewrite whole tables. On PostgreSQL a transaction-level
+    advisory lock makes concurrent callers wait, and the columns are
+    inspected only once it is held, so each column is added exactly once.
+    """
+    if connection.dialect.name == 'postgresql':
+        connection.execute(text('SELECT pg_advisory_xact_lock(:key)'), {'key': UPGRADE_LOCK_KEY})
+    for model, backfills in UPGRADES.items():
+        for column in add_missing_columns(connection, model):
+            if column in backfills:
+                backfills[column](connection, model)
@@ -4,6 +4,9 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from ..models.steam_mthw import SteamMTHWReading
 from .steam_mthw_processor import SteamMTHWProcessor
+from .workbook_session import WorkbookSession
+from .bulk_writer import write_dataframe
+from .table_swap import staged_tables
 import pandas as pd
 
 class SteamMTHWLoader:
@@ -18,61 +21,21 @@ class SteamMTHWLoader:
             connection.commit()
             
     def recreate_tables(self):
-        """Drop and recreate only the steam_mthw_readings table"""
-        with self.engine.connect() as connection:
-            # Drop only this specific table
-            connection.execute(text('''
-                DROP TABLE IF EXISTS dbo.steam_mthw_readings CASCADE;
-            '''))
-            connection.commit()
-        
-        # Create only this table
-        SteamMTHWReading.__table__.create(self.engine)
-            
-    def load_data(self, excel_file: str) -> int:
+        """Create the steam_mthw_readings table if missing; load_data swaps in fresh copies"""
+        with self.engine.begin() as connection:
+            SteamMTHWReading.__table__.create(connection, checkfirst=True)
+
+    def load_data(self, excel_file: str, workbook: WorkbookSession = None) -> int:
         """Load data from Excel to database"""
-        session = self.Session()
         try:
-            processor = SteamMTHWProcessor(excel_file)
+            processor = SteamMTHWProcessor(excel_file, workbook)
             raw_data = processor.load_data()
-            
-            records = []
-            for _, row in raw_data.iterrows():
-                record = SteamMTHWReading(
-                    month=row['month'],
-                    year=row['year'],
-                    mthw_consumption_kwh=row['mthw_consumption_kwh'],
-                    castle_192_reading_kwh=row['castle_192_reading_kwh'],
-                    castle_192_consumption_kwh=row['castle_192_consumption_kwh'],
-                    med_school_a_reading_kg=row['med_school_a_reading_kg'],
-                    med_school_a_reading_kwh=row['med_school_a_reading_kwh'],
-                    med_school_a_consumption_kg=row['med_school_a_consumption_kg'],
-                    med_school_a_consumption_kwh=row['med_school_a_consumption_kwh'],
-                    med_school_b_reading_kg=row['med_school_b_reading_kg'],
-                    med_school_b_reading_kwh=row['med_school_b_reading_kwh'],
-                    med_school_b_consumption_kg=row['med_school_b_consumption_kg'],
-                    med_school_b_consumption_kwh=row['med_school_b_consumption_kwh'],
-                    med_school_consumption_kg=row['med_school_consumption_kg'],
-                    med_school_consumption_kwh=row['med_school_consumption_kwh'],
-                    cumberland_d401_dining_reading_kg=row['cumberland_d401_dining_reading_kg'],
-                    cumberland_d404_castle_reading_kg=row['cumberland_d404_castle_reading_kg'],
-                    cumberland_d401_d404_consumption_kg=row['cumberland_d401_d404_consumption_kg'],
-                    cumberland_d401_d404_consumption_kwh=row['cumberland_d401_d404_consumption_kwh'],
-                    total_steam_consumption_kwh=row['total_steam_consumption_kwh']
-                )
-                records.append(record)
-            
-            session.bulk_save_objects(records)
-            session.commit()
-            
-            return len(records)
-            
+
+            with staged_tables(self.engine, [SteamMTHWReading]) as (connection, shadows):
+                return write_dataframe(connection, shadows[SteamMTHWReading], raw_data)
+
         except Exception as e:
-            session.rollback()
             raise Exception(f"Error loading Steam and MTHW data: {str(e)}")
-        
-        finally:
-            session.close()
             
     def verify_data(self) -> dict:
         """Verify loaded data"""
@@ -5,10 +5,12 @@ from typing import Dict
 import numpy as np
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
+from .workbook_session import WorkbookSession
 
 class SteamMTHWProcessor:
-    def __init__(self, excel_file: str):
+    def __init__(self, excel_file: str, workbook: WorkbookSession = None):
         self.excel_file = excel_file
+        self.workbook = workbook or WorkbookSession(excel_file)
         self.raw_data = None
         
     def generate_date_sequence(self, start_date: str = '2013-10-01', periods: int = 138):
@@ -16,7 +18,8 @@ class SteamMTHWProcessor:
         dates = pd.date_range(start=start_date, periods=periods, freq='M')
         return pd.DataFrame({
             'month': dates.strftime('%b'),
-            'year': dates.year
+            'year': dates.year,
+            'period': dates.to_period('M').to_timestamp()
         })
         
     def load_data(self) -> pd.DataFrame:
@@ -26,9 +29,8 @@ class SteamMTHWProcessor:
         """
         try:
             # Read the specific range from Excel
-            df = pd.read_excel(
-                self.excel_file,
-                sheet_name='Steam and MTHW',
+            df = self.workbook.read_sheet(
+                'Steam and MTHW',
                 skiprows=3,     # Skip to actual data rows
                 nrows=138,      # Read 138 rows
                 usecols='C:T'   # Columns C through T
@@ -72,11 +74,7 @@ class SteamMTHWProcessor:
             result_df = pd.concat([date_df, df], axis=1)
             
             # Set future dates to null
-            current_date = datetime.now()
-            for idx, row in result_df.iterrows():
-                row_date = datetime.strptime(f"{row['month']} {row['year']}", '%b %Y')
-                if row_date > current_date:
-                    result_df.loc[idx, df.columns] = None
+            result_df.loc[result_df['period'] > datetime.now(), df.columns] = None
             
             self.raw_data = result_df
             return self.raw_data
@@ -105,7 +103,7 @@ class SteamMTHWProcessor:
                     'null_count': self.raw_data[col].isnull().sum()
                 }
                 for col in self.raw_data.columns 
-                if col not in ['month', 'year']
+                if col not in ['month', 'year', 'period']
             }
         }
         
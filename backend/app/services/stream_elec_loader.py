@@ -11,6 +11,8 @@ from ..models.stream_elec_models import (
     ItsServersStream, SchoolOfMedicineChChStream, CommerceStream
 )
 from .stream_elec_processor import StreamElecProcessor
+from .workbook_session import WorkbookSession
+from .incremental_load import load_frames
 from .. import db
 
 class StreamElecLoader:
@@ -25,41 +27,25 @@ class StreamElecLoader:
             connection.commit()
 
     def create_tables(self):
-        with self.engine.connect() as connection:
-            connection.execute(text('''
-                DROP TABLE IF EXISTS dbo.ring_mains_stream CASCADE;
-                DROP TABLE IF EXISTS dbo.libraries_stream CASCADE;
-                DROP TABLE IF EXISTS dbo.colleges_stream CASCADE;
-                DROP TABLE IF EXISTS dbo.science_stream CASCADE;
-                DROP TABLE IF EXISTS dbo.health_science_stream CASCADE;
-                DROP TABLE IF EXISTS dbo.humanities_stream CASCADE;
-                DROP TABLE IF EXISTS dbo.obs_psychology_stream CASCADE;
-                DROP TABLE IF EXISTS dbo.total_stream_dn_electricity CASCADE;
-                DROP TABLE IF EXISTS dbo.its_servers_stream CASCADE;
-                DROP TABLE IF EXISTS dbo.school_of_medicine_chch_stream CASCADE;
-                DROP TABLE IF EXISTS dbo.commerce_stream CASCADE;
-            '''))
-            connection.commit()
+        """Create the Stream Electricity tables if missing; load_data swaps in fresh copies"""
+        with self.engine.begin() as connection:
+            RingMainsStream.__table__.create(connection, checkfirst=True)
+            LibrariesStream.__table__.create(connection, checkfirst=True)
+            CollegesStream.__table__.create(connection, checkfirst=True)
+            ScienceStream.__table__.create(connection, checkfirst=True)
+            HealthScienceStream.__table__.create(connection, checkfirst=True)
+            HumanitiesStream.__table__.create(connection, checkfirst=True)
+            ObsPsychologyStream.__table__.create(connection, checkfirst=True)
+            TotalStreamDnElectricity.__table__.create(connection, checkfirst=True)
+            ItsServersStream.__table__.create(connection, checkfirst=True)
+            SchoolOfMedicineChChStream.__table__.create(connection, checkfirst=True)
+            CommerceStream.__table__.create(connection, checkfirst=True)
 
-            # Create all tables
-            RingMainsStream.__table__.create(self.engine)
-            LibrariesStream.__table__.create(self.engine)
-            CollegesStream.__table__.create(self.engine)
-            ScienceStream.__table__.create(self.engine)
-            HealthScienceStream.__table__.create(self.engine)
-            HumanitiesStream.__table__.create(self.engine)
-            ObsPsychologyStream.__table__.create(self.engine)
-            TotalStreamDnElectricity.__table__.create(self.engine)
-            ItsServersStream.__table__.create(self.engine)
-            SchoolOfMedicineChChStream.__table__.create(self.engine)
-            CommerceStream.__table__.create(self.engine)
-
-    def load_data(self, excel_file: str) -> dict:
-        session = self.Session()
+    def load_data(self, excel_file: str, workbook: WorkbookSession = None, incremental: bool = False) -> dict:
         records_count = {}
 
         try:
-            processor = StreamElecProcessor(excel_file)
+            processor = StreamElecProcessor(excel_file, workbook)
             processed_data = processor.load_all_data()
 
             table_models = {
@@ -76,30 +62,16 @@ class StreamElecLoader:
                 'commerce': CommerceStream
             }
 
-            for table_name, data in processed_data.items():
-                model_class = table_models[table_name]
-                records = []
+            # Swap in fresh tables, or only update changed months when incremental
+            frames = {table_models[name]: data for name, data in processed_data.items()}
+            written = load_frames(self.engine, frames, incremental)
+            for table_name in processed_data:
+                records_count[table_name] = written[table_models[table_name]]
 
-                for _, row in data.iterrows():
-                    record = model_class()
-                    for col in data.columns:
-                        value = row[col]
-                        if pd.isna(value):
-                            value = None
-                        setattr(record, col, value)
-                    records.append(record)
-
-                session.bulk_save_objects(records)
-                records_count[table_name] = len(records)
-
-            session.commit()
             return records_count
 
         except Exception as e:
-            session.rollback()
             raise Exception(f"Error loading Stream Electricity data: {str(e)}")
-        finally:
-            session.close()
 
     def verify_data(self) -> dict:
         session = self.Session()
@@ -4,10 +4,12 @@ import pandas as pd
 import numpy as np
 from typing import Dict
 from datetime import datetime, date
+from .workbook_session import WorkbookSession
 
 class StreamElecProcessor:
-    def __init__(self, excel_file: str):
+    def __init__(self, excel_file: str, workbook: WorkbookSession = None):
         self.excel_file = excel_file
+        self.workbook = workbook or WorkbookSession(excel_file)
         self.raw_data = {}
         
     def generate_date_columns(self) -> tuple:
@@ -30,8 +32,8 @@ class StreamElecProcessor:
             months, years = self.generate_date_columns()
             
             # Load both sheets
-            stream_df = pd.read_excel(self.excel_file, sheet_name='Stream Elec Data')
-            janitza_df = pd.read_excel(self.excel_file, sheet_name='Janitza data ')
+            stream_df = self.workbook.read_sheet('Stream Elec Data')
+            janitza_df = self.workbook.read_sheet('Janitza data ')
             
             # Process each table
             self.raw_data['ring_mains'] = self._process_ring_mains(stream_df, months, years)
@@ -0,0 +1,200 @@
+# backend/app/services/table_swap.py
+
+import logging
+import re
+from contextlib import contextmanager
+from typing import Dict, Iterable, List
+
+from sqlalchemy import MetaData, Table, inspect, text
+
+from .load_versions import bump_load_versions
+
+logger = logging.getLogger(__name__)
+
+# Suffix for the shadow copy a load writes into before it is swapped live
+SHADOW_SUFFIX = '__staging'
+
+# The query of a CREATE VIEW statement as SQLite stores it in sqlite_master
+VIEW_DEFINITION = re.compile(
+    r'^\s*CREATE\s+VIEW\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:"[^"]*"|\S+)(?:\s*\([^)]*\))?\s+AS\s+(.*)$',
+    re.IGNORECASE | re.DOTALL
+)
+
+
+def _resolve_table(model) -> Table:
+    """Accept either a model class or a Table"""
+    return getattr(model, '__table__', model)
+
+
+def _rename_dependents(connection, table: Table, shadow_name: str):
+    """Give the swapped-in table's indexes and sequences their live names.
+
+    PostgreSQL keeps the names the shadow table was created with (e.g.
+    ring_mains_stream__staging_pkey), which would collide with the next load's
+    shadow table, so strip the suffix once the old live objects are gone.
+    """
+    result = connection.execute(text('''
+        SELECT c.relname, c.relkind
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = :schema
+          AND c.relkind IN ('i', 'S')
+          AND left(c.relname, length(:prefix)) = :prefix
+    '''), {'schema': table.schema or 'public', 'prefix': shadow_name})
+
+    preparer = connection.dialect.identifier_preparer
+    schema = preparer.quote_schema(table.schema or 'public')
+    for relname, relkind in result.fetchall():
+        new_name = table.name + relname[len(shadow_name):]
+        kind = 'INDEX' if relkind == 'i' else 'SEQUENCE'
+        connection.execute(text(
+            f"ALTER {kind} {schema}.{preparer.quote(relname)} RENAME TO {preparer.quote(new_name)}"
+        ))
+
+
+def _rename_indexes(connection, table: Table, shadow: Table):
+    """Give the model's named indexes their live names back after a swap.
+
+    PostgreSQL renames in place; other databases cannot rename an index, so
+    it is rebuilt under the live name.
+    """
+    preparer = connection.dialect.identifier_preparer
+    schema = f"{preparer.quote_schema(table.schema)}." if table.schema else ''
+    for index in shadow.indexes:
+        live_name = shadow.info['index_names'][index.name]
+        if connection.dialect.name == 'postgresql':
+            connection.execute(text(
+                f"ALTER INDEX {schema}{preparer.quote(index.name)} RENAME TO {preparer.quote(live_name)}"
+            ))
+            continue
+        columns = ', '.join(preparer.quote(column.name) for column in index.columns)
+        unique = 'UNIQUE ' if index.unique else ''
+        connection.execute(text(f"DROP INDEX {schema}{preparer.quote(index.name)}"))
+        connection.execute(text(
+            f"CREATE {unique}INDEX {schema}{preparer.quote(live_name)} "
+            f"ON {preparer.quote(table.name)} ({columns})"
+        ))
+
+
+def _dependent_views(connection, table: Table) -> List[tuple]:
+    """(schema, name, relkind, definition) of the views built on the table, in
+    the order they can be created.
+
+    PostgreSQL records dependencies, so only views reading the table, directly
+    or through other views, are listed. SQLite does not, so every view in the
+    table's schema is, in the order they were created.
+    """
+    if connection.dialect.name != 'postgresql':
+        master = f"{connection.dialect.identifier_preparer.quote_schema(table.schema)}.sqlite_master" \
+            if table.schema else 'sqlite_master'
+        result = connection.execute(text(f"SELECT name, sql FROM {master} WHERE type = 'view' ORDER BY rowid"))
+        return [(table.schema, name, 'v', VIEW_DEFINITION.match(sql).group(1)) for name, sql in result]
+
+    result = connection.execute(text('''
+        WITH RECURSIVE dependents(oid, depth) AS (
+            SELECT r.ev_class, 1
+            FROM pg_depend d
+            JOIN pg_rewrite r ON r.oid = d.objid
+            WHERE d.classid = 'pg_rewrite'::regclass
+              AND d.refobjid = CAST(:table AS regclass)
+              AND r.ev_class <> d.refobjid
+            UNION
+            SELECT r.ev_class, dependents.depth + 1
+            FROM dependents
+            JOIN pg_depend d ON d.refobjid = dependents.oid
+            JOIN pg_rewrite r ON r.oid = d.objid
+            WHERE d.classid = 'pg_rewrite'::regclass
+              AND r.ev_class <> d.refobjid
+        )
+        SELECT n.nspname, c.relname, c.relkind, pg_get_viewdef(c.oid)
+        FROM dependents
+        JOIN pg_class c ON c.oid = dependents.oid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        GROUP BY n.nspname, c.relname, c.relkind, c.oid
+        ORDER BY max(dependents.depth), c.relname
+    '''), {'table': connection.dialect.identifier_preparer.format_table(table)})
+    return [tuple(row) for row in result]
+
+
+def _view_name(connection, schema, name: str) -> str:
+    preparer = connection.dialect.identifier_preparer
+    return f"{preparer.quote_schema(schema)}.{preparer.quote(name)}" if schema else preparer.quote(name)
+
+
+def _swap(connection, table: Table, shadow: Table):
+    """Replace the live table with its loaded shadow copy.
+
+    Views on the live table (the v_ compatibility views and anything built on
+    them) would block the DROP on PostgreSQL and the rename on SQLite, so
+    they are dropped first and recreated from their definitions on the
+    swapped-in table. Nothing else is dropped: without CASCADE, any other
+    dependent object makes the load fail and roll back instead of silently
+    disappearing.
+    """
+    preparer = connection.dialect.identifier_preparer
+    is_postgres = connection.dialect.name == 'postgresql'
+    views = []
+    if inspect(connection).has_table(table.name, schema=table.schema):
+        views = _dependent_views(connection, table)
+        for schema, name, relkind, _ in reversed(views):
+            kind = 'MATERIALIZED VIEW' if relkind == 'm' else 'VIEW'
+            connection.execute(text(f"DROP {kind} {_view_name(connection, schema, name)}"))
+        connection.execute(text(f"DROP TABLE {preparer.format_table(table)}"))
+    connection.execute(text(
+        f"ALTER TABLE {preparer.format_table(shadow)} RENAME TO {preparer.quote(table.name)}"
+    ))
+    _rename_indexes(connection, table, shadow)
+    if is_postgres:
+        _rename_dependents(connection, table, shadow.name)
+    for schema, name, relkind, definition in views:
+        kind = 'MATERIALIZED VIEW' if relkind == 'm' else 'VIEW'
+        connection.execute(text(
+            f"CREATE {kind} {_view_name(connection, schema, name)} AS {definition.rstrip().rstrip(';')}"
+        ))
+
+
+def create_shadow_tables(connection, models: Iterable) -> Dict[object, Table]:
+    """Create an empty shadow copy of each table, keyed by the model passed in"""
+    metadata = MetaData()
+    shadows: Dict[object, Table] = {}
+    for model in models:
+        table = _resolve_table(model)
+        shadow = table.to_metadata(metadata, name=f"{table.name}{SHADOW_SUFFIX}")
+        # Index names are unique per schema, so the copies need their own
+        shadow.info['index_names'] = {}
+        for index in shadow.indexes:
+            live_name = index.name
+            index.name = f"{live_name}{SHADOW_SUFFIX}"
+            shadow.info['index_names'][index.name] = live_name
+        shadow.drop(connection, checkfirst=True)
+        shadow.create(connection)
+        shadows[model] = shadow
+    return shadows
+
+
+def swap_shadow_tables(connection, shadows: Dict[object, Table]):
+    """Swap loaded shadow tables in place of their live tables"""
+    for model, shadow in shadows.items():
+        _swap(connection, _resolve_table(model), shadow)
+        logger.info(f"Swapped {shadow.fullname} into {_resolve_table(model).fullname}")
+    bump_load_versions(connection, [_resolve_table(model) for model in shadows])
+
+
+@contextmanager
+def staged_tables(engine, models: Iterable):
+    """Load into shadow copies of the given tables and swap them in on success.
+
+    Yields the open connection and a {model: shadow table} mapping. Shadow
+    creation, the load and the swap share one transaction, so readers keep
+    seeing the previous data until commit and a failed load leaves the live
+    tables untouched.
+    """
+    models = list(models)
+    with engine.begin() as connection:
+        shadows = create_shadow_tables(connection, models)
+        yield connection, shadows
+        swap_shadow_tables(connection, shadows)
+
+    # Imported here, rollups itself loads through staged_tables
+    from .rollups import refresh_rollups_for
+    refresh_rollups_for(engine, [_resolve_table(model) for model in models])
@@ -0,0 +1,91 @@
+# backend/app/services/weather_files.py
+
+import hashlib
+import logging
+import re
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+from sqlalchemy import delete, select
+
+from ..models.load_manifest import WeatherFileManifest
+
+logger = logging.getLogger(__name__)
+
+# Monthly exports from the weather station, e.g. weather-2024-06.csv
+WEATHER_FILE = re.compile(r'^weather-(\d{4})-(\d{2})\.csv$')
+
+# Old export format to new format
+COLUMN_MAPPINGS = {
+    'TEMP': 'Air_Temperature_C_Avg',
+    'RH': 'Relative_Humidity_Avg',
+    'WINDSPD': 'Wind_Speed_ms_Avg',
+    'WINDIR': 'Wind_Direction_deg',
+    'GLOBAL': 'Solar_W_Avg',
+    'UVA': 'UVA_W_AVG',
+    'UVB': 'UVB_W_AVG',
+    'VISIBLE': 'Quantum_umol_AVG',
+    'RAIN': 'Rain_mm_Tot',
+    'PRESS': 'Air_Pressure_hPa_Avg',
+    'MAXGUST': 'Wind_Speed_ms_Max',
+    # Standardize date/time columns
+    'DATE': 'Date',
+    'TIME': 'Time'
+}
+
+# Core columns to keep (excluding GUSTIME)
+CORE_COLUMNS = [
+    'Date', 'Time', 'Air_Temperature_C_Avg', 'Relative_Humidity_Avg',
+    'Wind_Speed_ms_Avg', 'Wind_Direction_deg', 'Solar_W_Avg',
+    'UVA_W_AVG', 'UVB_W_AVG', 'Quantum_umol_AVG', 'Rain_mm_Tot',
+    'Air_Pressure_hPa_Avg', 'Wind_Speed_ms_Max'
+]
+
+
+def weather_files(weather_dir) -> List[Path]:
+    """Monthly weather files in a directory, oldest month first"""
+    return sorted(path for path in Path(weather_dir).iterdir() if WEATHER_FILE.match(path.name))
+
+
+def file_hash(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_weather_file(path) -> pd.DataFrame:
+    """One monthly file in the standard column layout, tagged with its source"""
+    path = Path(path)
+    # Skip the units/format row under the header
+    df = pd.read_csv(path, skiprows=[1])
+
+    if 'TEMP' in df.columns:  # Old format
+        df = df.rename(columns=COLUMN_MAPPINGS)
+
+    missing_cols = set(CORE_COLUMNS) - set(df.columns)
+    if missing_cols:
+        raise ValueError(f"Missing columns in {path.name}: {missing_cols}")
+
+    df = df[CORE_COLUMNS].copy()
+    df['source_file'] = path.name
+    df['year_month'] = pd.to_datetime(path.name.replace('weather-', '').replace('.csv', ''), format='%Y-%m')
+    return df
+
+
+def read_file_manifest(connection) -> Dict[str, str]:
+    """{file name: content hash} of the files already processed"""
+    manifest = WeatherFileManifest.__table__
+    rows = connection.execute(select(manifest.c.file_name, manifest.c.file_hash)).all()
+    return {name: digest for name, digest in rows}
+
+
+def record_files(connection, entries: List[dict]):
+    """Store file_name, file_hash and row_count of newly processed files"""
+    if not entries:
+        return
+    manifest = WeatherFileManifest.__table__
+    connection.execute(delete(manifest).where(manifest.c.file_name.in_([e['file_name'] for e in entries])))
+    connection.execute(manifest.insert(), entries)
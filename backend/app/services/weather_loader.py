@@ -1,7 +1,7 @@
 # backend/app/services/weather_loader.py
 
 import pandas as pd
-from sqlalchemy import create_engine, MetaData, text
+from sqlalchemy import create_engine, MetaData, delete, or_, select, text
 from sqlalchemy.orm import sessionmaker
 from ..models.weather_models import (
     WeatherDaily,
@@ -10,7 +10,12 @@ from ..models.weather_models import (
     AcademicCalendar
 )
 from .weather_processor import WeatherProcessor
-from .weather_preprocessor import WeatherDataPreprocessor
+from ..models.load_manifest import WeatherFileManifest
+from .weather_preprocessor import WeatherDataPreprocessor, WeatherValidation, WeatherOrderError
+from .weather_files import WEATHER_FILE, weather_files, file_hash, read_weather_file, read_file_manifest, record_files
+from .bulk_writer import write_dataframe
+from .load_versions import bump_load_versions
+from .table_swap import staged_tables
 from .. import db
 import logging
 
@@ -33,28 +38,18 @@ class WeatherLoader:
             connection.commit()
 
     def create_tables(self):
-        """Drop and recreate all weather-related tables"""
-        with self.engine.connect() as connection:
-            # Drop existing tables in correct order
-            connection.execute(text('''
-                DROP TABLE IF EXISTS dbo.weather_daily CASCADE;
-                DROP TABLE IF EXISTS dbo.weather_monthly CASCADE;
-                DROP TABLE IF EXISTS dbo.weather_weights CASCADE;
-                DROP TABLE IF EXISTS dbo.academic_calendar CASCADE;
-            '''))
-            connection.commit()
-
-            # Create tables using models
-            WeatherDaily.__table__.create(self.engine)
-            WeatherMonthly.__table__.create(self.engine)
-            WeatherWeights.__table__.create(self.engine)
-            AcademicCalendar.__table__.create(self.engine)
+        """Create the weather-related tables if missing; load_data swaps in fresh copies"""
+        with self.engine.begin() as connection:
+            WeatherDaily.__table__.create(connection, checkfirst=True)
+            WeatherMonthly.__table__.create(connection, checkfirst=True)
+            WeatherWeights.__table__.create(connection, checkfirst=True)
+            AcademicCalendar.__table__.create(connection, checkfirst=True)
+            WeatherFileManifest.__table__.create(connection, checkfirst=True)
 
     # backend/app/services/weather_loader.py
 
     def load_weather_weights(self, file_path: str) -> int:
         """Load weather weights from Excel file"""
-        session = self.Session()
         try:
             logger.info("Loading weather weights from Excel...")
             self.weather_weights_df = pd.read_excel(file_path)
@@ -74,66 +69,59 @@ class WeatherLoader:
                 'Sunday_multiplier': 'sunday_multiplier'
             }
             
-            records = []
-            for _, row in self.weather_weights_df.iterrows():
-                record = WeatherWeights()
-                for excel_col, model_field in column_mapping.items():
-                    if excel_col in row.index and pd.notna(row[excel_col]):
-                        setattr(record, model_field, row[excel_col])
-                records.append(record)
-
-            session.bulk_save_objects(records)
-            session.commit()
-            return len(records)
+            weights = self.weather_weights_df[
+                [col for col in column_mapping if col in self.weather_weights_df.columns]
+            ].rename(columns=column_mapping)
+
+            with staged_tables(self.engine, [WeatherWeights]) as (connection, shadows):
+                return write_dataframe(connection, shadows[WeatherWeights], weights)
 
         except Exception as e:
-            session.rollback()
             raise Exception(f"Error loading weather weights: {str(e)}")
-        finally:
-            session.close()
 
     def load_academic_calendar(self, file_path: str) -> int:
         """Load academic calendar from Excel file"""
-        session = self.Session()
         try:
             logger.info("Loading academic calendar from Excel...")
             self.academic_calendar_df = pd.read_excel(file_path)
             self.academic_calendar_df['date_id'] = pd.to_datetime(self.academic_calendar_df['date_id'])
-            records = []
-
-            for _, row in self.academic_calendar_df.iterrows():
-                record = AcademicCalendar()
-                for column in row.index:
-                    if pd.notna(row[column]):
-                        setattr(record, column.lower(), row[column])
-                records.append(record)
+            calendar = self.academic_calendar_df.rename(columns=str.lower)
 
-            session.bulk_save_objects(records)
-            session.commit()
-            return len(records)
+            with staged_tables(self.engine, [AcademicCalendar]) as (connection, shadows):
+                return write_dataframe(connection, shadows[AcademicCalendar], calendar)
 
         except Exception as e:
-            session.rollback()
             raise Exception(f"Error loading academic calendar: {str(e)}")
-        finally:
-            session.close()
+
+    def _stream_daily(self, merged_file_path: str):
+        """
+        Daily aggregates and validation report of the merged file, read a few
+        days at a time. A file that is out of chronological order is read
+        and sorted whole instead.
+        """
+        preprocessor = WeatherDataPreprocessor()
+        try:
+            validation = WeatherValidation()
+            daily_frames = []
+            for readings in preprocessor.iter_days(merged_file_path):
+                validation.update(readings)
+                daily_frames.append(self.processor.process_daily(readings))
+        except WeatherOrderError as e:
+            logger.warning(f"{str(e)}, preprocessing the whole file")
+            processed_df = preprocessor.preprocess_data(merged_file_path)
+            return self.processor.process_daily(processed_df), preprocessor.validate_data(processed_df)
+
+        if not daily_frames:
+            raise ValueError("No data found in the file")
+        return pd.concat(daily_frames), validation.result()
 
     def load_weather_data(self, merged_file_path: str) -> dict:
         """Load and process weather data"""
-        session = self.Session()
         records_count = {}
 
         try:
             logger.info("Processing weather data...")
             
-            # Initialize preprocessor and process data
-            preprocessor = WeatherDataPreprocessor()
-            processed_df = preprocessor.preprocess_data(merged_file_path)
-            
-            # Validate processed data
-            validation_results = preprocessor.validate_data(processed_df)
-            logger.info(f"Data validation completed")
-            
             # Initialize processor with required dataframes
             self.processor = WeatherProcessor(
                 self.academic_calendar_df,
@@ -141,54 +129,144 @@ class WeatherLoader:
                 self.solar_energy_df
             )
 
-            # Process daily data
-            daily_data = self.processor.process_daily(processed_df)
-            daily_records = []
-            
-            for date_id, row in daily_data.iterrows():
-                record = WeatherDaily(date_id=date_id)
-                for column, value in row.items():
-                    if pd.notna(value):
-                        setattr(record, column, value)
-                daily_records.append(record)
+            # Process daily data, validating as the readings stream past
+            daily_data, validation_results = self._stream_daily(merged_file_path)
+            logger.info(f"Data validation completed")
 
             # Process monthly data
             monthly_data = self.processor.process_monthly(daily_data)
-            monthly_records = []
-            
-            for date_id, row in monthly_data.iterrows():
-                record = WeatherMonthly(month_id=date_id)
-                for column, value in row.items():
-                    if pd.notna(value):
-                        setattr(record, column, value)
-                monthly_records.append(record)
-
-            # Save records
-            session.bulk_save_objects(daily_records)
-            session.bulk_save_objects(monthly_records)
-            session.commit()
+
+            # Save records, the date indexes become the primary keys
+            with staged_tables(self.engine, [WeatherDaily, WeatherMonthly]) as (connection, shadows):
+                daily_count = write_dataframe(
+                    connection, shadows[WeatherDaily], daily_data.rename_axis('date_id').reset_index()
+                )
+                monthly_count = write_dataframe(
+                    connection, shadows[WeatherMonthly], monthly_data.rename_axis('month_id').reset_index()
+                )
 
             # Prepare return data
             records_count = {
-                'daily': len(daily_records),
-                'monthly': len(monthly_records),
+                'daily': daily_count,
+                'monthly': monthly_count,
                 'validation': validation_results
             }
 
             # Log loading summary
-            logger.info(f"Successfully loaded {len(daily_records)} daily records")
-            logger.info(f"Successfully loaded {len(monthly_records)} monthly records")
+            logger.info(f"Successfully loaded {daily_count} daily records")
+            logger.info(f"Successfully loaded {monthly_count} monthly records")
             logger.info(f"Data completeness: {validation_results['data_quality']['completeness']['percentage']:.2f}%")
 
             return records_count
 
         except Exception as e:
-            session.rollback()
             raise Exception(f"Error loading weather data: {str(e)}")
-        finally:
-            session.close()
 
 
+    def load_weather_files(self, weather_dir, full: bool = False) -> dict:
+        """
+        Process only the monthly weather-YYYY-MM.csv files that are new or
+        changed since the last run, replacing the whole months they cover in
+        weather_daily and recomputing weather_monthly for just those months.
+        With full=True every file is processed and both tables are rebuilt.
+        """
+        try:
+            paths = weather_files(weather_dir)
+            with self.engine.begin() as connection:
+                for model in (WeatherDaily, WeatherMonthly, WeatherFileManifest):
+                    model.__table__.create(connection, checkfirst=True)
+                known = {} if full else read_file_manifest(connection)
+
+            hashes = {path.name: file_hash(path) for path in paths}
+            changed = [path for path in paths if known.get(path.name) != hashes[path.name]]
+            logger.info(f"{len(changed)} of {len(paths)} weather files are new or changed")
+            if not changed:
+                return {'daily': 0, 'monthly': 0, 'files': 0}
+
+            # Read every changed file first and concatenate once
+            frames, entries, file_months = [], [], []
+            for path in changed:
+                try:
+                    frame = read_weather_file(path)
+                except Exception as e:
+                    # Left out of the manifest, so it is retried next run
+                    logger.error(f"Error processing {path.name}: {str(e)}")
+                    continue
+                frames.append(frame)
+                file_months.append(pd.Period('-'.join(WEATHER_FILE.match(path.name).groups()), freq='M'))
+                entries.append({'file_name': path.name, 'file_hash': hashes[path.name], 'row_count': len(frame)})
+            if not frames:
+                return {'daily': 0, 'monthly': 0, 'files': 0}
+
+            processed_df = WeatherDataPreprocessor().preprocess_frame(pd.concat(frames, ignore_index=True))
+            self.processor = WeatherProcessor(
+                self.academic_calendar_df,
+                self.weather_weights_df,
+                self.solar_energy_df
+            )
+            daily_data = self.processor.process_daily(processed_df)
+
+            if full:
+                monthly_data = self.processor.process_monthly(daily_data)
+                with staged_tables(self.engine, [WeatherDaily, WeatherMonthly]) as (connection, shadows):
+                    daily_count = write_dataframe(
+                        connection, shadows[WeatherDaily], daily_data.rename_axis('date_id').reset_index()
+                    )
+                    monthly_count = write_dataframe(
+                        connection, shadows[WeatherMonthly], monthly_data.rename_axis('month_id').reset_index()
+                    )
+                    record_files(connection, entries)
+            else:
+                file_months = pd.PeriodIndex(file_months, freq='M')
+                months = file_months.union(daily_data.index.to_period('M').unique())
+                with self.engine.begin() as connection:
+                    daily_count = self._replace_daily(connection, daily_data, file_months)
+                    monthly_data = self.processor.process_monthly(self._read_daily(connection, months))
+                    monthly_data = monthly_data[monthly_data.index.to_period('M').isin(months)]
+                    monthly_count = self._replace_monthly(connection, monthly_data, months)
+                    record_files(connection, entries)
+                    bump_load_versions(connection, [WeatherDaily.__table__, WeatherMonthly.__table__])
+
+            logger.info(f"Loaded {daily_count} daily and {monthly_count} monthly records from {len(entries)} files")
+            return {'daily': daily_count, 'monthly': monthly_count, 'files': len(entries)}
+
+        except Exception as e:
+            raise Exception(f"Error loading weather files: {str(e)}")
+
+    @staticmethod
+    def _in_months(column, months):
+        """column falls in one of the given monthly periods"""
+        return or_(*[column.between(month.start_time.date(), month.end_time.date()) for month in months])
+
+    def _replace_daily(self, connection, daily_data, file_months) -> int:
+        """Overwrite the whole months of the changed files, so days a corrected
+        file no longer has are removed, and any other days in daily_data"""
+        table = WeatherDaily.__table__
+        connection.execute(delete(table).where(or_(
+            self._in_months(table.c.date_id, file_months),
+            table.c.date_id.in_(daily_data.index.date.tolist())
+        )))
+        return write_dataframe(connection, table, daily_data.rename_axis('date_id').reset_index())
+
+    def _read_daily(self, connection, months) -> pd.DataFrame:
+        """Stored daily rows of the given months, indexed by date as process_daily returns them"""
+        table = WeatherDaily.__table__
+        daily = pd.read_sql(
+            select(table).where(
+                table.c.date_id.between(months.min().start_time.date(), months.max().end_time.date())
+            ),
+            connection
+        )
+        daily = daily.set_index(pd.DatetimeIndex(pd.to_datetime(daily.pop('date_id')), name='date_id'))
+        daily = daily.sort_index()
+        return daily[daily.index.to_period('M').isin(months)]
+
+    def _replace_monthly(self, connection, monthly_data, months) -> int:
+        """Overwrite the given months with monthly_data"""
+        table = WeatherMonthly.__table__
+        connection.execute(delete(table).where(self._in_months(table.c.month_id, months)))
+        return write_dataframe(connection, table, monthly_data.rename_axis('month_id').reset_index())
+
     def load_solar_energy(self, file_path):
         """Load solar energy data from CSV"""
         try:
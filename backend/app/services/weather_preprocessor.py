@@ -3,10 +3,153 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from typing import Iterator
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Rows read from the merged CSV at a time; memory use depends on this, not on
+# how many years of readings the file holds
+CHUNK_ROWS = 100_000
+
+NUMERIC_COLUMNS = [
+    'Air_Temperature_C_Avg',
+    'Relative_Humidity_Avg',
+    'Wind_Speed_ms_Avg',
+    'Wind_Direction_deg',
+    'Solar_W_Avg',
+    'UVA_W_AVG',
+    'UVB_W_AVG',
+    'Quantum_umol_AVG',
+    'Rain_mm_Tot',
+    'Air_Pressure_hPa_Avg',
+    'Wind_Speed_ms_Max'
+]
+
+
+class WeatherOrderError(ValueError):
+    """A merged weather file whose readings are not in chronological order"""
+
+
+def _parse_repeated(values: pd.Series, fmt: str) -> np.ndarray:
+    """Parse a column of few distinct strings, each distinct value only once"""
+    codes, uniques = pd.factorize(values)
+    parsed = pd.to_datetime(pd.Series(uniques, dtype=object), format=fmt, errors='coerce').to_numpy()
+    if len(parsed) == 0:
+        return np.full(len(values), np.datetime64('NaT'), dtype='datetime64[ns]')
+    return np.where(codes >= 0, parsed[codes], np.datetime64('NaT'))
+
+
+class WeatherValidation:
+    """validate_data's report, accumulated one chunk at a time"""
+
+    def __init__(self):
+        self.total = 0
+        self.start = None
+        self.end = None
+        self.missing = {}
+        self.sums = {}
+        self.daily_counts = pd.Series(dtype='int64')
+
+    def update(self, df: pd.DataFrame):
+        if df.empty:
+            return self
+        self.total += len(df)
+        start, end = df['DATETIME'].min(), df['DATETIME'].max()
+        self.start = start if self.start is None else min(self.start, start)
+        self.end = end if self.end is None else max(self.end, end)
+
+        for col, missing in df.isnull().sum().items():
+            self.missing[col] = self.missing.get(col, 0) + int(missing)
+
+        # Count, sum, sum of squares, min and max are enough for min/max/mean/std
+        numeric = df.select_dtypes(include=[np.number])
+        stats = pd.DataFrame({
+            'count': numeric.count(),
+            'sum': numeric.sum(),
+            'sumsq': (numeric ** 2).sum(),
+            'min': numeric.min(),
+            'max': numeric.max()
+        })
+        for col, row in stats.iterrows():
+            previous = self.sums.get(col)
+            if previous is None:
+                self.sums[col] = row
+            else:
+                self.sums[col] = pd.Series({
+                    'count': previous['count'] + row['count'],
+                    'sum': previous['sum'] + row['sum'],
+                    'sumsq': previous['sumsq'] + row['sumsq'],
+                    'min': np.fmin(previous['min'], row['min']),
+                    'max': np.fmax(previous['max'], row['max'])
+                })
+
+        counts = df.groupby(df['DATETIME'].dt.date).size()
+        self.daily_counts = self.daily_counts.add(counts, fill_value=0).astype('int64')
+        return self
+
+    def result(self) -> dict:
+        validation_results = {
+            'total_records': self.total,
+            'date_range': {
+                'start': self.start.strftime('%Y-%m-%d %H:%M:%S'),
+                'end': self.end.strftime('%Y-%m-%d %H:%M:%S')
+            },
+            'missing_values': {},
+            'value_ranges': {},
+            'readings_per_day': {},
+            'data_quality': {
+                'completeness': {},
+                'validity': {}
+            }
+        }
+
+        # Check missing values
+        for col, missing in self.missing.items():
+            if missing > 0:
+                validation_results['missing_values'][col] = {
+                    'count': int(missing),
+                    'percentage': float((missing / self.total) * 100)
+                }
+
+        # Value ranges for numeric columns
+        for col, stats in self.sums.items():
+            count = stats['count']
+            mean = stats['sum'] / count if count else np.nan
+            variance = (stats['sumsq'] - count * mean ** 2) / (count - 1) if count > 1 else np.nan
+            validation_results['value_ranges'][col] = {
+                'min': float(stats['min']),
+                'max': float(stats['max']),
+                'mean': float(mean),
+                'std': float(np.sqrt(max(variance, 0))) if count > 1 else float('nan')
+            }
+
+        # Readings per day
+        daily_counts = self.daily_counts
+        validation_results['readings_per_day'] = {
+            'mean': float(daily_counts.mean()),
+            'min': int(daily_counts.min()),
+            'max': int(daily_counts.max()),
+            'complete_days': int(sum(daily_counts == 288)),
+            'incomplete_days': int(sum(daily_counts < 288))
+        }
+
+        # Check data completeness
+        expected_readings = (self.end - self.start) // pd.Timedelta(minutes=5) + 1
+        validation_results['data_quality']['completeness'] = {
+            'total_expected': int(expected_readings),
+            'total_actual': self.total,
+            'percentage': float((self.total / expected_readings) * 100)
+        }
+
+        logger.info("Data Validation Summary:")
+        logger.info(f"Total Records: {validation_results['total_records']}")
+        logger.info(f"Date Range: {validation_results['date_range']}")
+        logger.info(f"Complete Days: {validation_results['readings_per_day']['complete_days']}")
+
+        return validation_results
+
+
 class WeatherDataPreprocessor:
     def __init__(self):
         self.header_rows = 2
@@ -16,178 +159,124 @@ class WeatherDataPreprocessor:
             pd.to_datetime('2023-08-03')
         ]
         # Define expected columns for the weather data
-        self.expected_columns = [
-            'Date', 'Time', 'Air_Temperature_C_Avg', 'Relative_Humidity_Avg',
-            'Wind_Speed_ms_Avg', 'Wind_Direction_deg', 'Solar_W_Avg',
-            'UVA_W_AVG', 'UVB_W_AVG', 'Quantum_umol_AVG', 'Rain_mm_Tot',
-            'Air_Pressure_hPa_Avg', 'Wind_Speed_ms_Max'
-        ]
+        self.expected_columns = ['Date', 'Time', *NUMERIC_COLUMNS]
 
-    def read_csv_file(self, file_path: str) -> pd.DataFrame:
-        """Read and process CSV file with proper column handling"""
+    def read_chunks(self, file_path: str, chunksize: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+        """
+        Raw rows of the merged CSV, chunksize at a time. Date and Time are
+        read as text; the measurements are parsed straight to float64 by the
+        CSV reader, and only a chunk holding a header or other text row in a
+        measurement column comes back as object for clean_chunk to coerce.
+        """
         try:
-            # Read CSV with no header and handle mixed types
-            df = pd.read_csv(
+            reader = pd.read_csv(
                 file_path,
                 header=None,
                 names=range(15),
-                low_memory=False
+                dtype={0: str, 1: str},
+                chunksize=chunksize
             )
-            
-            logger.info(f"Initial read: {len(df)} rows")
-            
-            # Remove separator rows
-            df = df[~df[0].astype(str).str.contains('weather-', na=False)]
-            df = df[~df[0].astype(str).str.contains('-' * 20, na=False)]
-            
-            # Rename columns to match expected format
-            column_mapping = {
-                0: 'Date',
-                1: 'Time',
-                2: 'Air_Temperature_C_Avg',
-                3: 'Relative_Humidity_Avg',
-                4: 'Wind_Speed_ms_Avg',
-                5: 'Wind_Direction_deg',
-                6: 'Solar_W_Avg',
-                7: 'UVA_W_AVG',
-                8: 'UVB_W_AVG',
-                9: 'Quantum_umol_AVG',
-                10: 'Rain_mm_Tot',
-                11: 'Air_Pressure_hPa_Avg',
-                12: 'Wind_Speed_ms_Max'
-            }
-            
-            df = df.rename(columns=column_mapping)
-            
-            # Select only needed columns
-            df = df[self.expected_columns]
-            
-            return df
-            
+            for chunk in reader:
+                chunk = chunk.iloc[:, :len(self.expected_columns)]
+                chunk.columns = self.expected_columns
+                yield chunk
+
         except Exception as e:
             logger.error(f"Error reading CSV file: {str(e)}")
             raise
 
+    def read_csv_file(self, file_path: str) -> pd.DataFrame:
+        """Read and process CSV file with proper column handling"""
+        return pd.concat(self.read_chunks(file_path))
+
+    def clean_chunk(self, raw_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Typed readings of raw weather rows with Date and Time columns. Separator
+        rows ("weather-..." and dashed lines), headers and any row whose date
+        does not parse are dropped by the datetime parse itself.
+        """
+        # Each day and each time of day repeats many times, so the fixed
+        # formats are parsed once per distinct value
+        timestamps = (
+            _parse_repeated(raw_df['Date'], '%d/%m/%Y')
+            + (_parse_repeated(raw_df['Time'], '%H:%M:%S') - np.datetime64('1900-01-01'))
+        )
+        valid = ~np.isnat(timestamps)
+        df = raw_df[valid].copy()
+        df['DATETIME'] = timestamps[valid]
+
+        # A header row in the chunk leaves its measurement columns as text;
+        # with those rows gone a plain cast usually succeeds
+        for col in NUMERIC_COLUMNS:
+            if df[col].dtype == object:
+                try:
+                    df[col] = df[col].astype('float64')
+                except (TypeError, ValueError):
+                    df[col] = pd.to_numeric(df[col], errors='coerce')
+
+        # Remove known missing dates
+        return df[~df['DATETIME'].dt.normalize().isin(self.known_missing_dates)]
+
+    def iter_days(self, file_path: str, chunksize: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+        """
+        Cleaned readings in chunks of whole days, for aggregating a file of any
+        length in bounded memory. The last day of every chunk is held back
+        until the next chunk shows it is complete. Raises WeatherOrderError
+        if a day turns up again after it was yielded, since the file is then
+        not chronological and needs preprocess_data's full sort.
+        """
+        carry = None
+        yielded_through = None
+        for raw_df in self.read_chunks(file_path, chunksize):
+            df = self.clean_chunk(raw_df)
+            if carry is not None:
+                df = pd.concat([carry, df])
+            if df.empty:
+                continue
+
+            days = df['DATETIME'].dt.normalize()
+            if yielded_through is not None and days.min() <= yielded_through:
+                raise WeatherOrderError(f"{file_path} is not in chronological order")
+
+            last_day = days.max()
+            carry = df[days == last_day]
+            ready = df[days < last_day]
+            if not ready.empty:
+                yielded_through = days[days < last_day].max()
+                yield ready.sort_values('DATETIME')
+
+        if carry is not None and not carry.empty:
+            yield carry.sort_values('DATETIME')
+
     def preprocess_data(self, file_path: str) -> pd.DataFrame:
         """Preprocess the weather data file"""
         try:
-            # Read the CSV file
-            raw_df = self.read_csv_file(file_path)
-            
+            raw_df = pd.concat([self.clean_chunk(chunk) for chunk in self.read_chunks(file_path)])
+
             if raw_df.empty:
                 raise ValueError("No data found in the file")
-            
-            # Convert date and time to datetime
-            raw_df['DATETIME'] = pd.to_datetime(
-                raw_df['Date'] + ' ' + raw_df['Time'],
-                format='%d/%m/%Y %H:%M:%S',
-                errors='coerce'
-            )
-            
-            # Drop rows with invalid dates
-            raw_df = raw_df.dropna(subset=['DATETIME'])
-            
-            # Convert numeric columns
-            numeric_columns = [
-                'Air_Temperature_C_Avg',
-                'Relative_Humidity_Avg',
-                'Wind_Speed_ms_Avg',
-                'Wind_Direction_deg',
-                'Solar_W_Avg',
-                'UVA_W_AVG',
-                'UVB_W_AVG',
-                'Quantum_umol_AVG',
-                'Rain_mm_Tot',
-                'Air_Pressure_hPa_Avg',
-                'Wind_Speed_ms_Max'
-            ]
-            
-            for col in numeric_columns:
-                raw_df[col] = pd.to_numeric(raw_df[col], errors='coerce')
-            
-            # Sort by datetime
-            raw_df = raw_df.sort_values('DATETIME')
-            
-            # Remove known missing dates
-            raw_df = raw_df[~raw_df['DATETIME'].dt.date.isin(
-                [d.date() for d in self.known_missing_dates]
-            )]
-            
-            logger.info(f"Processed {len(raw_df)} weather records")
-            logger.info(f"Date range: {raw_df['DATETIME'].min()} to {raw_df['DATETIME'].max()}")
-            
-            return raw_df
-            
+
+            return self._sorted(raw_df)
+
         except Exception as e:
             logger.error(f"Error preprocessing weather data: {str(e)}")
             raise
 
+    def preprocess_frame(self, raw_df: pd.DataFrame) -> pd.DataFrame:
+        """Parse, type and sort raw weather rows with Date and Time columns"""
+        return self._sorted(self.clean_chunk(raw_df))
+
+    def _sorted(self, df: pd.DataFrame) -> pd.DataFrame:
+        # Sort by datetime
+        df = df.sort_values('DATETIME')
+        logger.info(f"Processed {len(df)} weather records")
+        logger.info(f"Date range: {df['DATETIME'].min()} to {df['DATETIME'].max()}")
+        return df
+
     def validate_data(self, df: pd.DataFrame) -> dict:
         """Validate the processed data and return validation results"""
         try:
-            validation_results = {
-                'total_records': len(df),
-                'date_range': {
-                    'start': df['DATETIME'].min().strftime('%Y-%m-%d %H:%M:%S'),
-                    'end': df['DATETIME'].max().strftime('%Y-%m-%d %H:%M:%S')
-                },
-                'missing_values': {},
-                'value_ranges': {},
-                'readings_per_day': {},
-                'data_quality': {
-                    'completeness': {},
-                    'validity': {}
-                }
-            }
-            
-            # Check missing values
-            for col in df.columns:
-                missing = df[col].isnull().sum()
-                if missing > 0:
-                    validation_results['missing_values'][col] = {
-                        'count': int(missing),
-                        'percentage': float((missing / len(df)) * 100)
-                    }
-            
-            # Calculate value ranges for numeric columns
-            numeric_cols = df.select_dtypes(include=[np.number]).columns
-            for col in numeric_cols:
-                validation_results['value_ranges'][col] = {
-                    'min': float(df[col].min()),
-                    'max': float(df[col].max()),
-                    'mean': float(df[col].mean()),
-                    'std': float(df[col].std())
-                }
-            
-            # Calculate readings per day
-            daily_counts = df.groupby(df['DATETIME'].dt.date).size()
-            validation_results['readings_per_day'] = {
-                'mean': float(daily_counts.mean()),
-                'min': int(daily_counts.min()),
-                'max': int(daily_counts.max()),
-                'complete_days': int(sum(daily_counts == 288)),
-                'incomplete_days': int(sum(daily_counts < 288))
-            }
-            
-            # Check data completeness
-            expected_readings = len(pd.date_range(
-                df['DATETIME'].min(),
-                df['DATETIME'].max(),
-                freq='5min'
-            ))
-            validation_results['data_quality']['completeness'] = {
-                'total_expected': expected_readings,
-                'total_actual': len(df),
-                'percentage': float((len(df) / expected_readings) * 100)
-            }
-            
-            logger.info("Data Validation Summary:")
-            logger.info(f"Total Records: {validation_results['total_records']}")
-            logger.info(f"Date Range: {validation_results['date_range']}")
-            logger.info(f"Complete Days: {validation_results['readings_per_day']['complete_days']}")
-            
-            return validation_results
-            
+            return WeatherValidation().update(df).result()
         except Exception as e:
             logger.error(f"Error validating data: {str(e)}")
-            raise
\ No newline at end of file
+            raise
@@ -7,6 +7,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Weather weights columns of the weighted score
+WEIGHT_COLUMNS = ['Temp_Weight', 'radiation_Weight', 'humidity_weight', 'wind_Weight']
+
 class WeatherProcessor:
     def __init__(self, academic_calendar_df=None, weather_weights_df=None,solar_energy_df=None):
         self.working_hours = (time(8), time(18))
@@ -15,101 +18,104 @@ class WeatherProcessor:
             'afternoon': (time(12), time(16)),
             'evening': (time(16), time(20))
         }
+        # Output columns of process_daily, in order
+        self.daily_columns = [
+            'temp_mean_working', 'temp_max_working', 'temp_min_working', 'temp_range_working',
+            'global_radiation_sum', 'peak_radiation', 'wind_speed_mean', 'wind_direction_dominant',
+            'max_gust_speed', 'humidity_mean_working', 'humidity_range_working',
+            'pressure_mean_working', 'rain_sum_working', 'season', 'day_type', 'academic_period',
+            *[f'{block_name}_{measure}_mean' for block_name in self.time_blocks for measure in ('temp', 'humidity')],
+            'weighted_score'
+        ]
         self.academic_calendar_df = academic_calendar_df
         self.weather_weights_df = weather_weights_df
         self.solar_energy_df = solar_energy_df
 
-    def _calculate_weighted_score(self, day_data, season, academic_info):
-        try:
-            if self.weather_weights_df is None:
-                logger.warning("No weather weights data available")
-                return None
-
-            # Case-insensitive season matching with strip
-            season_weights = self.weather_weights_df[
-                self.weather_weights_df['Season'].str.lower().str.strip() == season.lower().strip()
-            ]
-
-            if len(season_weights) == 0:
-                logger.warning(f"No weights found for season: {season}")
-                return None
-
-            weights = season_weights.iloc[0]
-
-            # Calculate base weather score using exact column names
-            weather_score = (
-                weights['Temp_Weight'] * day_data['Air_Temperature_C_Avg'].mean() +
-                weights['radiation_Weight'] * day_data['Solar_W_Avg'].mean() +
-                weights['humidity_weight'] * day_data['Relative_Humidity_Avg'].mean() +
-                weights['wind_Weight'] * day_data['Wind_Speed_ms_Avg'].mean()
-            )
-
-            # Get multiplier from academic_calendar table
-            if academic_info:
-                multiplier = academic_info.get('final_weight', 1.0)
-            else:
-                multiplier = 0 # weights['term_multiplier']
-
-            return float(weather_score * multiplier)
+        # Reference tables indexed once, by day and by normalised season name
+        self.calendar_by_date = self._index_calendar(academic_calendar_df)
+        self.weights_by_season = self._index_weights(weather_weights_df)
 
-        except Exception as e:
-            logger.error(f"Error calculating weighted score: {str(e)}")
-            logger.error(f"Season: {season}")
-            logger.error(f"Weather weights columns: {self.weather_weights_df.columns.tolist()}")
+    @staticmethod
+    def _index_calendar(academic_calendar_df):
+        """Calendar entries by day; the first entry for a date wins"""
+        if academic_calendar_df is None:
+            return None
+        calendar = pd.DataFrame({
+            'academic_period': academic_calendar_df['event_type'].to_numpy(),
+            'final_weight': (
+                academic_calendar_df['final_weight'].to_numpy()
+                if 'final_weight' in academic_calendar_df.columns else 1.0
+            ),
+            'in_calendar': True
+        }, index=pd.DatetimeIndex(academic_calendar_df['date_id']).normalize())
+        return calendar[~calendar.index.duplicated()]
+
+    @staticmethod
+    def _index_weights(weather_weights_df):
+        """Weights by season, matched case-insensitively and without surrounding spaces"""
+        if weather_weights_df is None:
             return None
+        weights = weather_weights_df[WEIGHT_COLUMNS].astype(float).set_axis(
+            weather_weights_df['Season'].str.lower().str.strip()
+        )
+        return weights[~weights.index.duplicated()]
+
+    def _calculate_weighted_scores(self, daily_df):
+        """Weighted weather score for every day at once"""
+        if self.weights_by_season is None:
+            logger.warning("No weather weights data available")
+            return pd.Series(np.nan, index=daily_df.index)
+
+        day_weights = self.weights_by_season.reindex(daily_df['season'].str.lower()).set_axis(daily_df.index)
+        for season in daily_df.loc[day_weights.isna().all(axis=1), 'season'].unique():
+            logger.warning(f"No weights found for season: {season}")
+
+        # Calculate base weather score using exact column names
+        weather_score = (
+            day_weights['Temp_Weight'] * daily_df['temp_mean_working'] +
+            day_weights['radiation_Weight'] * daily_df['solar_mean_working'] +
+            day_weights['humidity_weight'] * daily_df['humidity_mean_working'] +
+            day_weights['wind_Weight'] * daily_df['wind_speed_mean']
+        )
+
+        # Multiplier from the academic calendar, 0 for days it does not list
+        multiplier = daily_df['final_weight'].where(daily_df['in_calendar'], 0)
+        return weather_score * multiplier
 
     def process_monthly(self, daily_df):
         """Process daily data into monthly aggregations"""
         try:
-            # Create monthly aggregations without nested dictionary
-            monthly_metrics = pd.DataFrame()
-            
-            # Group by month end
-            monthly_grouped = daily_df.resample('ME')
-            
-            # Calculate individual metrics
-            monthly_metrics['temp_mean'] = monthly_grouped['temp_mean_working'].mean()
-            monthly_metrics['temp_max'] = monthly_grouped['temp_max_working'].max()
-            monthly_metrics['temp_min'] = monthly_grouped['temp_min_working'].min()
-            monthly_metrics['temp_std_dev'] = monthly_grouped['temp_mean_working'].std()
-            monthly_metrics['radiation_total'] = monthly_grouped['global_radiation_sum'].sum()
-            monthly_metrics['avg_peak_radiation'] = monthly_grouped['peak_radiation'].mean()
-            monthly_metrics['humidity_mean'] = monthly_grouped['humidity_mean_working'].mean()
-            monthly_metrics['rain_total'] = monthly_grouped['rain_sum_working'].sum()
-            monthly_metrics['weighted_monthly_score'] = monthly_grouped['weighted_score'].mean()
-
-
-
-            #new columns added
-            # monthly_metrics['total_solar_duration'] = monthly_grouped['solar_duration_hours'].sum() #not working
-            monthly_metrics['avg_wind_speed'] = monthly_grouped['wind_speed_mean'].mean()
-            monthly_metrics['morning_temp_mean'] = monthly_grouped['morning_temp_mean'].mean()
-            monthly_metrics['afternoon_temp_mean'] = monthly_grouped['afternoon_temp_mean'].mean()
-            monthly_metrics['evening_temp_mean'] = monthly_grouped['evening_temp_mean'].mean()
-            monthly_metrics['pressure_mean'] = monthly_grouped['pressure_mean_working'].mean()
+            # One pass over the daily frame, grouped by month end
+            monthly_metrics = daily_df.resample('ME').agg(
+                temp_mean=('temp_mean_working', 'mean'),
+                temp_max=('temp_max_working', 'max'),
+                temp_min=('temp_min_working', 'min'),
+                temp_std_dev=('temp_mean_working', 'std'),
+                radiation_total=('global_radiation_sum', 'sum'),
+                avg_peak_radiation=('peak_radiation', 'mean'),
+                humidity_mean=('humidity_mean_working', 'mean'),
+                rain_total=('rain_sum_working', 'sum'),
+                weighted_monthly_score=('weighted_score', 'mean'),
+                # total_solar_duration=('solar_duration_hours', 'sum'),  # not working
+                avg_wind_speed=('wind_speed_mean', 'mean'),
+                morning_temp_mean=('morning_temp_mean', 'mean'),
+                afternoon_temp_mean=('afternoon_temp_mean', 'mean'),
+                evening_temp_mean=('evening_temp_mean', 'mean'),
+                pressure_mean=('pressure_mean_working', 'mean')
+            )
+            months = monthly_metrics.index.to_period('M')
 
-            # Add Mean daily Solar energy with debugging
+            # Mean daily solar energy, joined on the month
             if self.solar_energy_df is not None:
-                logger.info("Processing solar energy data for monthly metrics")
-                for month_start in monthly_metrics.index:
-                    logger.debug(f"Processing month: {month_start}")
-                    mask = (
-                        (self.solar_energy_df['Date'].dt.year == month_start.year) &
-                        (self.solar_energy_df['Date'].dt.month == month_start.month)
-                    )
-                    matching_records = sum(mask)
-                    logger.debug(f"Found {matching_records} matching records for {month_start}")
-                    
-                    if matching_records > 0:
-                        solar_value = self.solar_energy_df.loc[mask, 'Mean_daily_Solar_energy'].iloc[0]
-                        monthly_metrics.loc[month_start, 'mean_daily_solar_energy'] = solar_value
-                        logger.debug(f"Added solar energy value: {solar_value} for {month_start}")
-                    else:
-                        logger.warning(f"No solar energy data found for {month_start}")
+                solar = self.solar_energy_df.set_axis(self.solar_energy_df['Date'].dt.to_period('M'))
+                solar = solar.loc[~solar.index.duplicated(), 'Mean_daily_Solar_energy']
+                monthly_metrics['Mean_daily_Solar_energy'] = solar.reindex(months).to_numpy()
+                missing = months[monthly_metrics['Mean_daily_Solar_energy'].isna().to_numpy()]
+                if len(missing):
+                    logger.warning(f"No solar energy data found for {', '.join(str(month) for month in missing)}")
             else:
                 logger.warning("Solar energy DataFrame is None")
-                logger.error(f"Solar energy df shape: {self.solar_energy_df.shape if self.solar_energy_df is not None else 'None'}")
-                        
+
             # Add academic period counts if calendar data is available
             if self.academic_calendar_df is not None:
                 self._add_academic_period_counts(monthly_metrics)
@@ -122,138 +128,122 @@ class WeatherProcessor:
 
     def _add_academic_period_counts(self, monthly_metrics):
         """Add academic period day counts to monthly metrics"""
-        try:
-            for month_start in monthly_metrics.index:
-                # Get first and last day of the month
-                first_day = month_start.replace(day=1)
-                last_day = (first_day + pd.offsets.MonthEnd(1))
-                
-                # Create mask for the month using datetime
-                mask = (
-                    (self.academic_calendar_df['date_id'] >= first_day) &
-                    (self.academic_calendar_df['date_id'] <= last_day)
-                )
-                period_data = self.academic_calendar_df[mask]
-                
-                # Calculate actual days in month using calendar
-                import calendar
-                total_days = calendar.monthrange(month_start.year, month_start.month)[1]
-                
-                # Count days for each period type
-                term_days = len(period_data[period_data['event_type'] == 'Term'])
-                holiday_days = len(period_data[period_data['event_type'] == 'Holiday'])
-                exam_days = len(period_data[period_data['description'] == 'Exam'])
-                
-                # Add counts to monthly metrics
-                monthly_metrics.loc[month_start, 'term_days'] = term_days
-                monthly_metrics.loc[month_start, 'holiday_days'] = holiday_days
-                monthly_metrics.loc[month_start, 'exam_days'] = exam_days
-                monthly_metrics.loc[month_start, 'total_days'] = total_days
-                
-                # Log the results
-                #logger.info(
-                #    f"Month {month_start.strftime('%Y-%m')}: "
-                #    f"Total={total_days}, Term={term_days}, "
-                #    f"Holiday={holiday_days}, Exam={exam_days}"
-                #)
-
-        except Exception as e:
-            logger.error(f"Error adding academic period counts: {str(e)}")
-            logger.error(f"Month being processed: {month_start}")
-            raise
-
-
-
-    def _determine_season(self, date):
-        """Determine season based on month"""
-        month = date.month
-        if month in [12, 1, 2]:
-            return 'Summer'
-        elif month in [3, 4, 5]:
-            return 'Autumn'
-        elif month in [6, 7, 8]:
-            return 'Winter'
-        else:
-            return 'Spring'
-
-    def _get_academic_info(self, date):
-        """Get academic calendar information for a specific date"""
-        if self.academic_calendar_df is None:
-            return None
-            
-        date_data = self.academic_calendar_df[
-            self.academic_calendar_df['date_id'].dt.date == date.date()
-        ]
-        
-        if len(date_data) == 0:
-            return None
-            
-        return date_data.iloc[0].to_dict()
+        calendar = self.academic_calendar_df
+        # Calendar rows of each type, counted per month in one grouped sum
+        counts = pd.DataFrame({
+            'term_days': calendar['event_type'].eq('Term'),
+            'holiday_days': calendar['event_type'].eq('Holiday'),
+            'exam_days': calendar['description'].eq('Exam')
+        }).groupby(calendar['date_id'].dt.to_period('M')).sum()
+
+        months = monthly_metrics.index.to_period('M')
+        counts = counts.reindex(months, fill_value=0)
+        for column in counts.columns:
+            monthly_metrics[column] = counts[column].to_numpy()
+        monthly_metrics['total_days'] = monthly_metrics.index.days_in_month
+
+    def _join_calendar(self, daily_df):
+        """Calendar event and weight of every day, joined in one indexed lookup"""
+        if self.calendar_by_date is None:
+            return daily_df.assign(academic_period=None, final_weight=np.nan, in_calendar=False)
+        daily_df = daily_df.join(self.calendar_by_date)
+        daily_df['in_calendar'] = daily_df['in_calendar'].eq(True)
+        daily_df['academic_period'] = daily_df['academic_period'].astype(object).where(daily_df['in_calendar'], None)
+        return daily_df
 
     def process_daily(self, merged_data):
         """Process merged data into daily metrics"""
         try:
-            df = merged_data.copy()
-            df['DATETIME'] = pd.to_datetime(df['Date'] + ' ' + df['Time'], 
-                                          format='%d/%m/%Y %H:%M:%S', 
-                                          dayfirst=True)
-            df = df.set_index('DATETIME')
-
-            # Filter working hours data
-            working_hours_data = df.between_time(
-                self.working_hours[0],
-                self.working_hours[1]
-            ).copy()
-            
-            working_hours_data.loc[:, 'date'] = working_hours_data.index.date
-
-            daily_metrics = []
-            for date, day_data in working_hours_data.groupby('date'):
-                date_dt = pd.to_datetime(date)
-                season = self._determine_season(date_dt)
-                academic_info = self._get_academic_info(date_dt)
+            if 'DATETIME' in merged_data.columns:
+                timestamps = pd.DatetimeIndex(merged_data['DATETIME'])
+            else:
+                timestamps = pd.DatetimeIndex(pd.to_datetime(
+                    merged_data['Date'] + ' ' + merged_data['Time'],
+                    format='%d/%m/%Y %H:%M:%S',
+                    dayfirst=True
+                ))
+            days = timestamps.normalize()
+            time_of_day = timestamps - days
+
+            # Working hours and time blocks are closed intervals, as between_time
+            # selects them; a reading on a block boundary counts in both blocks
+            def between(bounds):
+                start, end = (pd.Timedelta(hours=t.hour, minutes=t.minute) for t in bounds)
+                return np.asarray((time_of_day >= start) & (time_of_day <= end))
+
+            in_hours = between(self.working_hours)
+            temperature = merged_data['Air_Temperature_C_Avg'].to_numpy(dtype=float)
+            humidity = merged_data['Relative_Humidity_Avg'].to_numpy(dtype=float)
+            working = pd.DataFrame({
+                'date_id': days,
+                'temp': temperature,
+                'solar': merged_data['Solar_W_Avg'].to_numpy(dtype=float),
+                'wind': merged_data['Wind_Speed_ms_Avg'].to_numpy(dtype=float),
+                'gust': merged_data['Wind_Speed_ms_Max'].to_numpy(dtype=float),
+                'humidity': humidity,
+                'pressure': merged_data['Air_Pressure_hPa_Avg'].to_numpy(dtype=float),
+                'rain': merged_data['Rain_mm_Tot'].to_numpy(dtype=float)
+            })
+            # Block columns hold the reading inside the block and NaN outside,
+            # so their means come out of the same aggregation pass
+            for block_name, bounds in self.time_blocks.items():
+                in_block = between(bounds)
+                working[f'{block_name}_temp_mean'] = np.where(in_block, temperature, np.nan)
+                working[f'{block_name}_humidity_mean'] = np.where(in_block, humidity, np.nan)
+            working = working[in_hours]
+
+            block_means = {
+                f'{block_name}_{measure}_mean': (f'{block_name}_{measure}_mean', 'mean')
+                for block_name in self.time_blocks
+                for measure in ('temp', 'humidity')
+            }
+            daily_df = working.groupby('date_id').agg(
+                temp_mean_working=('temp', 'mean'),
+                temp_max_working=('temp', 'max'),
+                temp_min_working=('temp', 'min'),
+                global_radiation_sum=('solar', 'sum'),
+                peak_radiation=('solar', 'max'),
+                solar_mean_working=('solar', 'mean'),
+                wind_speed_mean=('wind', 'mean'),
+                max_gust_speed=('gust', 'max'),
+                humidity_mean_working=('humidity', 'mean'),
+                humidity_max_working=('humidity', 'max'),
+                humidity_min_working=('humidity', 'min'),
+                pressure_mean_working=('pressure', 'mean'),
+                rain_sum_working=('rain', 'sum'),
+                **block_means
+            )
+            daily_df['temp_range_working'] = daily_df['temp_max_working'] - daily_df['temp_min_working']
+            daily_df['humidity_range_working'] = (
+                daily_df['humidity_max_working'] - daily_df['humidity_min_working']
+            )
+            daily_df['wind_direction_dominant'] = self._dominant_wind_direction(
+                days[in_hours], merged_data['Wind_Direction_deg'].to_numpy(dtype=float)[in_hours]
+            )
 
-                metrics = self._calculate_daily_metrics(day_data, date_dt, season, academic_info)
-                daily_metrics.append(metrics)
+            months = daily_df.index.month
+            daily_df['season'] = np.select(
+                [np.isin(months, [12, 1, 2]), np.isin(months, [3, 4, 5]), np.isin(months, [6, 7, 8])],
+                ['Summer', 'Autumn', 'Winter'],
+                default='Spring'
+            )
+            daily_df['day_type'] = np.where(daily_df.index.weekday >= 6, 'Weekend', 'Weekday')
+            daily_df = self._join_calendar(daily_df)
+            daily_df['weighted_score'] = self._calculate_weighted_scores(daily_df)
 
-            daily_df = pd.DataFrame(daily_metrics)
-            daily_df.set_index('date_id', inplace=True)
-            return daily_df
+            return daily_df[self.daily_columns]
 
         except Exception as e:
             logger.error(f"Error processing daily metrics: {str(e)}")
             raise
 
-    def _calculate_daily_metrics(self, day_data, date_dt, season, academic_info):
-        """Calculate daily metrics for a single day"""
-        metrics = {
-            'date_id': date_dt,
-            'temp_mean_working': day_data['Air_Temperature_C_Avg'].mean(),
-            'temp_max_working': day_data['Air_Temperature_C_Avg'].max(),
-            'temp_min_working': day_data['Air_Temperature_C_Avg'].min(),
-            'temp_range_working': day_data['Air_Temperature_C_Avg'].max() - day_data['Air_Temperature_C_Avg'].min(),
-            'global_radiation_sum': day_data['Solar_W_Avg'].sum(),
-            'peak_radiation': day_data['Solar_W_Avg'].max(),
-            #'solar_duration_hours': len(day_data[day_data['Solar_W_Avg'] > 100]) / 12, #not working
-            'wind_speed_mean': day_data['Wind_Speed_ms_Avg'].mean(),
-            'wind_direction_dominant': day_data['Wind_Direction_deg'].mode()[0],
-            'max_gust_speed': day_data['Wind_Speed_ms_Max'].max(),
-            'humidity_mean_working': day_data['Relative_Humidity_Avg'].mean(),
-            'humidity_range_working': day_data['Relative_Humidity_Avg'].max() - day_data['Relative_Humidity_Avg'].min(),
-            'pressure_mean_working': day_data['Air_Pressure_hPa_Avg'].mean(),
-            'rain_sum_working': day_data['Rain_mm_Tot'].sum(),
-            'season': season,
-            'day_type': 'Weekend' if date_dt.weekday() >= 6 else 'Weekday',
-            'academic_period': academic_info['event_type'] if academic_info else None
-        }
-
-        # Add time block metrics
-        for block_name, (start, end) in self.time_blocks.items():
-            block_data = day_data.between_time(start, end)
-            metrics[f'{block_name}_temp_mean'] = block_data['Air_Temperature_C_Avg'].mean()
-            metrics[f'{block_name}_humidity_mean'] = block_data['Relative_Humidity_Avg'].mean()
-
-        # Calculate weighted score
-        metrics['weighted_score'] = self._calculate_weighted_score(day_data, season, academic_info)
-
-        return metrics
+    @staticmethod
+    def _dominant_wind_direction(days, directions):
+        """Most frequent direction per day, the smallest on a tie as Series.mode()[0]"""
+        counts = pd.DataFrame({'date_id': days, 'direction': directions}).dropna().groupby(
+            ['date_id', 'direction']
+        ).size().rename('count').reset_index()
+        # Groups come out sorted by direction, so the stable sort keeps the
+        # smallest of equally frequent directions first
+        counts = counts.sort_values('count', ascending=False, kind='stable')
+        return counts.drop_duplicates('date_id').set_index('date_id')['direction']
@@ -0,0 +1,358 @@
+# backend/app/services/workbook_session.py
+
+import pandas as pd
+from io import BytesIO
+from datetime import datetime
+from openpyxl import load_workbook
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+from pandas.io.parsers import TextParser
+from typing import Dict, List, Optional, Tuple
+from itertools import islice
+import numpy as np
+import hashlib
+import logging
+import os
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Parquet cache of parsed sheets, stored next to the workbook
+CACHE_DIR_NAME = '.sheet_cache'
+
+
+def column_index(column: str) -> int:
+    """Convert an Excel column letter such as 'AO' to a 0-based index"""
+    index = 0
+    for char in column.upper().strip():
+        if char < 'A' or char > 'Z':
+            raise ValueError(f"Invalid column name: {column}")
+        index = index * 26 + ord(char) - ord('A') + 1
+    return index - 1
+
+
+def column_range_to_indices(usecols: str) -> List[int]:
+    """Convert a usecols string such as 'B:AO' or 'A,C:E' to 0-based indices"""
+    indices = []
+    for area in usecols.split(','):
+        if ':' in area:
+            start, end = area.split(':')
+            indices.extend(range(column_index(start), column_index(end) + 1))
+        else:
+            indices.append(column_index(area))
+    return indices
+
+
+def _extent_union(a: Tuple, b: Tuple) -> Tuple:
+    """Combine two (max_row, max_col) extents; None means unbounded"""
+    return tuple(None if x is None or y is None else max(x, y) for x, y in zip(a, b))
+
+
+def _extent_covers(have: Tuple, need: Tuple) -> bool:
+    return all(h is None or (n is not None and h >= n) for h, n in zip(have, need))
+
+
+class WorkbookSession:
+    """
+    Opens the campus meter workbook once and parses each sheet at most once.
+    Processors request row/column slices with the same skiprows/nrows/usecols
+    arguments they would pass to pd.read_excel.
+
+    Sheets are streamed in read-only mode and only as far as needed: parsing
+    stops at the last row any planned or requested slice needs, and only the
+    columns up to the widest requested usecols range are built. A later
+    request that needs more rows continues the same stream.
+
+    Parsed sheets are also cached on disk as Parquet, keyed by the workbook's
+    SHA-256 and the sheet name, so an unchanged workbook is never re-parsed.
+    """
+
+    def __init__(self, excel_file: str, cache_dir: Optional[str] = None, use_cache: bool = True):
+        self.excel_file = excel_file
+        self.cache_dir = cache_dir or os.path.join(
+            os.path.dirname(os.path.abspath(excel_file)), CACHE_DIR_NAME
+        )
+        self.use_cache = use_cache
+        self.content = None
+        self.content_hash = None
+        self.workbook = None
+        self.sheets: Dict[str, dict] = {}  # sheet name -> rows, extent, open row stream
+        self.planned: Dict[str, Tuple] = {}
+        # Loaders running in parallel threads may share one session
+        self._lock = threading.RLock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _read_content(self) -> bytes:
+        """Read the file into memory once and hash it"""
+        if self.content is None:
+            with open(self.excel_file, 'rb') as f:
+                self.content = f.read()
+            self.content_hash = hashlib.sha256(self.content).hexdigest()
+        return self.content
+
+    def _open(self):
+        if self.workbook is None:
+            # Work from the in-memory copy so no handle is held between sheets
+            self.workbook = load_workbook(
+                BytesIO(self._read_content()), read_only=True, data_only=True, keep_links=False
+            )
+        return self.workbook
+
+    def _convert_cell(self, cell):
+        """Convert a cell the same way pandas' openpyxl reader does"""
+        if cell.value is None:
+            return ''
+        elif cell.data_type == TYPE_ERROR:
+            return np.nan
+        elif cell.data_type == TYPE_NUMERIC:
+            value = int(cell.value)
+            if value == cell.value:
+                return value
+            return float(cell.value)
+        return cell.value
+
+    def _slice_extent(self, skiprows: Optional[int], nrows: Optional[int],
+                      usecols: Optional[str]) -> Tuple:
+        """Rows and columns of the sheet a pd.read_excel-style slice touches"""
+        max_row = (skiprows or 0) + 1 + nrows if nrows is not None else None
+        max_col = max(column_range_to_indices(usecols)) + 1 if usecols else None
+        return (max_row, max_col)
+
+    def plan(self, sheet_name: str, skiprows: Optional[int] = None,
+             nrows: Optional[int] = None, usecols: Optional[str] = None):
+        """
+        Declare a slice that will be read later so the first parse of the sheet
+        covers it too, instead of extending the parse once per table.
+        """
+        extent = self._slice_extent(skiprows, nrows, usecols)
+        with self._lock:
+            if sheet_name in self.planned:
+                extent = _extent_union(self.planned[sheet_name], extent)
+            self.planned[sheet_name] = extent
+
+    def _parse_sheet(self, sheet_name: str, extent: Tuple, previous: Optional[dict]) -> dict:
+        """Stream rows of a sheet up to extent, trailing blanks trimmed"""
+        max_row, max_col = extent
+
+        if previous is not None and previous['stream'] is not None and previous['extent'][1] == max_col:
+            # Same columns as before, keep reading where the last parse stopped
+            rows, stream = previous['rows'], previous['stream']
+        else:
+            sheet = self._open()[sheet_name]
+            sheet.reset_dimensions()
+            rows, stream = [], sheet.iter_rows(max_col=max_col)
+
+        remaining = stream if max_row is None else islice(stream, max(max_row - len(rows), 0))
+        for row in remaining:
+            values = [self._convert_cell(cell) for cell in row]
+            while values and values[-1] == '':
+                values.pop()
+            rows.append(values)
+
+        if max_row is None or len(rows) < max_row:
+            # Reached the end of the sheet
+            stream, max_row = None, None
+
+        return {'rows': rows, 'extent': (max_row, max_col), 'stream': stream}
+
+    def _load_sheet(self, sheet_name: str, extent: Tuple = (None, None)) -> List[list]:
+        previous = self.sheets.get(sheet_name)
+        if previous is not None and _extent_covers(previous['extent'], extent):
+            return previous['rows']
+
+        if sheet_name in self.planned:
+            extent = _extent_union(extent, self.planned[sheet_name])
+        if previous is not None:
+            extent = _extent_union(extent, previous['extent'])
+
+        sheet = self._read_cached_sheet(sheet_name, extent) if self.use_cache else None
+        if sheet is None:
+            sheet = self._parse_sheet(sheet_name, extent, previous)
+            if self.use_cache:
+                self._write_cached_sheet(sheet_name, sheet['rows'], sheet['extent'])
+
+        self.sheets[sheet_name] = sheet
+        return sheet['rows']
+
+    def _cache_name(self, sheet_name: str) -> str:
+        return re.sub(r'[^A-Za-z0-9]+', '_', sheet_name).strip('_')
+
+    def _cache_path(self, sheet_name: str, extent: Tuple) -> str:
+        self._read_content()
+        max_row, max_col = (value if value is not None else 'all' for value in extent)
+        return os.path.join(
+            self.cache_dir,
+            f"{self.content_hash}_{self._cache_name(sheet_name)}.r{max_row}.c{max_col}.parquet"
+        )
+
+    def _rows_to_cells(self, rows: List[list]) -> Optional[pd.DataFrame]:
+        """
+        Flatten parsed rows into a typed long-format cell table for Parquet.
+        Blank cells are omitted. Returns None if a cell type can't be stored.
+        """
+        cells = {'row': [], 'col': [], 'kind': [], 'number': [], 'text': [], 'timestamp': []}
+        for row_idx, row in enumerate(rows):
+            for col_idx, value in enumerate(row):
+                if isinstance(value, str) and value == '':
+                    continue
+                number, text, timestamp = np.nan, None, pd.NaT
+                if isinstance(value, bool):
+                    kind, number = 'b', float(value)
+                elif isinstance(value, int):
+                    # Kept as text so integers of any size round-trip exactly
+                    kind, text = 'i', str(value)
+                elif isinstance(value, float):
+                    kind, number = ('n', np.nan) if np.isnan(value) else ('f', value)
+                elif isinstance(value, str):
+                    kind, text = 's', value
+                elif isinstance(value, datetime):
+                    kind, timestamp = 'd', value
+                else:
+                    return None
+                cells['row'].append(row_idx)
+                cells['col'].append(col_idx)
+                cells['kind'].append(kind)
+                cells['number'].append(number)
+                cells['text'].append(text)
+                cells['timestamp'].append(timestamp)
+
+        return pd.DataFrame({
+            'row': np.array(cells['row'], dtype='int32'),
+            'col': np.array(cells['col'], dtype='int32'),
+            'kind': cells['kind'],
+            'number': np.array(cells['number'], dtype='float64'),
+            'text': cells['text'],
+            'timestamp': pd.to_datetime(pd.Series(cells['timestamp'], dtype=object))
+        })
+
+    def _cells_to_rows(self, cells: pd.DataFrame) -> List[list]:
+        """Rebuild parsed rows from a cell table written by _rows_to_cells"""
+        if cells.empty:
+            return []
+
+        n_rows = int(cells['row'].max()) + 1
+        widths = cells.groupby('row')['col'].max() + 1
+        rows = [[''] * int(widths.get(i, 0)) for i in range(n_rows)]
+
+        for row_idx, col_idx, kind, number, text, timestamp in zip(
+            cells['row'].tolist(), cells['col'].tolist(), cells['kind'].tolist(),
+            cells['number'].tolist(), cells['text'].tolist(),
+            cells['timestamp'].array.to_pydatetime().tolist()
+        ):
+            if kind == 'i':
+                value = int(text)
+            elif kind == 'f':
+                value = number
+            elif kind == 'n':
+                value = np.nan
+            elif kind == 'b':
+                value = bool(number)
+            elif kind == 'd':
+                value = timestamp
+            else:
+                value = text
+            rows[row_idx][col_idx] = value
+        return rows
+
+    def _cached_files(self, sheet_name: str) -> List[Tuple[str, str, Tuple]]:
+        """(file name, workbook hash, extent) of every cache entry for a sheet"""
+        if not os.path.isdir(self.cache_dir):
+            return []
+        pattern = re.compile(
+            rf"^([0-9a-f]{{64}})_{re.escape(self._cache_name(sheet_name))}\.r(\w+)\.c(\w+)\.parquet$"
+        )
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            match = pattern.match(name)
+            if match:
+                extent = tuple(None if v == 'all' else int(v) for v in match.group(2, 3))
+                entries.append((name, match.group(1), extent))
+        return entries
+
+    def _read_cached_sheet(self, sheet_name: str, extent: Tuple) -> Optional[dict]:
+        self._read_content()
+        for name, content_hash, cached_extent in self._cached_files(sheet_name):
+            if content_hash != self.content_hash or not _extent_covers(cached_extent, extent):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                rows = self._cells_to_rows(pd.read_parquet(path))
+                logger.debug(f"Sheet cache hit for '{sheet_name}': {path}")
+                return {'rows': rows, 'extent': cached_extent, 'stream': None}
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable sheet cache {path}: {str(e)}")
+        return None
+
+    def _write_cached_sheet(self, sheet_name: str, rows: List[list], extent: Tuple):
+        cells = self._rows_to_cells(rows)
+        if cells is None:
+            logger.debug(f"Sheet '{sheet_name}' has cell types that can't be cached")
+            return
+
+        path = self._cache_path(sheet_name, extent)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write then rename so concurrent loaders never read a partial file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            cells.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+
+            # Drop entries for older workbooks and smaller extents of this one
+            for name, content_hash, cached_extent in self._cached_files(sheet_name):
+                stale = os.path.join(self.cache_dir, name)
+                if stale != path and (content_hash != self.content_hash
+                                      or _extent_covers(extent, cached_extent)):
+                    os.remove(stale)
+        except Exception as e:
+            logger.warning(f"Could not write sheet cache for '{sheet_name}': {str(e)}")
+
+    def read_sheet(self, sheet_name: str, skiprows: Optional[int] = None,
+                   nrows: Optional[int] = None, usecols: Optional[str] = None) -> pd.DataFrame:
+        """
+        Return a slice of a sheet as a DataFrame.
+        Mirrors pd.read_excel(header=0) so processors see identical frames.
+        """
+        try:
+            with self._lock:
+                rows = self._load_sheet(sheet_name, self._slice_extent(skiprows, nrows, usecols))
+
+                # pd.read_excel only reads the rows it needs when nrows is given
+                if nrows is not None:
+                    rows = rows[:(skiprows or 0) + 1 + nrows]
+
+                last_row_with_data = max(
+                    (i for i, row in enumerate(rows) if row), default=-1
+                )
+                rows = rows[:last_row_with_data + 1]
+            if not rows:
+                return pd.DataFrame()
+
+            width = max(len(row) for row in rows)
+            data = [row + [''] * (width - len(row)) for row in rows]
+
+            parser = TextParser(
+                data,
+                header=0,
+                skiprows=skiprows,
+                nrows=nrows,
+                usecols=column_range_to_indices(usecols) if usecols else None,
+                skip_blank_lines=False
+            )
+            return parser.read(nrows=nrows)
+
+        except Exception as e:
+            raise Exception(f"Error reading sheet '{sheet_name}': {str(e)}")
+
+    def close(self):
+        """Release the workbook handle and parsed sheets"""
+        with self._lock:
+            if self.workbook is not None:
+                self.workbook.close()
+                self.workbook = None
+            self.content = None
+            self.sheets = {}
@@ -0,0 +1,259 @@
+# backend/scripts/ingest.py
+"""
+Single entry point for loading every subsystem.
+
+Independent loaders run concurrently in a thread pool and share one parsed
+workbook; a stage only starts once the stages it depends on have finished,
+e.g. the energy total dashboard waits for stream electricity, steam/MTHW,
+gas and LTHW, and the rollup tables are rebuilt once everything they
+summarise has loaded. Per-stage timings are reported at the end.
+
+    python scripts/ingest.py                        # everything
+    python scripts/ingest.py --stages gas lthw      # a subset
+    python scripts/ingest.py --incremental          # only changed month columns
+"""
+import os
+import sys
+import time
+import argparse
+import logging
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import nullcontext
+
+# Add the parent directory to Python path
+current_dir = Path(__file__).resolve().parent
+backend_dir = current_dir.parent
+sys.path.append(str(backend_dir))
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models.load_manifest import LoadManifest, LoadVersion, WeatherFileManifest
+from app.models.meter_reading import MeterReading
+from app.models.energy_total_models import EnergyTotalDashboard
+from app.services.workbook_session import WorkbookSession
+from app.services.schema_upgrade import upgrade_schema
+from app.services.stream_elec_loader import StreamElecLoader
+from app.services.janitza_loader import JanitzaLoader
+from app.services.gas_loader import GasLoader
+from app.services.lthw_loader import LTHWLoader
+from app.services.mthw_loader import MTHWLoader
+from app.services.cfi_loader import CfiLoader
+from app.services.steam_mthw_loader import SteamMTHWLoader
+from app.services.auckland_electricity_loader import AucklandElectricityLoader
+from app.services.auckland_water_loader import AucklandWaterLoader
+from app.services.auckland_calculated_water_loader import AucklandCalculatedWaterLoader
+from app.services.weather_loader import WeatherLoader
+from app.services.weather_files import weather_files
+from app.services.weather_metric_loader import WeatherMetricLoader
+from app.services.energy_total_loader import EnergyTotalLoader
+from app.services.rollups import refresh_rollups, deferred_rollups
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(threadName)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class IngestContext:
+    """Everything a stage needs: database, shared workbook and load mode"""
+
+    def __init__(self, db_url: str, excel_file: Path, incremental: bool):
+        self.db_url = db_url
+        self.excel_file = excel_file
+        self.incremental = incremental
+        self.workbook = WorkbookSession(str(excel_file))
+
+
+def _load_workbook_tables(loader_class, create='create_tables'):
+    """Stage for a workbook loader that supports incremental month loads"""
+    def run(ctx: IngestContext):
+        loader = loader_class(ctx.db_url)
+        getattr(loader, create)()
+        return loader.load_data(str(ctx.excel_file), ctx.workbook, ctx.incremental)
+    return run
+
+
+def load_steam_mthw(ctx: IngestContext):
+    loader = SteamMTHWLoader(ctx.db_url)
+    loader.recreate_tables()
+    return loader.load_data(str(ctx.excel_file), ctx.workbook)
+
+
+def load_weather(ctx: IngestContext):
+    weather_dir = backend_dir / 'data' / 'Weather'
+    calendar_dir = backend_dir / 'data' / 'calendar'
+
+    loader = WeatherLoader(ctx.db_url)
+    loader.create_tables()
+    loader.load_weather_weights(weather_dir / 'Weather_Weights.xlsx')
+    loader.load_academic_calendar(calendar_dir / 'Otago_Calendar.xlsx')
+    loader.load_solar_energy(weather_dir / 'Mean_solar_Energy.csv')
+    if weather_files(weather_dir):
+        # Monthly exports: only new or changed files are processed on --incremental
+        return loader.load_weather_files(weather_dir, full=not ctx.incremental)
+    records = loader.load_weather_data(weather_dir / 'merged_weather_data.csv')
+    return {'daily': records['daily'], 'monthly': records['monthly']}
+
+
+def load_weather_metric(ctx: IngestContext):
+    loader = WeatherMetricLoader(ctx.db_url)
+    loader.create_tables()
+    return loader.load_data(str(backend_dir / 'data' / 'Weather' / 'Load_weather_monthly.csv'))
+
+
+def load_energy_total(ctx: IngestContext):
+    engine = create_engine(ctx.db_url)
+    EnergyTotalDashboard.__table__.create(engine, checkfirst=True)
+    session = sessionmaker(bind=engine)()
+    try:
+        return EnergyTotalLoader(session).load_data()
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def load_rollups(ctx: IngestContext):
+    engine = create_engine(ctx.db_url)
+    try:
+        return refresh_rollups(engine)
+    finally:
+        engine.dispose()
+
+
+# Stage name -> (function, stages that must finish first)
+STAGES = {
+    'stream_elec': (_load_workbook_tables(StreamElecLoader), ()),
+    'janitza': (_load_workbook_tables(JanitzaLoader), ()),
+    'gas': (_load_workbook_tables(GasLoader), ()),
+    'lthw': (_load_workbook_tables(LTHWLoader), ()),
+    'mthw': (_load_workbook_tables(MTHWLoader), ()),
+    'cfi': (_load_workbook_tables(CfiLoader), ()),
+    'auckland_electricity': (_load_workbook_tables(AucklandElectricityLoader, 'recreate_tables'), ()),
+    'auckland_water': (_load_workbook_tables(AucklandWaterLoader), ()),
+    'auckland_calculated_water': (_load_workbook_tables(AucklandCalculatedWaterLoader), ()),
+    'steam_mthw': (load_steam_mthw, ()),
+    'weather': (load_weather, ()),
+    'weather_metric': (load_weather_metric, ()),
+    'energy_total': (load_energy_total, ('stream_elec', 'steam_mthw', 'gas', 'lthw')),
+    'rollups': (load_rollups, (
+        'stream_elec', 'janitza', 'gas', 'lthw', 'mthw', 'cfi', 'auckland_electricity',
+        'auckland_water', 'auckland_calculated_water', 'steam_mthw', 'energy_total'
+    )),
+}
+
+
+def _run_stage(name: str, ctx: IngestContext):
+    start = time.perf_counter()
+    logger.info(f"Starting {name}")
+    result = STAGES[name][0](ctx)
+    return result, time.perf_counter() - start
+
+
+def run_pipeline(ctx: IngestContext, stages, workers: int) -> dict:
+    """
+    Run the selected stages, each as soon as its dependencies have finished.
+    Dependencies outside the selection are treated as already loaded.
+    Returns {stage: {'status', 'seconds', 'result' or 'error'}}.
+    """
+    selected = set(stages)
+    pending = {
+        name: {dep for dep in STAGES[name][1] if dep in selected}
+        for name in stages
+    }
+    report = {}
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ingest') as pool:
+        running = {}
+        while pending or running:
+            for name in [n for n, deps in pending.items() if not deps]:
+                del pending[name]
+                running[pool.submit(_run_stage, name, ctx)] = name
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    result, seconds = future.result()
+                    report[name] = {'status': 'ok', 'seconds': seconds, 'result': result}
+                    logger.info(f"Finished {name} in {seconds:.1f}s: {result}")
+                    for deps in pending.values():
+                        deps.discard(name)
+                except Exception as e:
+                    report[name] = {'status': 'failed', 'seconds': None, 'error': str(e)}
+                    logger.error(f"{name} failed: {str(e)}")
+
+            # Anything waiting on a failed stage can never run
+            failed = {n for n, r in report.items() if r['status'] != 'ok'}
+            for name in [n for n, deps in pending.items() if deps & failed]:
+                del pending[name]
+                report[name] = {'status': 'skipped', 'seconds': None, 'error': 'a dependency failed'}
+                failed.add(name)
+                logger.warning(f"Skipping {name}, a dependency failed")
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load all UEMS data sources')
+    parser.add_argument('--stages', nargs='+', choices=list(STAGES), default=list(STAGES),
+                        help='stages to run (default: all)')
+    parser.add_argument('--workers', type=int, default=int(os.getenv('INGEST_WORKERS', 4)),
+                        help='loaders running at once (default: 4)')
+    parser.add_argument('--incremental', action='store_true',
+                        default=os.getenv('INCREMENTAL_LOAD', 'false').lower() == 'true',
+                        help='only update month columns changed since the last load')
+    args = parser.parse_args()
+
+    # Load environment variables
+    load_dotenv()
+    db_url = os.getenv('DATABASE_URL')
+    if not db_url:
+        raise ValueError("DATABASE_URL environment variable not set")
+
+    excel_file = backend_dir / 'data' / os.getenv('DATA_FILE', '2024 campus meter readings.xlsx')
+    if not excel_file.exists():
+        raise FileNotFoundError(f"Excel file not found at {excel_file}")
+
+    # Shared objects are created once up front so parallel stages never race on them
+    engine = create_engine(db_url)
+    with engine.begin() as connection:
+        connection.execute(text('CREATE SCHEMA IF NOT EXISTS dbo;'))
+        LoadManifest.__table__.create(connection, checkfirst=True)
+        LoadVersion.__table__.create(connection, checkfirst=True)
+        WeatherFileManifest.__table__.create(connection, checkfirst=True)
+        MeterReading.__table__.create(connection, checkfirst=True)
+        upgrade_schema(connection)
+    engine.dispose()
+
+    ctx = IngestContext(db_url, excel_file, args.incremental)
+    total_start = time.perf_counter()
+    # With the rollups stage selected, the rollups are rebuilt once at the
+    # end rather than after every loader
+    refresh = deferred_rollups() if 'rollups' in args.stages else nullcontext()
+    try:
+        with refresh:
+            report = run_pipeline(ctx, args.stages, args.workers)
+    finally:
+        ctx.workbook.close()
+    total = time.perf_counter() - total_start
+
+    logger.info("\nStage timings:")
+    for name in args.stages:
+        entry = report.get(name, {'status': 'not run', 'seconds': None})
+        seconds = f"{entry['seconds']:.1f}s" if entry['seconds'] is not None else '-'
+        logger.info(f"{name:<28}{entry['status']:<10}{seconds}")
+    logger.info(f"{'total (wall clock)':<28}{'':<10}{total:.1f}s")
+
+    if any(entry['status'] != 'ok' for entry in report.values()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
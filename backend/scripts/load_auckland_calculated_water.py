@@ -15,12 +15,13 @@ backend_dir = current_dir.parent
 import sys
 sys.path.append(str(backend_dir.parent))
 
-def load_auckland_calculated_water(excel_filename='2024 campus meter readings.xlsx'):
+def load_auckland_calculated_water(excel_filename='2024 campus meter readings.xlsx', workbook=None):
     """
     Load Auckland calculated water data from Excel file
     
     Args:
         excel_filename (str): Name of the Excel file to process
+        workbook (WorkbookSession): Optional already-open workbook to share between loaders
         
     Returns:
         int: Number of records loaded
@@ -55,7 +56,9 @@ def load_auckland_calculated_water(excel_filename='2024 campus meter readings.xl
         loader.create_tables()
         
         logger.info("Loading data...")
-        records_loaded = loader.load_data(str(excel_file))
+        # INCREMENTAL_LOAD=true only updates month columns changed since the last load
+        incremental = os.getenv('INCREMENTAL_LOAD', 'false').lower() == 'true'
+        records_loaded = loader.load_data(str(excel_file), workbook, incremental)
         
         logger.info(f"Successfully loaded {records_loaded} records")
         
@@ -14,11 +14,12 @@ backend_dir = current_dir.parent
 import sys
 sys.path.append(str(backend_dir.parent))
 
-def load_auckland_electricity(excel_filename='2024 campus meter readings.xlsx'):
+def load_auckland_electricity(excel_filename='2024 campus meter readings.xlsx', workbook=None):
     """
     Load Auckland electricity data from Excel file
     Args:
         excel_filename (str): Name of the Excel file to process
+        workbook (WorkbookSession): Optional already-open workbook to share between loaders
     Returns:
         int: Number of records loaded
     """
@@ -51,7 +52,9 @@ def load_auckland_electricity(excel_filename='2024 campus meter readings.xlsx'):
         loader.recreate_tables()
         
         logger.info("Loading data...")
-        records_loaded = loader.load_data(str(excel_file))
+        # INCREMENTAL_LOAD=true only updates month columns changed since the last load
+        incremental = os.getenv('INCREMENTAL_LOAD', 'false').lower() == 'true'
+        records_loaded = loader.load_data(str(excel_file), workbook, incremental)
         logger.info(f"Successfully loaded {records_loaded} records")
         
         verification = loader.verify_data()
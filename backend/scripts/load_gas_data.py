@@ -43,7 +43,9 @@ def main():
         loader.create_tables()
         
         logger.info("Loading data...")
-        records = loader.load_data(str(excel_file))
+        # INCREMENTAL_LOAD=true only updates month columns changed since the last load
+        incremental = os.getenv('INCREMENTAL_LOAD', 'false').lower() == 'true'
+        records = loader.load_data(str(excel_file), incremental=incremental)
         
         logger.info("\nRecords loaded:")
         for table_name, count in records.items():
@@ -0,0 +1,104 @@
+# backend/scripts/load_interval_data.py
+"""
+Load high-frequency readings into the month-partitioned dbo.interval_reading.
+
+    python scripts/load_interval_data.py --weather data/Weather/merged_weather_data.csv
+    python scripts/load_interval_data.py --csv janitza_15min.csv --source janitza \
+        --utility electricity --unit kWh --interval 15
+    python scripts/load_interval_data.py --detach-before 2022-01 [--drop]
+
+A --csv file needs meter_id, timestamp and value columns.
+"""
+import os
+import sys
+import argparse
+from datetime import datetime
+from pathlib import Path
+import logging
+
+current_dir = Path(__file__).resolve().parent
+backend_dir = current_dir.parent
+sys.path.append(str(backend_dir))
+
+import pandas as pd
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+
+from app.services.weather_preprocessor import WeatherDataPreprocessor, WeatherOrderError
+from app.services.interval_readings import load_intervals, weather_intervals, detach_partitions
+from app.services.rollups import deferred_rollups
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def read_interval_csv(path: str, source: str, utility: str, unit: str, interval: int) -> pd.DataFrame:
+    data = pd.read_csv(path, usecols=['meter_id', 'timestamp', 'value'])
+    return pd.DataFrame({
+        'meter_id': f"{source}:" + data['meter_id'].astype(str).str.strip(),
+        'reading_time': pd.to_datetime(data['timestamp']),
+        'value': pd.to_numeric(data['value'], errors='coerce'),
+        'unit': unit,
+        'utility': utility,
+        'source': source,
+        'interval_minutes': interval
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load interval readings')
+    parser.add_argument('--weather', help='merged 5-minute weather CSV')
+    parser.add_argument('--csv', help='interval CSV with meter_id, timestamp, value')
+    parser.add_argument('--source', default='janitza')
+    parser.add_argument('--utility', default='electricity')
+    parser.add_argument('--unit', default='kWh')
+    parser.add_argument('--interval', type=int, default=15, help='minutes between readings')
+    parser.add_argument('--detach-before', help='detach partitions for months before YYYY-MM')
+    parser.add_argument('--drop', action='store_true', help='drop detached partitions')
+    args = parser.parse_args()
+
+    load_dotenv()
+    db_url = os.getenv('DATABASE_URL')
+    if not db_url:
+        raise ValueError("DATABASE_URL environment variable not set")
+
+    engine = create_engine(db_url)
+    try:
+        with engine.begin() as connection:
+            connection.execute(text('CREATE SCHEMA IF NOT EXISTS dbo;'))
+
+        # One rollup refresh over everything this run loaded, not one per chunk
+        with deferred_rollups(engine):
+            if args.weather:
+                preprocessor = WeatherDataPreprocessor()
+                try:
+                    # A few days at a time, so the whole history never sits in memory
+                    records = sum(
+                        load_intervals(engine, weather_intervals(readings))
+                        for readings in preprocessor.iter_days(args.weather)
+                    )
+                except WeatherOrderError as e:
+                    # Re-loading replaces the days already written
+                    logger.warning(f"{str(e)}, loading the whole file")
+                    records = load_intervals(engine, weather_intervals(preprocessor.preprocess_data(args.weather)))
+                logger.info(f"Loaded {records} weather interval readings")
+
+            if args.csv:
+                data = read_interval_csv(args.csv, args.source, args.utility, args.unit, args.interval)
+                records = load_intervals(engine, data)
+                logger.info(f"Loaded {records} {args.source} interval readings")
+
+        if args.detach_before:
+            before = datetime.strptime(args.detach_before, '%Y-%m').date()
+            with engine.begin() as connection:
+                detached = detach_partitions(connection, before, drop=args.drop)
+            logger.info(f"{'Dropped' if args.drop else 'Detached'} {len(detached)} partitions: {', '.join(detached)}")
+
+    except Exception as e:
+        logger.error(f"Error: {str(e)}")
+        raise
+    finally:
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
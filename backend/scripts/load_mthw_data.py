@@ -52,7 +52,9 @@ def main():
         
         # Load data
         logger.info("Loading data...")
-        records = loader.load_data(str(excel_file))
+        # INCREMENTAL_LOAD=true only updates month columns changed since the last load
+        incremental = os.getenv('INCREMENTAL_LOAD', 'false').lower() == 'true'
+        records = loader.load_data(str(excel_file), incremental=incremental)
         
         # Log results for each table
         logger.info("\nRecords loaded:")
@@ -0,0 +1,2 @@
+# backend/tests/baseline/__init__.py
+"""Original implementations of rewritten services, used as test oracles"""
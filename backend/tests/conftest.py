@@ -0,0 +1,112 @@
+# backend/tests/conftest.py
+"""
+Tests run against SQLite files. The models live in the dbo schema, so every
+SQLite connection attaches a second file as dbo and CREATE SCHEMA is skipped.
+"""
+import sqlite3
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(backend_dir))
+
+_dbo = {}
+
+
+@event.listens_for(Engine, 'connect')
+def _attach_dbo(dbapi_connection, connection_record):
+    if isinstance(dbapi_connection, sqlite3.Connection) and 'path' in _dbo:
+        dbapi_connection.execute(f"ATTACH DATABASE '{_dbo['path']}' AS dbo")
+
+
+@event.listens_for(Engine, 'before_cursor_execute', retval=True)
+def _skip_create_schema(conn, cursor, statement, parameters, context, executemany):
+    if conn.dialect.name == 'sqlite' and statement.lstrip().upper().startswith('CREATE SCHEMA'):
+        return 'SELECT 1', ()
+    return statement, parameters
+
+
+@pytest.fixture
+def database_url(tmp_path, monkeypatch):
+    _dbo['path'] = str(tmp_path / 'dbo.db')
+    url = f"sqlite:///{tmp_path / 'main.db'}"
+    monkeypatch.setenv('DATABASE_URL', url)
+    yield url
+    _dbo.pop('path', None)
+
+
+@pytest.fixture
+def engine(database_url):
+    engine = create_engine(database_url)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def app(database_url, monkeypatch):
+    from app import create_app, db
+    # Re-read the load versions on every request
+    monkeypatch.setenv('RESPONSE_CACHE_VERSION_CHECK', '0')
+    app = create_app()
+    app.config['TESTING'] = True
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def make_weather(days: int, start: str = '2022-01-01', seed: int = 0):
+    """Synthetic 5-minute readings (Date, Time, the measurements and DATETIME)
+    with gaps, plus an academic calendar, season weights and solar energy"""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=days * 288, freq='5min')
+    n = len(index)
+    readings = pd.DataFrame({
+        'Date': index.strftime('%d/%m/%Y'),
+        'Time': index.strftime('%H:%M:%S'),
+        'Air_Temperature_C_Avg': rng.normal(12, 5, n).round(2),
+        'Relative_Humidity_Avg': rng.uniform(30, 100, n).round(1),
+        'Wind_Speed_ms_Avg': rng.gamma(2, 2, n).round(2),
+        'Wind_Direction_deg': rng.integers(0, 36, n) * 10.0,
+        'Solar_W_Avg': np.clip(rng.normal(200, 150, n), 0, None).round(1),
+        'UVA_W_AVG': rng.uniform(0, 40, n).round(2),
+        'UVB_W_AVG': rng.uniform(0, 2, n).round(3),
+        'Quantum_umol_AVG': rng.uniform(0, 2000, n).round(1),
+        'Rain_mm_Tot': rng.choice([0, 0, 0, 0.2], n),
+        'Air_Pressure_hPa_Avg': rng.normal(1010, 5, n).round(1),
+        'Wind_Speed_ms_Max': rng.gamma(3, 2, n).round(2),
+    })
+    for column in ['Air_Temperature_C_Avg', 'Solar_W_Avg', 'Relative_Humidity_Avg']:
+        readings.loc[rng.random(n) < 0.05, column] = np.nan
+    readings['DATETIME'] = index
+
+    dates = pd.date_range(index[0].normalize() - pd.Timedelta(days=31), index[-1] + pd.Timedelta(days=31), freq='D')
+    calendar = pd.DataFrame({
+        'date_id': dates,
+        'event_type': rng.choice(['Term', 'Holiday', 'Break'], len(dates)),
+        'description': rng.choice(['Exam', 'Lecture', None], len(dates)),
+        'final_weight': rng.uniform(0.2, 1.2, len(dates)).round(2)
+    })
+    # Days missing from the calendar
+    calendar = calendar.sample(frac=0.8, random_state=1).sort_values('date_id')
+
+    weights = pd.read_excel(backend_dir / 'data' / 'Weather' / 'Weather_Weights.xlsx')
+
+    months = pd.period_range(index[0], index[-1], freq='M')
+    solar = pd.DataFrame({
+        'Year': months.year, 'Month': months.month,
+        'Mean_daily_Solar_energy': rng.uniform(2, 25, len(months)).round(2)
+    })
+    solar['Date'] = pd.to_datetime(solar[['Year', 'Month']].assign(DAY=1))
+    return readings, calendar, weights, solar
@@ -0,0 +1,44 @@
+# backend/tests/test_batch_routes.py
+
+import pytest
+from sqlalchemy import event
+
+from app import db
+
+
+@pytest.fixture
+def statements(app):
+    """Data queries the app runs, without the load version reads"""
+    seen = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if 'load_versions' not in statement and statement.lstrip().upper().startswith('SELECT'):
+            seen.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    yield seen
+    event.remove(engine, 'before_cursor_execute', record)
+
+
+@pytest.mark.parametrize('body, error', [
+    ({'datasets': ['steam-mthw/readings', {'name': 'gas/consumption', 'params': {'fields': 'nope'}}]},
+     'Unknown field(s): nope'),
+    ({'datasets': ['steam-mthw/readings', {'name': 'gas/consumption', 'params': {'year': 2024}}]},
+     "'year', 'from' and 'to' are not supported for this dataset"),
+    ({'datasets': ['steam-mthw/readings', {'name': 'cfi/rooms', 'params': {'meter': 'D201'}}]},
+     "'meter' is not supported for this dataset"),
+])
+def test_invalid_parameters_fail_before_any_query(client, statements, body, error):
+    response = client.post('/api/batch', json=body)
+    assert response.status_code == 400
+    assert response.get_json()['error'] == error
+    assert statements == []
+
+
+def test_valid_batch_runs_every_query(client, statements):
+    response = client.get('/api/batch?datasets=steam-mthw/readings,gas/consumption&limit=5')
+    assert response.status_code == 200
+    assert set(response.get_json()['data']) == {'steam-mthw/readings', 'gas/consumption'}
+    assert len(statements) == 2
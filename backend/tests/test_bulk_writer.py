@@ -0,0 +1,104 @@
+# backend/tests/test_bulk_writer.py
+
+import csv
+import io
+from datetime import date
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+
+from app.models.gas_models import GasConsumption
+from app.models.steam_mthw import SteamMTHWReading
+from app.services import bulk_writer
+from app.services.bulk_writer import write_dataframe
+
+
+class _Cursor:
+    def __init__(self, copies):
+        self.copies = copies
+
+    def copy_expert(self, statement, buffer):
+        self.copies.append((statement, buffer.read()))
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def copies():
+    return []
+
+
+@pytest.fixture
+def connection(copies):
+    """A psycopg2 connection as far as write_dataframe can tell, recording each COPY"""
+    return SimpleNamespace(
+        dialect=PGDialect_psycopg2(),
+        connection=SimpleNamespace(cursor=lambda: _Cursor(copies))
+    )
+
+
+def _copied_rows(copies) -> list:
+    """Rows as PostgreSQL reads the CSV: unquoted \\N is NULL"""
+    rows = []
+    for _, body in copies:
+        for row in csv.reader(io.StringIO(body)):
+            rows.append([None if field == bulk_writer.COPY_NULL else field for field in row])
+    return rows
+
+
+def test_copy_writes_nulls_dates_and_integers(connection, copies):
+    data = pd.DataFrame({
+        'month': ['Jan', 'Feb', None],
+        'year': [2024.0, 2024.0, np.nan],
+        'period': ['2024-01-01', pd.Timestamp('2024-02-01'), None],
+        'mthw_consumption_kwh': [1.5, np.nan, 0.1 + 0.2],
+        'not_a_column': [1, 2, 3],
+    })
+    assert write_dataframe(connection, SteamMTHWReading, data) == 3
+
+    statement, _ = copies[0]
+    assert statement.startswith('COPY dbo.steam_mthw_readings (month, year, period, mthw_consumption_kwh, created_at, updated_at)')
+    assert "NULL '\\N'" in statement
+
+    rows = _copied_rows(copies)
+    assert [row[:4] for row in rows] == [
+        ['Jan', '2024', '2024-01-01', '1.5'],
+        ['Feb', '2024', '2024-02-01', None],
+        [None, None, None, repr(0.1 + 0.2)],
+    ]
+    # created_at and updated_at get their Python-side defaults
+    assert all(row[4] and row[5] for row in rows)
+
+
+def test_copy_keeps_text_intact(connection, copies):
+    descriptions = ['D201, "Adams" Building', '', 'Line one\nline two', 'Māori Studies']
+    data = pd.DataFrame({'object_description': descriptions, 'Jan_2024': [1.0, 2.0, None, 4.0]})
+    write_dataframe(connection, GasConsumption, data)
+
+    columns = copies[0][0].split('(')[1].split(')')[0].split(', ')
+    rows = _copied_rows(copies)
+    assert [row[columns.index('object_description')] for row in rows] == descriptions
+    assert [row[columns.index('"Jan_2024"')] for row in rows] == ['1.0', '2.0', None, '4.0']
+
+
+def test_copy_is_sent_in_chunks(connection, copies, monkeypatch):
+    monkeypatch.setattr(bulk_writer, 'COPY_CHUNK_ROWS', 2)
+    data = pd.DataFrame({'month': ['Jan', 'Feb', 'Mar', 'Apr', 'May'], 'year': 2024})
+    assert write_dataframe(connection, SteamMTHWReading, data) == 5
+
+    assert len(copies) == 3
+    assert [row[0] for row in _copied_rows(copies)] == ['Jan', 'Feb', 'Mar', 'Apr', 'May']
+
+
+def test_empty_frame_sends_nothing(connection, copies):
+    assert write_dataframe(connection, SteamMTHWReading, pd.DataFrame({'month': []})) == 0
+    assert copies == []
+
+
+def test_prepared_dates_are_dates():
+    frame = bulk_writer.prepare_frame(SteamMTHWReading.__table__, pd.DataFrame({'period': ['2024-03-01']}))
+    assert frame['period'].tolist() == [date(2024, 3, 1)]
@@ -0,0 +1,116 @@
+# backend/tests/test_energy_total_loader.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app import db
+from app.models.energy_total_models import EnergyTotalDashboard
+from app.models.gas_models import GasConsumption
+from app.models.lthw_models import LTHWConsumption
+from app.models.steam_mthw import SteamMTHWReading
+from app.models.stream_elec_models import TotalStreamDnElectricity
+from app.services.bulk_writer import write_dataframe
+from app.services.energy_total_loader import EnergyTotalLoader
+from app.services.meter_readings import month_columns
+
+COLUMNS = [
+    'total_stream_dn_electricity_kwh', 'mthw_kwh', 'steam_kwh',
+    'lpg_kwh', 'woodchip_pellet_kwh', 'solar_kwh', 'total_kwh'
+]
+
+
+def _wide(model, name_column, rows):
+    """rows: (name, {month column: value})"""
+    frame = pd.DataFrame(np.nan, index=range(len(rows)), columns=month_columns(model))
+    frame.insert(0, name_column, [name for name, _ in rows])
+    for position, (_, values) in enumerate(rows):
+        for column, value in values.items():
+            frame.loc[position, column] = value
+    return frame
+
+
+def _expected(session):
+    """The dashboard as the original loader built it, one stream row at a time"""
+    rows = []
+    for stream in session.query(TotalStreamDnElectricity).order_by(TotalStreamDnElectricity.id):
+        month, year = stream.meter_reading_month, stream.meter_reading_year
+        mthw_steam = session.query(SteamMTHWReading).filter_by(
+            month=month, year=year
+        ).order_by(SteamMTHWReading.id).first()
+        lpg = session.query(GasConsumption).filter_by(object_description=' Total Gas Energy - DN').first()
+        woodchip = session.query(LTHWConsumption).filter_by(object_name=' Total Wood Energy - DN').first()
+        solar = session.query(LTHWConsumption).filter_by(object_name='Total Solar Energy - DN').first()
+
+        column_name = f"{month}_{year}"
+        values = [
+            stream.total_stream_dn_electricity_kwh if stream.total_stream_dn_electricity_kwh != 0 else None,
+            mthw_steam.mthw_consumption_kwh if mthw_steam else None,
+            mthw_steam.total_steam_consumption_kwh if mthw_steam else None,
+            getattr(lpg, column_name, None),
+            getattr(woodchip, column_name, None),
+            getattr(solar, column_name, None),
+        ]
+        total = float(sum(values)) if all(v is not None for v in values) else None
+        rows.append([month, year] + values + [total])
+    return pd.DataFrame(rows, columns=['month', 'year'] + COLUMNS)
+
+
+@pytest.fixture
+def sources(app):
+    stream = pd.DataFrame({
+        'meter_reading_month': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jan'],
+        'meter_reading_year': [2024, 2024, 2024, 2024, 2024, 2025],
+        # A zero reading is a month that has not been read yet
+        'total_stream_dn_electricity_kwh': [1000.0, 0.0, 1200.0, 1300.0, None, 900.0],
+    })
+    steam = pd.DataFrame({
+        # Feb read twice, Apr never read
+        'month': ['Jan', 'Feb', 'Feb', 'Mar', 'May', 'Jan'],
+        'year': [2024, 2024, 2024, 2024, 2024, 2025],
+        'mthw_consumption_kwh': [10.0, 20.0, 25.0, None, 50.0, 60.0],
+        'total_steam_consumption_kwh': [1.0, 2.0, 2.5, 3.0, 5.0, 6.0],
+    })
+    months = {'Jan_2024': 7.0, 'Feb_2024': 8.0, 'Mar_2024': 9.0, 'Apr_2024': 10.0, 'May_2024': 11.0}
+    gas = _wide(GasConsumption, 'object_description', [
+        ('D201 Adams Building', {'Jan_2024': 1.0}),
+        (' Total Gas Energy - DN', months),
+    ])
+    lthw = _wide(LTHWConsumption, 'object_name', [
+        (' Total Wood Energy - DN', {**months, 'Mar_2024': None}),
+        ('Total Solar Energy - DN', {**months, 'Jan_2025': 4.0}),
+    ])
+    with app.app_context():
+        connection = db.session.connection()
+        write_dataframe(connection, TotalStreamDnElectricity.__table__, stream)
+        write_dataframe(connection, SteamMTHWReading.__table__, steam)
+        write_dataframe(connection, GasConsumption.__table__, gas)
+        write_dataframe(connection, LTHWConsumption.__table__, lthw)
+        db.session.commit()
+
+
+def test_dashboard_matches_the_row_by_row_build(app, sources):
+    with app.app_context():
+        expected = _expected(db.session)
+        assert EnergyTotalLoader(db.session).load_data() == len(expected)
+        loaded = pd.read_sql(
+            db.select(EnergyTotalDashboard.__table__).order_by(EnergyTotalDashboard.id),
+            db.session.connection()
+        )
+
+    # Only Jan 2024 has every source
+    assert expected['total_kwh'].notna().tolist() == [True, False, False, False, False, False]
+    pd.testing.assert_frame_equal(
+        loaded[['month', 'year'] + COLUMNS], expected.astype({column: float for column in COLUMNS})
+    )
+    assert loaded['period'].astype(str).tolist() == [
+        '2024-01-01', '2024-02-01', '2024-03-01', '2024-04-01', '2024-05-01', '2025-01-01'
+    ]
+
+
+def test_reload_replaces_the_dashboard(app, sources):
+    with app.app_context():
+        loader = EnergyTotalLoader(db.session)
+        loader.load_data()
+        assert loader.load_data() == 6
+        assert db.session.query(EnergyTotalDashboard).count() == 6
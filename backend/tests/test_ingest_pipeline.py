@@ -0,0 +1,84 @@
+# backend/tests/test_ingest_pipeline.py
+
+import threading
+import time
+
+import pytest
+
+from scripts import ingest
+
+# Stage name -> dependencies, shaped like the real pipeline: two independent
+# loaders, a stage needing both, one after that, and a side branch
+GRAPH = {
+    'a': (),
+    'b': (),
+    'c': ('a', 'b'),
+    'd': ('c',),
+    'e': ('a',),
+}
+
+
+@pytest.fixture
+def events(monkeypatch):
+    """(event, stage) in the order stub stages start and end"""
+    seen = []
+    lock = threading.Lock()
+
+    def stage(name):
+        def run(ctx):
+            with lock:
+                seen.append(('start', name))
+            # Long enough that a stage started too early would overlap
+            time.sleep(0.05)
+            with lock:
+                seen.append(('end', name))
+            if name in ctx.failing:
+                raise RuntimeError(f"{name} broke")
+            return f"{name} loaded"
+        return run
+
+    monkeypatch.setattr(ingest, 'STAGES', {name: (stage(name), deps) for name, deps in GRAPH.items()})
+    return seen
+
+
+class _Context:
+    def __init__(self, *failing):
+        self.failing = set(failing)
+
+
+def _started(events) -> list:
+    return [name for event, name in events if event == 'start']
+
+
+def test_stages_start_after_their_dependencies(events):
+    report = ingest.run_pipeline(_Context(), list(GRAPH), workers=4)
+
+    assert {name: entry['status'] for name, entry in report.items()} == dict.fromkeys(GRAPH, 'ok')
+    assert report['d']['result'] == 'd loaded'
+    for name, deps in GRAPH.items():
+        start = events.index(('start', name))
+        assert all(events.index(('end', dep)) < start for dep in deps)
+    # Independent stages run at the same time
+    assert set(events[:2]) == {('start', 'a'), ('start', 'b')}
+
+
+def test_dependants_of_a_failed_stage_are_skipped(events):
+    report = ingest.run_pipeline(_Context('b'), list(GRAPH), workers=4)
+
+    assert report['b'] == {'status': 'failed', 'seconds': None, 'error': 'b broke'}
+    assert {name: report[name]['status'] for name in ('a', 'c', 'd', 'e')} == {
+        'a': 'ok', 'c': 'skipped', 'd': 'skipped', 'e': 'ok'
+    }
+    assert sorted(_started(events)) == ['a', 'b', 'e']
+
+
+def test_dependencies_outside_the_selection_are_ignored(events):
+    report = ingest.run_pipeline(_Context(), ['d', 'c'], workers=4)
+
+    assert {name: entry['status'] for name, entry in report.items()} == {'c': 'ok', 'd': 'ok'}
+    assert _started(events) == ['c', 'd']
+
+
+def test_every_dependency_is_a_stage():
+    for name, (_, deps) in ingest.STAGES.items():
+        assert set(deps) <= set(ingest.STAGES) - {name}
@@ -0,0 +1,92 @@
+# backend/tests/test_list_query.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app import db
+from app.models.gas_models import GasConsumption
+from app.models.steam_mthw import SteamMTHWReading
+from app.services.bulk_writer import write_dataframe
+from app.services.meter_readings import month_columns
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+
+@pytest.fixture
+def tables(app):
+    gas = pd.DataFrame(np.nan, index=range(7), columns=month_columns(GasConsumption))
+    gas.insert(0, 'object_description', [f"D20{n} Building" for n in range(7)])
+    gas['Jan_2024'] = np.arange(7, dtype=float)
+
+    # Two years of months, stored out of calendar order
+    steam = pd.DataFrame({
+        'month': MONTHS * 2, 'year': [2023] * 12 + [2024] * 12,
+        'mthw_consumption_kwh': np.arange(24, dtype=float)
+    }).sample(frac=1, random_state=0)
+    steam['period'] = pd.to_datetime(steam['year'].astype(str) + steam['month'], format='%Y%b').dt.date
+
+    with app.app_context():
+        connection = db.session.connection()
+        write_dataframe(connection, GasConsumption.__table__, gas)
+        write_dataframe(connection, SteamMTHWReading.__table__, steam)
+        db.session.commit()
+
+
+def _pages(client, url: str, limit: int, after_id=None):
+    """Follow X-Next-After-Id from the given cursor to the last page"""
+    pages = []
+    while True:
+        query = f"limit={limit}" + (f"&after_id={after_id}" if after_id is not None else '')
+        response = client.get(f"{url}?{query}")
+        assert response.status_code == 200
+        pages.append(response.get_json())
+        after_id = response.headers.get('X-Next-After-Id')
+        if after_id is None:
+            return pages
+
+
+@pytest.mark.parametrize('limit', [1, 3, 7, 10])
+def test_pages_concatenate_to_the_full_list(client, tables, limit):
+    full = client.get('/api/gas/consumption').get_json()
+    assert 'X-Next-After-Id' not in client.get('/api/gas/consumption').headers
+
+    pages = _pages(client, '/api/gas/consumption', limit)
+    assert all(len(page) <= limit for page in pages)
+    assert [row for page in pages for row in page] == full
+    assert [row['id'] for row in full] == sorted(row['id'] for row in full)
+
+
+def test_rows_added_while_paging_are_not_skipped(app, client, tables):
+    first = client.get('/api/gas/consumption?limit=4')
+    with app.app_context():
+        write_dataframe(
+            db.session.connection(), GasConsumption.__table__,
+            pd.DataFrame({'object_description': ['D299 New Building']})
+        )
+        db.session.commit()
+
+    rest = _pages(client, '/api/gas/consumption', 4, first.headers['X-Next-After-Id'])
+    descriptions = [row['object_description'] for row in first.get_json()]
+    descriptions += [row['object_description'] for page in rest for row in page]
+    assert descriptions == [f"D20{n} Building" for n in range(7)] + ['D299 New Building']
+
+
+def test_period_filters_match_the_unfiltered_rows(client, tables):
+    full = client.get('/api/steam-mthw/readings').get_json()
+
+    def period(row):
+        return row['year'] * 100 + MONTHS.index(row['month']) + 1
+
+    filtered = client.get('/api/steam-mthw/readings?from=2023-11&to=2024-02').get_json()
+    assert filtered == [row for row in full if 202311 <= period(row) <= 202402]
+
+    year = client.get('/api/steam-mthw/readings?year=2024&limit=5').get_json()
+    assert year == [row for row in full if row['year'] == 2024][:5]
+
+
+@pytest.mark.parametrize('query', ['limit=0', 'after_id=x', 'from=2024-13', 'year=2024'])
+def test_invalid_parameters_are_rejected(client, tables, query):
+    response = client.get(f"/api/gas/consumption?{query}")
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
@@ -0,0 +1,60 @@
+# backend/tests/test_load_versions.py
+
+import threading
+
+from sqlalchemy import event
+
+from app.models.load_manifest import LoadVersion
+from app.services.load_versions import bump_load_versions, read_load_versions
+
+
+def test_parallel_bumps_of_a_new_table(engine):
+    with engine.begin() as connection:
+        LoadVersion.__table__.create(connection)
+
+    rounds = 10
+    barrier = threading.Barrier(2)
+    errors = []
+
+    def load():
+        try:
+            barrier.wait()
+            for _ in range(rounds):
+                with engine.begin() as connection:
+                    bump_load_versions(connection, ['dbo.meter_reading', 'dbo.gas_consumption'])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=load) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    with engine.connect() as connection:
+        assert read_load_versions(connection) == {
+            'dbo.meter_reading': 2 * rounds,
+            'dbo.gas_consumption': 2 * rounds
+        }
+
+
+def test_bump_is_a_single_upsert(engine):
+    with engine.begin() as connection:
+        LoadVersion.__table__.create(connection)
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    # No separate read of the row, so there is no window for a second loader
+    # to insert the same table between the check and the write
+    event.listen(engine, 'before_cursor_execute', record)
+    with engine.begin() as connection:
+        bump_load_versions(connection, ['dbo.meter_reading'])
+    event.remove(engine, 'before_cursor_execute', record)
+
+    writes = [s for s in statements if 'load_versions' in s and not s.startswith('PRAGMA')]
+    assert len(writes) == 1
+    assert 'ON CONFLICT' in writes[0]
@@ -0,0 +1,126 @@
+# backend/tests/test_meter_readings.py
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import MetaData, Table, inspect, select
+
+from app.models.janitza_models import JanitzaUOF8X, JanitzaManualMeters
+from app.models.meter_reading import MeterReading
+from app.services.incremental_load import load_frames
+from app.services.meter_readings import VIEW_PREFIX, month_columns
+from app.services.schema_upgrade import upgrade_schema
+
+
+def _wide_frame(model, rows):
+    """rows: (meter_location, {month column: value})"""
+    frame = pd.DataFrame(np.nan, index=range(len(rows)), columns=month_columns(model))
+    frame.insert(0, 'meter_location', [location for location, _ in rows])
+    for position, (_, values) in enumerate(rows):
+        for column, value in values.items():
+            frame.loc[position, column] = value
+    return frame
+
+
+FRAMES = {
+    # Repeated meter ids and a row without readings, as in the real workbook
+    JanitzaUOF8X: _wide_frame(JanitzaUOF8X, [
+        ('F811 Main', {'Jan_2024': 10.0, 'Feb_2024': 11.0}),
+        ('F811 Main', {'Jan_2024': 20.0, 'Feb_2024': 21.0}),
+        ('F812 Spare', {}),
+        ('F813 Lab', {'Mar_2024': 5.5}),
+    ]),
+    JanitzaManualMeters: _wide_frame(JanitzaManualMeters, [
+        ('M1', {'Jan_2024': 1.0}),
+        ('M1', {'Jan_2024': 2.0}),
+    ]),
+}
+
+
+def _assert_views_match(engine):
+    for model in FRAMES:
+        table = model.__table__
+        months = month_columns(model)
+        wide = pd.read_sql(f"SELECT * FROM dbo.{table.name} ORDER BY id", engine)
+        view = pd.read_sql(f"SELECT * FROM dbo.{VIEW_PREFIX}{table.name} ORDER BY id", engine)
+
+        assert len(view) == len(wide)
+        assert view['id'].tolist() == wide['id'].tolist()
+        assert view['meter_location'].tolist() == wide['meter_location'].tolist()
+        np.testing.assert_array_equal(view[months].to_numpy(float), wide[months].to_numpy(float))
+
+
+def test_views_keep_every_source_row(engine):
+    load_frames(engine, FRAMES)
+    _assert_views_match(engine)
+
+    readings = MeterReading.__table__
+    with engine.connect() as connection:
+        rows = connection.execute(
+            select(readings.c.source_row, readings.c.value)
+            .where(readings.c.source == 'janitza_uo_f8x', readings.c.meter_id == 'F811 Main')
+            .order_by(readings.c.source_row, readings.c.period_start)
+        ).all()
+    assert rows == [(1, 10.0), (1, 11.0), (2, 20.0), (2, 21.0)]
+
+
+def test_incremental_month_update_reaches_the_view(engine):
+    load_frames(engine, FRAMES)
+
+    frames = {model: frame.copy() for model, frame in FRAMES.items()}
+    frames[JanitzaUOF8X].loc[1, 'Feb_2024'] = 99.0
+    frames[JanitzaUOF8X].loc[2, 'Apr_2024'] = 7.0
+    load_frames(engine, frames, incremental=True)
+
+    _assert_views_match(engine)
+    with engine.connect() as connection:
+        row = connection.execute(
+            select(MeterReading.__table__.c.value).where(MeterReading.__table__.c.value == 99.0)
+        ).all()
+    assert len(row) == 1
+
+
+def _downgrade_meter_reading(engine):
+    """meter_reading as it was before source_row, filled the old way"""
+    readings = MeterReading.__table__
+    old = Table(
+        readings.name, MetaData(),
+        *[column._copy() for column in readings.columns if column.name != 'source_row'],
+        schema=readings.schema
+    )
+    with engine.begin() as connection:
+        rows = connection.execute(select(*old.columns)).mappings().all()
+        readings.drop(connection)
+        old.create(connection)
+        connection.execute(old.insert(), [dict(row) for row in rows])
+    return rows
+
+
+def test_upgrade_adds_source_rows_to_an_existing_meter_reading(engine):
+    load_frames(engine, FRAMES)
+    _downgrade_meter_reading(engine)
+    readings = MeterReading.__table__
+
+    with engine.begin() as connection:
+        upgrade_schema(connection)
+
+    _assert_views_match(engine)
+    with engine.connect() as connection:
+        assert connection.execute(
+            select(readings.c.id).where(readings.c.source_row.is_(None))
+        ).first() is None
+
+
+def test_app_startup_does_not_rewrite_meter_reading(engine):
+    load_frames(engine, FRAMES)
+    rows = _downgrade_meter_reading(engine)
+
+    from app import create_app
+    create_app()
+
+    readings = MeterReading.__table__
+    with engine.connect() as connection:
+        columns = [column['name'] for column in inspect(connection).get_columns(readings.name, schema=readings.schema)]
+        assert 'source_row' not in columns
+        assert connection.execute(select(readings.c.id).order_by(readings.c.id)).scalars().all() == sorted(
+            row['id'] for row in rows
+        )
@@ -0,0 +1,74 @@
+# backend/tests/test_response_cache.py
+
+from sqlalchemy import text
+
+from app import db
+from app.services.load_versions import bump_load_versions
+from app.models.rollup_models import ConsumptionRollup
+
+
+def _bump(app, tables):
+    with app.app_context(), db.engine.begin() as connection:
+        bump_load_versions(connection, tables)
+
+
+def test_views_using_session_begin_run_after_version_read(app, client):
+    # GasAnalysisService wraps its query in db.session.begin()
+    with app.app_context(), db.engine.begin() as connection:
+        connection.execute(text('CREATE TABLE dbo.gas_automated_meter_cleaned (meter_description TEXT)'))
+    _bump(app, ['dbo.gas_automated_meter_cleaned'])
+
+    for _ in range(2):
+        response = client.get('/api/gas/analysis')
+        assert response.status_code == 404
+        assert response.get_json()['details'] == 'No data found in database'
+
+
+def test_cached_until_next_load(app, client):
+    _bump(app, [ConsumptionRollup.__table__])
+
+    first = client.get('/api/rollups')
+    assert first.status_code == 200
+    assert first.headers['X-Cache'] == 'MISS'
+
+    second = client.get('/api/rollups')
+    assert second.headers['X-Cache'] == 'HIT'
+    assert second.headers['ETag'] == first.headers['ETag']
+
+    not_modified = client.get('/api/rollups', headers={'If-None-Match': first.headers['ETag']})
+    assert not_modified.status_code == 304
+
+    _bump(app, [ConsumptionRollup.__table__])
+    reloaded = client.get('/api/rollups', headers={'If-None-Match': first.headers['ETag']})
+    assert reloaded.status_code == 200
+    assert reloaded.headers['X-Cache'] == 'MISS'
+    assert reloaded.headers['ETag'] != first.headers['ETag']
+
+
+def test_routes_are_cached_only_when_marked(app, client):
+    # Like /api/gas/analysis: reads a table rebuilt without a load version bump
+    reads = iter(range(100))
+    app.add_url_rule('/api/test/unversioned', 'unversioned', lambda: {'read': next(reads)})
+    _bump(app, [ConsumptionRollup.__table__])
+
+    first = client.get('/api/test/unversioned')
+    second = client.get('/api/test/unversioned')
+    assert 'X-Cache' not in second.headers
+    assert (first.get_json(), second.get_json()) == ({'read': 0}, {'read': 1})
+
+    assert not hasattr(app.view_functions['gas.get_gas_analysis'], 'cache_until_next_load')
+    assert app.view_functions['rollups.get_rollups'].cache_until_next_load
+
+
+def test_unmarked_routes_get_no_etag(app, client):
+    reads = iter(range(100))
+    app.add_url_rule('/api/test/unversioned', 'unversioned', lambda: {'read': next(reads)})
+    _bump(app, [ConsumptionRollup.__table__])
+
+    first = client.get('/api/test/unversioned')
+    assert 'ETag' not in first.headers
+
+    # If-None-Match: * matches any current ETag, but these routes have none
+    second = client.get('/api/test/unversioned', headers={'If-None-Match': '*'})
+    assert second.status_code == 200
+    assert second.get_json() == {'read': 1}
@@ -0,0 +1,154 @@
+# backend/tests/test_rollups.py
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+
+from app import db
+from app.models.gas_models import GasConsumption
+from app.models.rollup_models import ConsumptionRollup, SteamMTHWYearlyRollup
+from app.models.steam_mthw import SteamMTHWReading
+from app.services.bulk_writer import write_dataframe
+from app.services import rollups
+from app.services.incremental_load import load_frames
+from app.services.interval_readings import load_intervals
+from app.services.load_versions import read_load_versions
+from app.services.meter_readings import month_columns
+from app.services.rollups import build_consumption_rollup, deferred_rollups, refresh_rollups
+from app.services.table_swap import staged_tables
+
+
+def _gas_frame(jan_2024: float) -> pd.DataFrame:
+    frame = pd.DataFrame(np.nan, index=range(2), columns=month_columns(GasConsumption))
+    frame.insert(0, 'object_description', ['D201 Adams Building', 'D202 Bain Building'])
+    frame['Jan_2024'] = [jan_2024, 5.0]
+    return frame
+
+
+def _monthly_gas(connection) -> dict:
+    rollup = ConsumptionRollup.__table__
+    rows = connection.execute(
+        select(rollup.c.building, rollup.c.value)
+        .where(rollup.c.grain == 'month', rollup.c.utility == 'gas')
+    ).all()
+    return dict(rows)
+
+
+def test_wide_load_refreshes_consumption_rollup(engine):
+    load_frames(engine, {GasConsumption: _gas_frame(10.0)})
+    with engine.connect() as connection:
+        assert _monthly_gas(connection) == {'D201': 10.0, 'D202': 5.0}
+        first = read_load_versions(connection)[ConsumptionRollup.__table__.fullname]
+
+    load_frames(engine, {GasConsumption: _gas_frame(12.5)}, incremental=True)
+    with engine.connect() as connection:
+        assert _monthly_gas(connection) == {'D201': 12.5, 'D202': 5.0}
+        assert read_load_versions(connection)[ConsumptionRollup.__table__.fullname] > first
+
+
+def test_staged_load_refreshes_yearly_rollup(engine):
+    readings = pd.DataFrame({
+        'month': ['Jan', 'Feb'], 'year': [2024, 2024],
+        'mthw_consumption_kwh': [100.0, 50.0]
+    })
+    with staged_tables(engine, [SteamMTHWReading]) as (connection, shadows):
+        write_dataframe(connection, shadows[SteamMTHWReading], readings)
+
+    rollup = SteamMTHWYearlyRollup.__table__
+    with engine.connect() as connection:
+        row = connection.execute(select(rollup.c.year, rollup.c.total_mthw_consumption, rollup.c.months)).one()
+        assert tuple(row) == (2024, 150.0, 2)
+        assert rollup.fullname in read_load_versions(connection)
+
+
+def test_deferred_loads_leave_rollups_to_the_pipeline(engine):
+    with deferred_rollups():
+        load_frames(engine, {GasConsumption: _gas_frame(10.0)})
+    with engine.connect() as connection:
+        assert ConsumptionRollup.__table__.fullname not in read_load_versions(connection)
+
+
+def test_api_serves_the_refreshed_rollup(app, client):
+    with app.app_context():
+        load_frames(db.engine, {GasConsumption: _gas_frame(10.0)})
+    before = client.get('/api/rollups?utility=gas&building=D201').get_json()
+    assert [row['value'] for row in before] == [10.0]
+
+    with app.app_context():
+        load_frames(db.engine, {GasConsumption: _gas_frame(20.0)}, incremental=True)
+    after = client.get('/api/rollups?utility=gas&building=D201')
+    assert after.headers['X-Cache'] == 'MISS'
+    assert [row['value'] for row in after.get_json()] == [20.0]
+
+
+def _intervals(start: str, days: int, value: float) -> pd.DataFrame:
+    times = pd.date_range(start, periods=days * 96, freq='15min')
+    return pd.DataFrame({
+        'meter_id': 'D201 Adams Building', 'reading_time': times, 'value': value,
+        'unit': 'kWh', 'utility': 'electricity', 'source': 'janitza', 'interval_minutes': 15
+    })
+
+
+ROLLUP_KEY = ['grain', 'period_start', 'utility', 'building', 'unit']
+
+
+def _rollup_rows(connection) -> pd.DataFrame:
+    rows = pd.read_sql(select(ConsumptionRollup.__table__), connection)
+    rows['period_start'] = pd.to_datetime(rows['period_start'])
+    return rows.sort_values(ROLLUP_KEY).reset_index(drop=True)
+
+
+def _assert_matches_full_build(connection):
+    rows = _rollup_rows(connection)
+    expected = build_consumption_rollup(connection).sort_values(ROLLUP_KEY).reset_index(drop=True)
+    pd.testing.assert_frame_equal(rows[expected.columns], expected, check_dtype=False)
+    return rows
+
+
+def test_interval_load_rebuilds_only_its_days(engine):
+    load_frames(engine, {GasConsumption: _gas_frame(10.0)})
+    load_intervals(engine, _intervals('2024-01-01', 10, 1.0))
+    with engine.connect() as connection:
+        before = _assert_matches_full_build(connection).set_index(ROLLUP_KEY)['id']
+
+    load_intervals(engine, _intervals('2024-01-04', 2, 2.0))
+    with engine.connect() as connection:
+        after = _assert_matches_full_build(connection).set_index(ROLLUP_KEY)['id']
+
+    days = after.index.get_level_values('period_start')
+    touched = (after.index.get_level_values('grain') == 'day') & days.isin(pd.date_range('2024-01-04', periods=2))
+    assert touched.sum() == 2
+    # Rows outside the loaded days are not rewritten
+    assert after[~touched].equals(before[after[~touched].index])
+    assert not after[touched].isin(before).any()
+
+
+def test_wide_load_leaves_day_rows_alone(engine):
+    load_intervals(engine, _intervals('2024-01-01', 3, 1.0))
+    load_frames(engine, {GasConsumption: _gas_frame(10.0)})
+    with engine.connect() as connection:
+        before = _assert_matches_full_build(connection)
+
+    load_frames(engine, {GasConsumption: _gas_frame(12.5)}, incremental=True)
+    with engine.connect() as connection:
+        after = _assert_matches_full_build(connection)
+    days = after['grain'] == 'day'
+    assert after.loc[days, 'id'].tolist() == before.loc[before['grain'] == 'day', 'id'].tolist()
+
+
+def test_deferred_chunks_refresh_once(engine, monkeypatch):
+    refresh_rollups(engine)
+    calls = []
+    original = rollups.refresh_consumption_rollup
+    monkeypatch.setattr(rollups, 'refresh_consumption_rollup', lambda *args: calls.append(args) or original(*args))
+
+    with deferred_rollups(engine):
+        for start in ['2024-01-01', '2024-01-03', '2024-01-05']:
+            load_intervals(engine, _intervals(start, 2, 1.0))
+        assert calls == []
+
+    assert len(calls) == 1
+    assert calls[0][2] == (pd.Timestamp('2024-01-01').date(), pd.Timestamp('2024-01-06').date())
+    with engine.connect() as connection:
+        rows = _assert_matches_full_build(connection)
+    assert (rows['grain'] == 'day').sum() == 6
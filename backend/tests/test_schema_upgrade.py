@@ -0,0 +1,56 @@
+# backend/tests/test_schema_upgrade.py
+
+import pytest
+from sqlalchemy import MetaData, Table, inspect
+
+from app.services.schema_upgrade import upgrade_schema
+
+from app.models.energy_total_models import EnergyTotalDashboard
+from app.models.steam_mthw import SteamMTHWReading
+
+
+def _create_without_period(engine, model, rows):
+    """The table as it was before the period column was added"""
+    table = model.__table__
+    old = Table(
+        table.name, MetaData(),
+        *[column._copy() for column in table.columns if column.name != 'period'],
+        schema=table.schema
+    )
+    with engine.begin() as connection:
+        old.create(connection)
+        connection.execute(old.insert(), rows)
+
+
+@pytest.mark.parametrize('model, path', [
+    (SteamMTHWReading, '/api/steam-mthw/readings'),
+    (EnergyTotalDashboard, '/api/energy-total'),
+])
+def test_existing_table_gains_period_on_upgrade(database_url, engine, model, path):
+    _create_without_period(engine, model, [
+        {'year': 2024, 'month': 'Sep'},
+        {'year': 2024, 'month': 'Dec'},
+        {'year': 2024, 'month': 'Jan'},
+    ])
+
+    from app import create_app
+    client = create_app().test_client()
+    # Startup leaves existing tables alone; ingest runs the upgrade once
+    table = model.__table__
+    columns = {column['name'] for column in inspect(engine).get_columns(table.name, schema=table.schema)}
+    assert 'period' not in columns
+
+    with engine.begin() as connection:
+        upgrade_schema(connection)
+
+    latest = client.get(f'{path}/latest')
+    assert latest.status_code == 200
+    assert latest.get_json()['month'] == 'Dec'
+    assert latest.get_json()['period'].startswith('2024-12-01')
+
+    year = client.get(f"{path}/{'year/' if model is EnergyTotalDashboard else ''}2024")
+    assert year.status_code == 200
+    assert [row['month'] for row in year.get_json()] == ['Jan', 'Sep', 'Dec']
+
+    indexes = {index['name'] for index in inspect(engine).get_indexes(table.name, schema=table.schema)}
+    assert {index.name for index in table.indexes} <= indexes
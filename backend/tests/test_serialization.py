@@ -0,0 +1,75 @@
+# backend/tests/test_serialization.py
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from flask import jsonify
+from sqlalchemy import Date, DateTime, Float, Integer, Numeric
+
+from app import db
+from app.routes import serialization
+from app.routes.batch_routes import DATASETS
+
+
+def _rows(model, count: int = 5) -> list:
+    """Rows with a value of the right type, or NULL, in every column"""
+    rng = np.random.default_rng(0)
+    rows = []
+    for position in range(count):
+        row = {}
+        for column in model.__table__.columns:
+            if column.primary_key:
+                continue
+            if column.nullable and rng.random() < 0.2:
+                value = None
+            elif isinstance(column.type, DateTime):
+                value = datetime(2024, 1, 1 + position, 12, 30, 15, position * 1000)
+            elif isinstance(column.type, Date):
+                value = date(2024, 1 + position, 1)
+            elif isinstance(column.type, Integer):
+                value = int(rng.integers(2000, 2030))
+            elif isinstance(column.type, (Float, Numeric)):
+                value = round(float(rng.normal(100, 50)), 3)
+            else:
+                value = f"{column.name} {position} — Dunedin"
+            row[column.name] = value
+        rows.append(row)
+    return rows
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def encoder(request, monkeypatch):
+    if request.param == 'json':
+        monkeypatch.setattr(serialization, 'orjson', None)
+    return request.param
+
+
+@pytest.mark.parametrize('dataset', sorted(DATASETS))
+def test_list_routes_match_to_dict(app, client, encoder, dataset):
+    model = DATASETS[dataset]
+    with app.app_context():
+        db.session.execute(model.__table__.insert(), _rows(model))
+        db.session.commit()
+        expected = json.loads(jsonify([row.to_dict() for row in model.query.order_by(model.id)]).data)
+
+    response = client.get(f"/api/{dataset}")
+    assert response.status_code == 200
+    assert response.get_json() == expected
+
+
+def test_encoders_agree(encoder):
+    data = [{
+        'a': 1.5, 'b': float('nan'), 'c': None, 'd': date(2024, 3, 1),
+        'e': datetime(2024, 3, 1, 8, 5, 0, 250000), 'f': Decimal('2.25'),
+        'g': 'Māori', 'h': [float('nan'), 2]
+    }]
+    assert json.loads(serialization.dumps(data)) == [{
+        'a': 1.5, 'b': None, 'c': None, 'd': '2024-03-01',
+        'e': '2024-03-01T08:05:00.250000', 'f': 2.25,
+        'g': 'Māori', 'h': [None, 2]
+    }]
+    lines = serialization.dumps_lines(data * 2).decode().splitlines()
+    assert [json.loads(line) for line in lines] == json.loads(serialization.dumps(data * 2))
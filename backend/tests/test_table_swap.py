@@ -0,0 +1,93 @@
+# backend/tests/test_table_swap.py
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import MetaData, inspect, text
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+
+from app.models.load_manifest import LoadVersion
+from app.models.steam_mthw import SteamMTHWReading
+from app.services import table_swap
+from app.services.load_versions import read_load_versions
+from app.services.table_swap import SHADOW_SUFFIX, staged_tables
+
+TABLE = SteamMTHWReading.__table__
+
+
+@pytest.fixture
+def live(engine):
+    """The live table with one month loaded and a view reading from it"""
+    with engine.begin() as connection:
+        LoadVersion.__table__.create(connection)
+        TABLE.create(connection)
+        connection.execute(TABLE.insert(), [{'month': 'Jan', 'year': 2023, 'mthw_consumption_kwh': 1.0}])
+        connection.execute(text(
+            "CREATE VIEW dbo.v_steam_mthw_readings AS SELECT id, month, year FROM dbo.steam_mthw_readings"
+        ))
+    return engine
+
+
+def _months(connection, table: str = 'steam_mthw_readings') -> list:
+    return [row[0] for row in connection.execute(text(f"SELECT month FROM dbo.{table} ORDER BY id"))]
+
+
+def test_swap_replaces_the_live_table(live):
+    with staged_tables(live, [SteamMTHWReading]) as (connection, shadows):
+        connection.execute(shadows[SteamMTHWReading].insert(), [
+            {'month': 'Feb', 'year': 2024, 'mthw_consumption_kwh': 2.0},
+            {'month': 'Mar', 'year': 2024, 'mthw_consumption_kwh': 3.0},
+        ])
+        # Readers outside the load still see the old data
+        with live.connect() as reader:
+            assert _months(reader) == ['Jan']
+
+    with live.connect() as connection:
+        assert _months(connection) == ['Feb', 'Mar']
+        assert _months(connection, 'v_steam_mthw_readings') == ['Feb', 'Mar']
+        tables = inspect(connection).get_table_names(schema='dbo')
+        assert f"steam_mthw_readings{SHADOW_SUFFIX}" not in tables
+        indexes = {index['name'] for index in inspect(connection).get_indexes('steam_mthw_readings', schema='dbo')}
+        assert indexes == {index.name for index in TABLE.indexes}
+        assert read_load_versions(connection)[TABLE.fullname] == 1
+
+
+def test_failed_load_leaves_the_live_table(live):
+    with pytest.raises(RuntimeError):
+        with staged_tables(live, [SteamMTHWReading]) as (connection, shadows):
+            connection.execute(shadows[SteamMTHWReading].insert(), [{'month': 'Feb', 'year': 2024}])
+            raise RuntimeError('load failed')
+
+    with live.connect() as connection:
+        assert _months(connection) == ['Jan']
+        assert _months(connection, 'v_steam_mthw_readings') == ['Jan']
+        assert TABLE.fullname not in read_load_versions(connection)
+
+
+def test_postgres_swap_recreates_dependent_views(monkeypatch):
+    statements = []
+
+    def execute(statement, parameters=None):
+        statements.append(' '.join(str(statement).split()))
+        return SimpleNamespace(fetchall=list)
+
+    connection = SimpleNamespace(dialect=PGDialect_psycopg2(), execute=execute)
+    monkeypatch.setattr(table_swap, 'inspect', lambda connection: SimpleNamespace(has_table=lambda *a, **k: True))
+    monkeypatch.setattr(table_swap, '_dependent_views', lambda connection, table: [
+        ('dbo', 'v_steam_mthw_readings', 'v', ' SELECT month FROM dbo.steam_mthw_readings;'),
+        ('dbo', 'steam_by_month', 'm', ' SELECT month FROM dbo.v_steam_mthw_readings;'),
+    ])
+    # The shadow as create_shadow_tables builds it, without its indexes
+    shadow = TABLE.to_metadata(MetaData(), name=f"steam_mthw_readings{SHADOW_SUFFIX}")
+    shadow.indexes.clear()
+    table_swap._swap(connection, TABLE, shadow)
+
+    statements = [s for s in statements if not s.startswith('SELECT')]
+    assert statements == [
+        'DROP MATERIALIZED VIEW dbo.steam_by_month',
+        'DROP VIEW dbo.v_steam_mthw_readings',
+        'DROP TABLE dbo.steam_mthw_readings',
+        f'ALTER TABLE dbo.steam_mthw_readings{SHADOW_SUFFIX} RENAME TO steam_mthw_readings',
+        'CREATE VIEW dbo.v_steam_mthw_readings AS SELECT month FROM dbo.steam_mthw_readings',
+        'CREATE MATERIALIZED VIEW dbo.steam_by_month AS SELECT month FROM dbo.v_steam_mthw_readings',
+    ]
@@ -0,0 +1,69 @@
+# backend/tests/test_weather_loader.py
+
+import pandas as pd
+import pytest
+from sqlalchemy import text
+
+from app.services.weather_loader import WeatherLoader
+from conftest import make_weather
+
+
+@pytest.fixture
+def weather(tmp_path):
+    readings, calendar, weights, solar = make_weather(90)
+    weather_dir = tmp_path / 'weather'
+    weather_dir.mkdir()
+
+    def write(month: str, frame: pd.DataFrame):
+        out = frame.drop(columns=['DATETIME'])
+        # Exports carry a units row under the header
+        units = pd.DataFrame([['units'] * len(out.columns)], columns=out.columns)
+        pd.concat([units, out]).to_csv(weather_dir / f'weather-{month}.csv', index=False)
+
+    by_month = dict(tuple(readings.groupby(readings['DATETIME'].dt.strftime('%Y-%m'))))
+    for month, frame in by_month.items():
+        write(month, frame)
+    return weather_dir, by_month, write, (calendar, weights, solar)
+
+
+def _loader(database_url, references):
+    calendar, weights, solar = references
+    loader = WeatherLoader(database_url)
+    loader.create_tables()
+    loader.academic_calendar_df = calendar
+    loader.weather_weights_df = weights
+    loader.solar_energy_df = solar
+    return loader
+
+
+def _tables(loader):
+    with loader.engine.connect() as connection:
+        daily = pd.read_sql(text('SELECT * FROM dbo.weather_daily ORDER BY date_id'), connection)
+        monthly = pd.read_sql(text('SELECT * FROM dbo.weather_monthly ORDER BY month_id'), connection)
+    return daily.drop(columns='created_at'), monthly.drop(columns='created_at')
+
+
+def test_incremental_load_matches_full_rebuild(database_url, weather):
+    weather_dir, by_month, write, references = weather
+    loader = _loader(database_url, references)
+    loader.load_weather_files(weather_dir, full=True)
+    assert loader.load_weather_files(weather_dir)['files'] == 0
+
+    # A corrected export: values change and the last five days are withdrawn
+    corrected = by_month['2022-02'].copy()
+    corrected['Air_Temperature_C_Avg'] += 3
+    corrected = corrected[corrected['DATETIME'] < '2022-02-24']
+    write('2022-02', corrected)
+
+    result = loader.load_weather_files(weather_dir)
+    assert result['files'] == 1
+    incremental_daily, incremental_monthly = _tables(loader)
+
+    dates = pd.to_datetime(incremental_daily['date_id'])
+    assert not ((dates >= '2022-02-24') & (dates < '2022-03-01')).any()
+    assert (dates >= '2022-03-01').sum() == 31
+
+    loader.load_weather_files(weather_dir, full=True)
+    full_daily, full_monthly = _tables(loader)
+    pd.testing.assert_frame_equal(incremental_daily, full_daily)
+    pd.testing.assert_frame_equal(incremental_monthly, full_monthly)
@@ -0,0 +1,103 @@
+# backend/tests/test_weather_preprocessor.py
+
+import pandas as pd
+import pytest
+
+from app.services.weather_preprocessor import WeatherDataPreprocessor, WeatherOrderError, WeatherValidation
+from baseline.weather_preprocessor import WeatherDataPreprocessor as BaselinePreprocessor
+from conftest import make_weather
+
+
+def _write_merged(path, readings: pd.DataFrame):
+    """A merged CSV as the station exports are concatenated: each month behind
+    a separator, with its own header and units rows"""
+    readings = readings.drop(columns='DATETIME')
+    months = pd.to_datetime(readings['Date'], format='%d/%m/%Y').dt.strftime('%Y-%m')
+    with open(path, 'w', newline='') as out:
+        for month, frame in readings.groupby(months, sort=False):
+            out.write(f"==> weather-{month}.csv <==\n")
+            out.write('-' * 40 + '\n')
+            out.write(','.join(frame.columns) + '\n')
+            out.write(','.join(['TS', 'RN'] + ['Avg'] * (len(frame.columns) - 2)) + '\n')
+            frame.to_csv(out, header=False, index=False)
+    return path
+
+
+def _flat(report: dict, prefix: str = '') -> dict:
+    """validate_data's nested report as one level, for pytest.approx"""
+    flat = {}
+    for key, value in report.items():
+        if isinstance(value, dict):
+            flat.update(_flat(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+@pytest.fixture(scope='module')
+def readings():
+    # Spans the known missing days at the start of August 2023
+    readings = make_weather(20, start='2023-07-20')[0]
+    # A logger fault written as text in a measurement column
+    readings['Air_Pressure_hPa_Avg'] = readings['Air_Pressure_hPa_Avg'].astype(object)
+    readings.loc[1000, 'Air_Pressure_hPa_Avg'] = 'ERR'
+    return readings
+
+
+@pytest.fixture
+def merged(tmp_path, readings):
+    return _write_merged(tmp_path / 'merged.csv', readings)
+
+
+@pytest.fixture
+def shuffled(tmp_path, readings):
+    """Months concatenated newest first"""
+    months = readings['DATETIME'].dt.month
+    return _write_merged(tmp_path / 'shuffled.csv', pd.concat([readings[months == 8], readings[months == 7]]))
+
+
+def test_preprocess_matches_the_baseline(merged):
+    expected = BaselinePreprocessor().preprocess_data(merged)
+    actual = WeatherDataPreprocessor().preprocess_data(merged)
+
+    assert not actual['DATETIME'].dt.normalize().isin(pd.date_range('2023-08-01', periods=3)).any()
+    assert actual['Air_Pressure_hPa_Avg'].isna().sum() == 1
+    pd.testing.assert_frame_equal(
+        actual.reset_index(drop=True), expected.reset_index(drop=True), check_dtype=False
+    )
+
+
+def test_validation_matches_the_baseline(merged):
+    expected = BaselinePreprocessor().validate_data(BaselinePreprocessor().preprocess_data(merged))
+    preprocessor = WeatherDataPreprocessor()
+    actual = preprocessor.validate_data(preprocessor.preprocess_data(merged))
+    assert _flat(actual) == pytest.approx(_flat(expected))
+
+
+@pytest.mark.parametrize('chunksize', [100, 288, 1000, 100_000])
+def test_days_streamed_in_chunks_match_the_whole_file(merged, chunksize):
+    preprocessor = WeatherDataPreprocessor()
+    whole = preprocessor.preprocess_data(merged)
+
+    chunks = list(preprocessor.iter_days(merged, chunksize=chunksize))
+    days = [set(chunk['DATETIME'].dt.date) for chunk in chunks]
+    # No day is split across chunks
+    assert sum(len(chunk_days) for chunk_days in days) == len(set().union(*days))
+    pd.testing.assert_frame_equal(pd.concat(chunks), whole)
+
+    validation = WeatherValidation()
+    for chunk in chunks:
+        validation.update(chunk)
+    assert _flat(validation.result()) == pytest.approx(_flat(preprocessor.validate_data(whole)))
+
+
+def test_out_of_order_file_is_sorted_whole(shuffled):
+    preprocessor = WeatherDataPreprocessor()
+    with pytest.raises(WeatherOrderError):
+        list(preprocessor.iter_days(shuffled, chunksize=1000))
+
+    expected = BaselinePreprocessor().preprocess_data(shuffled)
+    actual = preprocessor.preprocess_data(shuffled)
+    pd.testing.assert_frame_equal(
+        actual.reset_index(drop=True), expected.reset_index(drop=True), check_dtype=False
+    )
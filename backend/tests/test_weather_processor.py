@@ -0,0 +1,97 @@
+# backend/tests/test_weather_processor.py
+
+import pandas as pd
+import pytest
+
+from app.services.weather_processor import WeatherProcessor
+from baseline.weather_processor import WeatherProcessor as BaselineProcessor
+from conftest import make_weather
+
+
+@pytest.fixture(scope='module')
+def weather():
+    return make_weather(75, start='2022-02-20')
+
+
+def _daily(weather, calendar, weights):
+    readings, _, _, solar = weather
+    expected = BaselineProcessor(calendar, weights, solar).process_daily(readings.drop(columns='DATETIME'))
+    actual = WeatherProcessor(calendar, weights, solar).process_daily(readings)
+    # Without weights the baseline left None objects in weighted_score, now NaN;
+    # both are written as NULL
+    return expected.astype({'weighted_score': float}), actual
+
+
+def test_daily_matches_the_baseline(weather):
+    _, calendar, weights, _ = weather
+    expected, actual = _daily(weather, calendar, weights)
+    assert len(actual) == 75
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_daily_days_with_missing_readings_match_the_baseline(weather):
+    readings, calendar, weights, solar = weather
+    # A day without working-hours readings and a day with no readings at all
+    dropped = readings[
+        ~((readings['DATETIME'].dt.date == pd.Timestamp('2022-03-05').date())
+          & readings['DATETIME'].dt.hour.between(6, 20))
+        & (readings['DATETIME'].dt.date != pd.Timestamp('2022-03-06').date())
+    ]
+    expected, actual = _daily((dropped, calendar, weights, solar), calendar, weights)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+
+# Reference tables as they come out of real workbooks: (calendar, weights) -> (calendar, weights)
+VARIANTS = {
+    'no calendar': lambda calendar, weights: (None, weights),
+    'no weights': lambda calendar, weights: (calendar, None),
+    'season without weights': lambda calendar, weights: (
+        calendar, weights[weights['Season'].str.strip() != 'Autumn']
+    ),
+    'repeated calendar dates': lambda calendar, weights: (
+        pd.concat([calendar, calendar[calendar['date_id'] >= '2022-03-01'].iloc[:20].assign(
+            final_weight=9.0, event_type='Exam'
+        )]), weights
+    ),
+    'calendar without final weights': lambda calendar, weights: (
+        calendar.drop(columns='final_weight'), weights
+    ),
+    'season names in other case': lambda calendar, weights: (
+        calendar, weights.assign(Season=' ' + weights['Season'].str.upper())
+    ),
+}
+
+
+@pytest.mark.parametrize('variant', VARIANTS)
+def test_daily_reference_table_lookups_match_the_baseline(weather, variant):
+    _, calendar, weights, _ = weather
+    calendar, weights = VARIANTS[variant](calendar, weights)
+    expected, actual = _daily(weather, calendar, weights)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+# Solar and calendar tables with gaps: (calendar, solar) -> (calendar, solar)
+MONTHLY_VARIANTS = {
+    'complete': lambda calendar, solar: (calendar, solar),
+    'month without solar data': lambda calendar, solar: (calendar, solar[solar['Month'] != 4]),
+    'repeated solar month': lambda calendar, solar: (
+        calendar, pd.concat([solar, solar.iloc[:2].assign(Mean_daily_Solar_energy=-1.0)])
+    ),
+    'calendar ending early': lambda calendar, solar: (calendar[calendar['date_id'] < '2022-04-01'], solar),
+    'no calendar': lambda calendar, solar: (None, solar),
+}
+
+
+@pytest.mark.parametrize('variant', MONTHLY_VARIANTS)
+def test_monthly_matches_the_baseline(weather, variant):
+    readings, calendar, weights, solar = weather
+    daily = WeatherProcessor(calendar, weights, solar).process_daily(readings)
+    calendar, solar = MONTHLY_VARIANTS[variant](calendar, solar)
+
+    expected = BaselineProcessor(calendar, weights, solar).process_monthly(daily)
+    actual = WeatherProcessor(calendar, weights, solar).process_monthly(daily)
+    # The solar value now carries the WeatherMonthly column name
+    expected = expected.rename(columns={'mean_daily_solar_energy': 'Mean_daily_Solar_energy'})
+    assert len(actual) == 4
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
@@ -0,0 +1,196 @@
+# backend/tests/test_workbook_session.py
+
+import os
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from app.services import workbook_session
+from app.services.workbook_session import WorkbookSession
+
+SHEET = 'Meter Data'
+
+
+def _write_workbook(path, scale: float = 1.0):
+    """Two tables on one sheet, laid out like the campus meter workbook: a
+    title block, a blank gap, a second, wider table further down and a footer"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = SHEET
+    sheet['A1'] = 'Campus meter readings'
+    sheet['A2'] = 'Exported'
+    sheet['B2'] = datetime(2024, 7, 1, 9, 30)
+
+    sheet.append([])
+    sheet.append([])
+    sheet.append(['Meter', 'Building', 'Jan_2024', 'Feb_2024', 'Mar_2024', 'Notes'])
+    for i in range(12):
+        sheet.append([
+            f"M{i:03d}", 'Māori Studies, "Annex"' if i == 3 else f"Block {i}",
+            i * 10 * scale, i + 0.25, None if i % 4 == 0 else i * 2,
+            '#DIV/0!' if i == 5 else None
+        ])
+    sheet.append([])
+    sheet.append(['Total', None, 660 * scale])
+
+    for _ in range(3):
+        sheet.append([])
+    sheet.append(['Meter', 'Jan_2024', 'Feb_2024', 'Mar_2024', 'Apr_2024', 'May_2024', 'Jun_2024', 'Read'])
+    for i in range(6):
+        sheet.append([f"S{i}"] + [i * month * scale for month in range(1, 7)] + [datetime(2024, 7, i + 1)])
+    sheet.append([])
+    sheet.append(['Checked by', 'Facilities', datetime(2024, 7, 8)])
+
+    workbook.create_sheet('Other')['A1'] = 'unused'
+    workbook.save(path)
+    return path
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    return _write_workbook(tmp_path / 'meters.xlsx')
+
+
+# (skiprows, nrows, usecols) as the processors pass them to pd.read_excel
+SLICES = [
+    (None, None, None),
+    (4, 12, 'A:F'),
+    (4, 5, 'B:D'),
+    (4, None, 'A,C:E'),
+    (4, 14, 'A:C'),
+    (22, 6, 'A:H'),
+    (22, 3, 'A:D'),
+    (22, None, None),
+    (0, 2, 'A:B'),
+]
+
+
+@pytest.mark.parametrize('skiprows, nrows, usecols', SLICES)
+def test_slices_match_read_excel(workbook, skiprows, nrows, usecols):
+    expected = pd.read_excel(workbook, sheet_name=SHEET, skiprows=skiprows, nrows=nrows, usecols=usecols)
+    with WorkbookSession(str(workbook), use_cache=False) as session:
+        actual = session.read_sheet(SHEET, skiprows=skiprows, nrows=nrows, usecols=usecols)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_one_session_serves_every_slice(workbook):
+    """Later, wider or longer slices extend the same parse"""
+    with WorkbookSession(str(workbook), use_cache=False) as session:
+        for skiprows, nrows, usecols in SLICES[1:] + SLICES[:1]:
+            expected = pd.read_excel(workbook, sheet_name=SHEET, skiprows=skiprows, nrows=nrows, usecols=usecols)
+            actual = session.read_sheet(SHEET, skiprows=skiprows, nrows=nrows, usecols=usecols)
+            pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_missing_sheet_is_reported(workbook):
+    with WorkbookSession(str(workbook), use_cache=False) as session:
+        with pytest.raises(Exception, match="Error reading sheet 'Gas'"):
+            session.read_sheet('Gas')
+
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / 'cache')
+
+
+def _cached(cache_dir) -> list:
+    return sorted(name for name in os.listdir(cache_dir) if name.endswith('.parquet'))
+
+
+def _read_all(workbook, cache_dir) -> list:
+    with WorkbookSession(str(workbook), cache_dir=cache_dir) as session:
+        return [session.read_sheet(SHEET, *arguments) for arguments in SLICES]
+
+
+def test_cached_sheet_is_read_without_the_workbook(workbook, cache_dir, monkeypatch):
+    parsed = _read_all(workbook, cache_dir)
+    assert len(_cached(cache_dir)) == 1
+
+    def load_workbook(*args, **kwargs):
+        raise AssertionError('workbook parsed despite a cached sheet')
+
+    monkeypatch.setattr(workbook_session, 'load_workbook', load_workbook)
+    for actual, expected in zip(_read_all(workbook, cache_dir), parsed):
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_changed_workbook_is_parsed_again(workbook, cache_dir):
+    _read_all(workbook, cache_dir)
+    first = _cached(cache_dir)
+
+    _write_workbook(workbook, scale=2.0)
+    expected = pd.read_excel(workbook, sheet_name=SHEET, skiprows=4, nrows=12, usecols='A:F')
+    with WorkbookSession(str(workbook), cache_dir=cache_dir) as session:
+        actual = session.read_sheet(SHEET, skiprows=4, nrows=12, usecols='A:F')
+    pd.testing.assert_frame_equal(actual, expected)
+    # The entry for the old workbook is gone
+    assert len(_cached(cache_dir)) == 1
+    assert _cached(cache_dir) != first
+
+
+def test_smaller_cached_slice_is_not_used_for_a_larger_one(workbook, cache_dir):
+    with WorkbookSession(str(workbook), cache_dir=cache_dir) as session:
+        session.read_sheet(SHEET, skiprows=4, nrows=5, usecols='A:C')
+    small = _cached(cache_dir)
+
+    expected = pd.read_excel(workbook, sheet_name=SHEET, skiprows=22, nrows=6, usecols='A:H')
+    with WorkbookSession(str(workbook), cache_dir=cache_dir) as session:
+        actual = session.read_sheet(SHEET, skiprows=22, nrows=6, usecols='A:H')
+    pd.testing.assert_frame_equal(actual, expected)
+    # The larger entry replaces the one it covers
+    assert len(_cached(cache_dir)) == 1
+    assert _cached(cache_dir) != small
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Extents each session parses the sheet to"""
+    seen = []
+    parse = WorkbookSession._parse_sheet
+
+    def record(self, sheet_name, extent, previous):
+        seen.append(extent)
+        return parse(self, sheet_name, extent, previous)
+
+    monkeypatch.setattr(WorkbookSession, '_parse_sheet', record)
+    return seen
+
+
+def test_reads_stop_at_the_last_row_needed(workbook, parses):
+    with WorkbookSession(str(workbook), use_cache=False) as session:
+        session.read_sheet(SHEET, skiprows=4, nrows=5, usecols='A:C')
+        assert len(session.sheets[SHEET]['rows']) == 10
+        assert session.sheets[SHEET]['stream'] is not None
+
+        # A longer slice continues the same stream
+        session.read_sheet(SHEET, skiprows=4, nrows=12, usecols='A:C')
+        assert len(session.sheets[SHEET]['rows']) == 17
+        assert parses == [(10, 3), (17, 3)]
+
+        # Asking past the end reads the rest of the sheet and closes the stream
+        session.read_sheet(SHEET, skiprows=22, nrows=50, usecols='A:C')
+        assert session.sheets[SHEET]['stream'] is None
+        assert session.sheets[SHEET]['extent'] == (None, 3)
+
+
+def test_planned_slices_are_parsed_in_one_pass(workbook, parses):
+    with WorkbookSession(str(workbook), use_cache=False) as session:
+        session.plan(SHEET, skiprows=4, nrows=12, usecols='A:F')
+        session.plan(SHEET, skiprows=22, nrows=6, usecols='A:H')
+        session.plan('Other', nrows=1)
+
+        first = session.read_sheet(SHEET, skiprows=4, nrows=12, usecols='A:F')
+        second = session.read_sheet(SHEET, skiprows=22, nrows=6, usecols='A:H')
+        # The plan bounds the parse: the rows after the second table are not read
+        assert parses == [(29, 8)]
+        assert len(session.sheets[SHEET]['rows']) == 29
+
+    pd.testing.assert_frame_equal(
+        first, pd.read_excel(workbook, sheet_name=SHEET, skiprows=4, nrows=12, usecols='A:F')
+    )
+    pd.testing.assert_frame_equal(
+        second, pd.read_excel(workbook, sheet_name=SHEET, skiprows=22, nrows=6, usecols='A:H')
+    )